@@ -21,9 +21,6 @@
 from dagster._core.storage.dagster_run import CANCELABLE_RUN_STATUSES
 from dagster._core.workspace.permissions import Permissions
 from dagster._utils.error import serializable_error_info_from_exc_info
-from starlette.concurrency import (
-    run_in_threadpool,  # can provide this indirectly if we dont want starlette dep in dagster-graphql
-)
 
 if TYPE_CHECKING:
     from dagster_graphql.schema.roots.mutation import (
@@ -244,7 +241,7 @@ async def gen_events_for_run(
     check.str_param(run_id, "run_id")
     after_cursor = check.opt_str_param(after_cursor, "after_cursor")
     instance = graphene_info.context.instance
-    record = instance.get_run_record_by_id(run_id)
+    record = await instance.get_run_record_by_id_async(run_id)
 
     if not record:
         yield GraphenePipelineRunLogsSubscriptionFailure(
@@ -265,9 +262,7 @@ async def gen_events_for_run(
     # load the existing events in chunks
     has_more = True
     while has_more:
-        # run the fetch in a thread since its sync
-        connection = await run_in_threadpool(
-            instance.get_records_for_run,
+        connection = await instance.get_records_for_run_async(
             run_id=run_id,
             cursor=after_cursor,
             limit=chunk_size,
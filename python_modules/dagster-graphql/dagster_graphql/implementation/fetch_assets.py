@@ -30,6 +30,7 @@
     MultiPartitionsSubset,
 )
 from dagster._core.definitions.partition import (
+    BitmapPartitionsSubset,
     CachingDynamicPartitionsLoader,
     DefaultPartitionsSubset,
     PartitionsDefinition,
@@ -487,7 +488,9 @@ def build_partition_statuses(
             failed_partitions_subset,
             in_progress_partitions_subset,
         )
-    elif isinstance(materialized_partitions_subset, DefaultPartitionsSubset):
+    elif isinstance(
+        materialized_partitions_subset, (DefaultPartitionsSubset, BitmapPartitionsSubset)
+    ):
         materialized_keys = materialized_partitions_subset.get_partition_keys()
         failed_keys = failed_partitions_subset.get_partition_keys()
         in_progress_keys = in_progress_partitions_subset.get_partition_keys()
@@ -38,7 +38,6 @@ def get_version() -> str:
         "graphene>=3",
         "gql[requests]>=3.0.0",
         "requests",
-        "starlette",  # used for run_in_threadpool utility fn
     ],
     entry_points={"console_scripts": ["dagster-graphql = dagster_graphql.cli:main"]},
 )
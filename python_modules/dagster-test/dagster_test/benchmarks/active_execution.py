@@ -0,0 +1,207 @@
+# ruff: noqa: T201
+
+import argparse
+from typing import List
+
+from dagster import DynamicOut, DynamicOutput, GraphDefinition, In, Nothing, job, op
+from dagster._core.definitions.dependency import (
+    DependencyDefinition,
+    MultiDependencyDefinition,
+    NodeInvocation,
+)
+from dagster._core.definitions.job_definition import JobDefinition
+from dagster._core.events import DagsterEvent, DagsterEventType
+from dagster._core.execution.api import create_execution_plan
+from dagster._core.execution.plan.objects import StepSuccessData
+from dagster._core.execution.plan.outputs import StepOutputData, StepOutputHandle
+from dagster._core.execution.plan.plan import ExecutionPlan
+from dagster._core.execution.plan.step import ExecutionStep
+from dagster._core.execution.retries import RetryMode
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Analyze execution time of the orchestration loop that drives an execution plan through
+`ActiveExecution`. No steps are actually executed: each step vended by the loop is immediately
+reported as having produced its outputs and succeeded, so the benchmark measures only the
+bookkeeping done by `ActiveExecution` between ticks.
+
+Two plan shapes are supported via the `--graph` arg:
+
+    static:  a layered graph of `--num-steps` ops, where every op in a layer depends on two ops in
+             the previous layer
+    dynamic: a single op fanning out `--num-steps` dynamic outputs, mapped over by a downstream op
+             and collected by a final op
+"""
+
+parser = argparse.ArgumentParser(
+    prog="active_execution",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-steps",
+    type=int,
+    default=10000,
+    help="Set the approximate number of steps in the execution plan. Defaults to 10000.",
+)
+
+parser.add_argument(
+    "--graph",
+    choices=["static", "dynamic"],
+    default="dynamic",
+    help="Set the shape of the execution plan. Defaults to `dynamic`.",
+)
+
+parser.add_argument(
+    "--max-concurrent",
+    type=int,
+    default=64,
+    help="Set the maximum number of steps in flight at once, as an executor would. Defaults to 64.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+def get_static_job(num_steps: int, layer_width: int = 100) -> JobDefinition:
+    @op(ins={"upstream": In(Nothing)})
+    def noop():
+        ...
+
+    dependencies = {}
+    for i in range(num_steps):
+        layer_start = (i // layer_width) * layer_width
+        if layer_start == 0:
+            upstream_names = []
+        else:
+            previous_layer_start = layer_start - layer_width
+            upstream_names = [
+                f"noop_{previous_layer_start + (i + offset) % layer_width}" for offset in (0, 1)
+            ]
+
+        dependencies[NodeInvocation(name="noop", alias=f"noop_{i}")] = {
+            "upstream": MultiDependencyDefinition(
+                [DependencyDefinition(upstream_name) for upstream_name in upstream_names]
+            )
+        }
+
+    return GraphDefinition(
+        name="static_graph", node_defs=[noop], dependencies=dependencies
+    ).to_job()
+
+
+def get_dynamic_job(num_steps: int) -> JobDefinition:
+    @op(out=DynamicOut())
+    def fan_out():
+        for i in range(num_steps):
+            yield DynamicOutput(i, mapping_key=str(i))
+
+    @op
+    def mapped(x):
+        return x
+
+    @op
+    def collect(xs):
+        return len(xs)
+
+    @job
+    def dynamic_job():
+        collect(fan_out().map(mapped).collect())
+
+    return dynamic_job
+
+
+# ########################
+# ##### EXECUTION LOOP
+# ########################
+
+
+def _complete_step(
+    job_name: str, step: ExecutionStep, num_mapping_keys: int
+) -> List[DagsterEvent]:
+    events = []
+    for step_output in step.step_outputs:
+        mapping_keys = (
+            [str(i) for i in range(num_mapping_keys)] if step_output.is_dynamic else [None]
+        )
+        for mapping_key in mapping_keys:
+            events.append(
+                DagsterEvent(
+                    DagsterEventType.STEP_OUTPUT.value,
+                    job_name=job_name,
+                    step_key=step.key,
+                    event_specific_data=StepOutputData(
+                        StepOutputHandle(step.key, step_output.name, mapping_key)
+                    ),
+                )
+            )
+    events.append(
+        DagsterEvent(
+            DagsterEventType.STEP_SUCCESS.value,
+            job_name=job_name,
+            step_key=step.key,
+            event_specific_data=StepSuccessData(duration_ms=0.0),
+        )
+    )
+    return events
+
+
+def drive_execution_plan(
+    job_name: str, execution_plan: ExecutionPlan, max_concurrent: int, num_mapping_keys: int
+) -> int:
+    num_executed = 0
+    with execution_plan.start(
+        RetryMode.DISABLED, max_concurrent=max_concurrent
+    ) as active_execution:
+        while not active_execution.is_complete:
+            steps = active_execution.get_steps_to_execute()
+            assert steps or active_execution.is_complete, "Execution plan stalled"
+            for step in steps:
+                for event in _complete_step(job_name, step, num_mapping_keys):
+                    active_execution.handle_event(event)
+                num_executed += 1
+
+            # as in the executors, process skips and abandons after handling step events, which
+            # also resolves any newly completed dynamic outputs
+            assert not active_execution.get_steps_to_skip()
+            assert not active_execution.get_steps_to_abandon()
+    return num_executed
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_steps: int, graph: str, max_concurrent: int) -> None:
+    session = ProfilingSession(
+        name="ActiveExecution orchestration loop",
+        experiment_settings={
+            "num_steps": num_steps,
+            "graph": graph,
+            "max_concurrent": max_concurrent,
+        },
+    ).start()
+
+    session.log_start_message()
+
+    with session.logged_execution_time("Build job definition"):
+        job_def = get_static_job(num_steps) if graph == "static" else get_dynamic_job(num_steps)
+
+    with session.logged_execution_time("Create execution plan"):
+        execution_plan = create_execution_plan(job_def)
+
+    with session.logged_execution_time("Drive execution plan to completion"):
+        num_executed = drive_execution_plan(
+            job_def.name, execution_plan, max_concurrent, num_mapping_keys=num_steps
+        )
+
+    print(f"Executed {num_executed} steps")
+    session.log_result_summary()
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_steps, args.graph, args.max_concurrent)
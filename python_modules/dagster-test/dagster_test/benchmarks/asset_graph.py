@@ -0,0 +1,207 @@
+# ruff: noqa: T201
+
+import argparse
+import random
+from typing import Callable, Dict, List, Set, TypeVar
+
+from dagster import AssetKey
+from dagster._core.definitions.asset_graph import AssetGraph
+from dagster._core.definitions.asset_selection import AssetSelection
+from dagster._core.selector.subset_selector import (
+    DependencyGraph,
+    fetch_connected,
+    fetch_sinks,
+    fetch_sources,
+)
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+T = TypeVar("T")
+
+DESC = """
+Compare the cost of asset graph traversals answered by walking the dict-of-sets dependency graph
+with the same traversals answered by the integer-indexed `AssetGraphIndex`.
+
+The benchmark builds a synthetic layered asset graph of `--num-assets` assets, where each asset
+depends on `--num-parents` randomly chosen assets from the two previous layers, then resolves
+upstream, downstream, sink and root selections and ancestor queries over a random sample of
+`--num-selected` assets, first with the dict-based traversal helpers and then with the index.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="asset_graph",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-assets",
+    type=int,
+    default=50000,
+    help="Set the number of assets in the graph. Defaults to 50000.",
+)
+
+parser.add_argument(
+    "--layer-width",
+    type=int,
+    default=500,
+    help="Set the number of assets in each layer of the graph. Defaults to 500.",
+)
+
+parser.add_argument(
+    "--num-parents",
+    type=int,
+    default=3,
+    help="Set the number of parents of each asset outside the first layer. Defaults to 3.",
+)
+
+parser.add_argument(
+    "--num-selected",
+    type=int,
+    default=200,
+    help="Set the number of assets in the selections that are resolved. Defaults to 200.",
+)
+
+parser.add_argument(
+    "--seed",
+    type=int,
+    default=0,
+    help="Set the random seed used to generate the graph. Defaults to 0.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+def get_asset_dep_graph(
+    num_assets: int, layer_width: int, num_parents: int, rng: random.Random
+) -> DependencyGraph[AssetKey]:
+    keys = [AssetKey(f"asset_{i}") for i in range(num_assets)]
+    upstream: Dict[AssetKey, Set[AssetKey]] = {key: set() for key in keys}
+    downstream: Dict[AssetKey, Set[AssetKey]] = {key: set() for key in keys}
+    for i in range(layer_width, num_assets):
+        layer_start = (i // layer_width) * layer_width
+        candidates = range(max(0, layer_start - 2 * layer_width), layer_start)
+        for parent in rng.sample(candidates, min(num_parents, len(candidates))):
+            upstream[keys[i]].add(keys[parent])
+            downstream[keys[parent]].add(keys[i])
+    return {"upstream": upstream, "downstream": downstream}
+
+
+def get_asset_graph(asset_dep_graph: DependencyGraph[AssetKey]) -> AssetGraph:
+    keys = asset_dep_graph["upstream"].keys()
+    return AssetGraph(
+        asset_dep_graph=asset_dep_graph,
+        source_asset_keys=set(),
+        partitions_defs_by_key={key: None for key in keys},
+        partition_mappings_by_key={key: None for key in keys},
+        group_names_by_key={key: None for key in keys},
+        freshness_policies_by_key={key: None for key in keys},
+        auto_materialize_policies_by_key={key: None for key in keys},
+        backfill_policies_by_key={key: None for key in keys},
+        code_versions_by_key={key: None for key in keys},
+        is_observable_by_key={key: False for key in keys},
+        auto_observe_interval_minutes_by_key={key: None for key in keys},
+        required_assets_and_checks_by_key={},
+    )
+
+
+def _union_connected(
+    asset_dep_graph: DependencyGraph[AssetKey], keys: List[AssetKey], direction
+) -> Set[AssetKey]:
+    result = set(keys)
+    for key in keys:
+        result |= fetch_connected(key, asset_dep_graph, direction=direction)
+    return result
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_assets: int, layer_width: int, num_parents: int, num_selected: int, seed: int) -> None:
+    session = ProfilingSession(
+        name="AssetGraph traversals",
+        experiment_settings={
+            "num_assets": num_assets,
+            "layer_width": layer_width,
+            "num_parents": num_parents,
+            "num_selected": num_selected,
+        },
+    ).start()
+
+    session.log_start_message()
+
+    rng = random.Random(seed)
+
+    with session.logged_execution_time("Build asset graph"):
+        asset_dep_graph = get_asset_dep_graph(num_assets, layer_width, num_parents, rng)
+        asset_graph = get_asset_graph(asset_dep_graph)
+
+    all_keys = list(asset_dep_graph["upstream"].keys())
+    roots = all_keys[: min(num_selected, layer_width)]
+    selected = rng.sample(all_keys, min(num_selected, num_assets))
+
+    results: Dict[str, List[Set[AssetKey]]] = {}
+
+    def _run(name: str, fn: Callable[[], T]) -> T:
+        with session.logged_execution_time(name):
+            result = fn()
+        results.setdefault(name.split(" (")[0], []).append(result)  # type: ignore
+        return result
+
+    _run(
+        "Downstream of roots (dict)",
+        lambda: _union_connected(asset_dep_graph, roots, "downstream"),
+    )
+    _run(
+        "Upstream of selection (dict)",
+        lambda: _union_connected(asset_dep_graph, selected, "upstream"),
+    )
+    _run("Sinks of selection (dict)", lambda: set(fetch_sinks(asset_dep_graph, set(selected))))
+    _run("Roots of selection (dict)", lambda: set(fetch_sources(asset_dep_graph, set(selected))))
+    _run(
+        "Ancestors of selection (dict)",
+        lambda: [fetch_connected(key, asset_dep_graph, direction="upstream") for key in selected],
+    )
+
+    _run("Build index (index)", asset_graph.get_index)
+    _run(
+        "Downstream of roots (index)",
+        lambda: AssetSelection.keys(*roots).downstream().resolve(asset_graph),
+    )
+    _run(
+        "Upstream of selection (index)",
+        lambda: AssetSelection.keys(*selected).upstream().resolve(asset_graph),
+    )
+    _run(
+        "Sinks of selection (index)",
+        lambda: AssetSelection.keys(*selected).sinks().resolve(asset_graph),
+    )
+    _run(
+        "Roots of selection (index)",
+        lambda: AssetSelection.keys(*selected).roots().resolve(asset_graph),
+    )
+    _run(
+        "Ancestors of selection (index)",
+        lambda: [asset_graph.get_ancestors(key) for key in selected],
+    )
+    _run(
+        "Ancestors of selection (index, cached)",
+        lambda: [asset_graph.get_ancestors(key) for key in selected],
+    )
+
+    for name, (dict_result, *index_results) in results.items():
+        if name.startswith("Build") or not index_results:
+            continue
+        assert all(
+            index_result == dict_result for index_result in index_results
+        ), f"Mismatched results for {name}"
+
+    session.log_result_summary()
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_assets, args.layer_width, args.num_parents, args.num_selected, args.seed)
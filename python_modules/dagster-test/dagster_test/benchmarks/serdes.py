@@ -0,0 +1,174 @@
+# ruff: noqa: T201
+
+import argparse
+from typing import Callable, Sequence, Tuple
+
+from dagster import (
+    AssetKey,
+    AssetMaterialization,
+    In,
+    MetadataValue,
+    Nothing,
+    job,
+    op,
+)
+from dagster._core.events import DagsterEvent, DagsterEventType, StepMaterializationData
+from dagster._core.events.log import EventLogEntry
+from dagster._core.snap import JobSnapshot
+from dagster._core.storage.dagster_run import DagsterRun, DagsterRunStatus
+from dagster._serdes import deserialize_value, serialize_value
+from dagster._serdes.serdes import PackableValue
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Analyze execution time of `serialize_value` and `deserialize_value` on the kinds of payloads the
+webserver and daemons load in bulk: event log entries, run records and job snapshots.
+
+Every payload is round-tripped before it is timed, and the benchmark fails if deserializing and
+re-serializing a payload does not reproduce the original serialized string byte for byte (snapshot
+ids are hashes of these strings, so any change to the serialized form would change them).
+
+The number of payloads and the size of the job snapshot are configurable via `--num-objects` and
+`--num-ops`. Each step is repeated `--num-repeats` times.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="serdes",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-objects",
+    type=int,
+    default=10000,
+    help="Set the number of event log entries and runs to serialize. Defaults to 10000.",
+)
+
+parser.add_argument(
+    "--num-ops",
+    type=int,
+    default=2000,
+    help="Set the number of ops in the serialized job snapshot. Defaults to 2000.",
+)
+
+parser.add_argument(
+    "--num-repeats",
+    type=int,
+    default=3,
+    help="Set the number of times each step is repeated. Defaults to 3.",
+)
+
+# ########################
+# ##### PAYLOADS
+# ########################
+
+
+def get_event_log_entries(num_objects: int) -> Sequence[EventLogEntry]:
+    return [
+        EventLogEntry(
+            error_info=None,
+            level="debug",
+            user_message="",
+            run_id="0ebc2fba-1d6c-4a6e-8f3f-1d4b1b3a9c2e",
+            timestamp=1700000000.0 + i,
+            step_key="my_step",
+            job_name="my_job",
+            dagster_event=DagsterEvent(
+                DagsterEventType.ASSET_MATERIALIZATION.value,
+                "my_job",
+                event_specific_data=StepMaterializationData(
+                    AssetMaterialization(
+                        asset_key=AssetKey(["prefix", f"asset_{i}"]),
+                        partition=str(i),
+                        metadata={
+                            "num_rows": i,
+                            "path": MetadataValue.path(f"/tmp/asset_{i}"),
+                            "description": MetadataValue.text("some text"),
+                        },
+                    )
+                ),
+            ),
+        )
+        for i in range(num_objects)
+    ]
+
+
+def get_runs(num_objects: int) -> Sequence[DagsterRun]:
+    return [
+        DagsterRun(
+            job_name="my_job",
+            run_id=f"{i:08d}-1d6c-4a6e-8f3f-1d4b1b3a9c2e",
+            run_config={"ops": {"my_op": {"config": {"value": i}}}},
+            status=DagsterRunStatus.SUCCESS,
+            tags={"dagster/partition": str(i), "team": "data"},
+        )
+        for i in range(num_objects)
+    ]
+
+
+def get_job_snapshot(num_ops: int) -> JobSnapshot:
+    @op(ins={"start": In(Nothing)})
+    def my_op() -> int:
+        return 1
+
+    @job
+    def my_job():
+        previous = []
+        for i in range(num_ops):
+            # each op depends on the previous layer of 10 ops
+            result = my_op(start=previous[-10:]) if i >= 10 else my_op()
+            previous.append(result)
+
+    return JobSnapshot.from_job_def(my_job)
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_objects: int, num_ops: int, num_repeats: int) -> None:
+    session = ProfilingSession(
+        name="Serdes round trip",
+        experiment_settings={
+            "num_objects": num_objects,
+            "num_ops": num_ops,
+            "num_repeats": num_repeats,
+        },
+    ).start()
+
+    session.log_start_message()
+
+    payloads: Sequence[Tuple[str, Callable[[], Sequence[PackableValue]]]] = [
+        ("event log entries", lambda: get_event_log_entries(num_objects)),
+        ("runs", lambda: get_runs(num_objects)),
+        ("job snapshot", lambda: [get_job_snapshot(num_ops)]),
+    ]
+
+    for name, get_values in payloads:
+        with session.logged_execution_time(f"Build and validate round trip of {name}"):
+            values = get_values()
+            serialized_values = [serialize_value(value) for value in values]
+            for value, serialized_value in zip(values, serialized_values):
+                round_tripped = deserialize_value(serialized_value)
+                assert round_tripped == value, f"{name} did not round trip"
+                assert (
+                    serialize_value(round_tripped) == serialized_value
+                ), f"{name} did not serialize to the same string after a round trip"
+
+        for _ in range(num_repeats):
+            with session.logged_execution_time(f"Serialize {len(values)} {name}"):
+                for value in values:
+                    serialize_value(value)
+
+            with session.logged_execution_time(f"Deserialize {len(values)} {name}"):
+                for serialized_value in serialized_values:
+                    deserialize_value(serialized_value)
+
+    session.log_result_summary()
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_objects, args.num_ops, args.num_repeats)
@@ -0,0 +1,135 @@
+# ruff: noqa: T201
+
+import argparse
+from typing import Any, Dict
+from unittest import mock
+
+import dagster._core.definitions.time_window_partitions as time_window_partitions_module
+import pendulum
+from dagster import TimeWindowPartitionsDefinition
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Compare the cost of computing partition keys and time windows for a TimeWindowPartitionsDefinition
+in closed form from the tick indices of its cron schedule, with the cost of computing them by
+iterating over the cron schedule.
+
+The benchmark builds a partitions definition with the given `--cron-schedule` that starts
+`--num-years` years before the current time, then lists and counts its partitions, resolves the
+time windows of a sample of its partition keys and maps timestamps to partition keys, first with
+the closed-form implementation and then by iterating over the schedule.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="time_window_partitions",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--cron-schedule",
+    type=str,
+    default="0 * * * *",
+    help="Set the cron schedule of the partitions definition. Defaults to hourly.",
+)
+
+parser.add_argument(
+    "--num-years",
+    type=int,
+    default=3,
+    help="Set the number of years of partitions. Defaults to 3.",
+)
+
+parser.add_argument(
+    "--num-sampled",
+    type=int,
+    default=1000,
+    help="Set the number of partition keys and timestamps that are resolved. Defaults to 1000.",
+)
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def _clear_caches() -> None:
+    TimeWindowPartitionsDefinition._time_window_for_partition_key.cache_clear()  # noqa: SLF001
+    TimeWindowPartitionsDefinition._get_first_partition_window.cache_clear()  # noqa: SLF001
+    TimeWindowPartitionsDefinition._get_last_partition_window.cache_clear()  # noqa: SLF001
+    TimeWindowPartitionsDefinition.time_windows_for_partition_keys.cache_clear()
+    TimeWindowPartitionsDefinition.get_partition_keys_in_time_window.cache_clear()
+
+
+def run_partition_operations(
+    session: ProfilingSession,
+    partitions_def: TimeWindowPartitionsDefinition,
+    current_time: pendulum.DateTime,
+    num_sampled: int,
+    label: str,
+) -> Dict[str, Any]:
+    _clear_caches()
+    results: Dict[str, Any] = {}
+
+    with session.logged_execution_time(f"Get partition keys ({label})"):
+        partition_keys = partitions_def.get_partition_keys(current_time=current_time)
+    results["partition_keys"] = partition_keys
+
+    with session.logged_execution_time(f"Get number of partitions ({label})"):
+        results["num_partitions"] = partitions_def.get_num_partitions(current_time=current_time)
+
+    step = max(len(partition_keys) // num_sampled, 1)
+    sampled_keys = frozenset(partition_keys[::step])
+    with session.logged_execution_time(f"Get time windows for partition keys ({label})"):
+        results["time_windows"] = partitions_def.time_windows_for_partition_keys(
+            sampled_keys, validate=False
+        )
+
+    start_timestamp = partitions_def.start.timestamp()
+    timestamp_step = (current_time.timestamp() - start_timestamp) / num_sampled
+    with session.logged_execution_time(f"Get partition keys for timestamps ({label})"):
+        results["keys_for_timestamps"] = [
+            partitions_def.get_partition_key_for_timestamp(start_timestamp + i * timestamp_step)
+            for i in range(num_sampled)
+        ]
+
+    return results
+
+
+def main(cron_schedule: str, num_years: int, num_sampled: int) -> None:
+    session = ProfilingSession(
+        name="TimeWindowPartitionsDefinition key and time window math",
+        experiment_settings={
+            "cron_schedule": cron_schedule,
+            "num_years": num_years,
+            "num_sampled": num_sampled,
+        },
+    ).start()
+
+    session.log_start_message()
+
+    current_time = pendulum.now("UTC")
+    partitions_def = TimeWindowPartitionsDefinition(
+        start=current_time.subtract(years=num_years),
+        cron_schedule=cron_schedule,
+        fmt="%Y-%m-%d-%H:%M",
+    )
+
+    closed_form_results = run_partition_operations(
+        session, partitions_def, current_time, num_sampled, "closed form"
+    )
+
+    with mock.patch.object(
+        time_window_partitions_module, "get_regular_cron_schedule", return_value=None
+    ):
+        iteration_results = run_partition_operations(
+            session, partitions_def, current_time, num_sampled, "iteration"
+        )
+
+    assert closed_form_results == iteration_results, "Closed-form and iterated results differ"
+    print(f"Partitions definition has {closed_form_results['num_partitions']} partitions")
+    session.log_result_summary()
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.cron_schedule, args.num_years, args.num_sampled)
@@ -1,4 +1,5 @@
-from typing import TYPE_CHECKING, Mapping
+import itertools
+from typing import TYPE_CHECKING, Any, Iterator, Mapping, Optional, Tuple, Union
 
 import dagster._check as check
 from dagster._core.errors import DagsterUserCodeProcessError
@@ -17,32 +18,80 @@ def sync_get_streaming_external_repositories_data_grpc(
     api_client: "DagsterGrpcClient", code_location: "CodeLocation"
 ) -> Mapping[str, ExternalRepositoryData]:
     from dagster._core.host_representation import CodeLocation, ExternalRepositoryOrigin
+    from dagster._grpc.snapshot_cache import get_repository_snapshot_cache
+    from dagster._grpc.snapshot_streaming import get_supported_compression_codecs
 
     check.inst_param(code_location, "code_location", CodeLocation)
 
+    snapshot_cache = get_repository_snapshot_cache()
+
     repo_datas = {}
     for repository_name in code_location.repository_names:  # type: ignore
-        external_repository_chunks = list(
-            api_client.streaming_external_repository(
-                external_repository_origin=ExternalRepositoryOrigin(
-                    code_location.origin,
-                    repository_name,
-                )
-            )
+        external_repository_origin = ExternalRepositoryOrigin(
+            code_location.origin,
+            repository_name,
+        )
+
+        # skip fetching the snapshot if it hasn't changed since it was last fetched
+        snapshot_hash_reply = api_client.get_repository_snapshot_hash(external_repository_origin)
+        if snapshot_hash_reply and snapshot_hash_reply.snapshot_hash:
+            cached_repository_data = snapshot_cache.get(snapshot_hash_reply.snapshot_hash)
+            if cached_repository_data:
+                repo_datas[repository_name] = cached_repository_data
+                continue
+
+        external_repository_chunks = api_client.streaming_external_repository(
+            external_repository_origin=external_repository_origin,
+            stream_snapshot_parts=True,
+            accepted_compression_codecs=get_supported_compression_codecs(),
         )
 
+        result, snapshot_hash = _deserialize_external_repository_chunks(external_repository_chunks)
+
+        if isinstance(result, ExternalRepositoryErrorData):
+            raise DagsterUserCodeProcessError.from_error_info(result.error)
+
+        if snapshot_hash:
+            snapshot_cache.set(snapshot_hash, result)
+
+        repo_datas[repository_name] = result
+    return repo_datas
+
+
+def _deserialize_external_repository_chunks(
+    external_repository_chunks: Iterator[Mapping[str, Any]],
+) -> Tuple[Union[ExternalRepositoryData, ExternalRepositoryErrorData], Optional[str]]:
+    """Returns the repository data along with its snapshot hash, if the server reported one."""
+    from dagster._grpc.snapshot_streaming import (
+        build_repository_data_from_parts,
+        decode_repository_data_parts,
+    )
+
+    first_chunk = next(external_repository_chunks, None)
+    if first_chunk is None or not first_chunk.get("snapshot_parts_chunk"):
+        # servers that don't support streaming snapshot parts send the serialized snapshot as a
+        # single string, split into chunks
         result = deserialize_value(
             "".join(
                 [
                     chunk["serialized_external_repository_chunk"]
-                    for chunk in external_repository_chunks
+                    for chunk in itertools.chain(
+                        [first_chunk] if first_chunk else [], external_repository_chunks
+                    )
                 ]
             ),
             (ExternalRepositoryData, ExternalRepositoryErrorData),
         )
+        return result, None
 
-        if isinstance(result, ExternalRepositoryErrorData):
-            raise DagsterUserCodeProcessError.from_error_info(result.error)
-
-        repo_datas[repository_name] = result
-    return repo_datas
+    # deserialize each part of the snapshot as soon as it is received
+    result = build_repository_data_from_parts(
+        decode_repository_data_parts(
+            (
+                chunk["snapshot_parts_chunk"]
+                for chunk in itertools.chain([first_chunk], external_repository_chunks)
+            ),
+            compression_codec=first_chunk.get("compression_codec") or None,
+        )
+    )
+    return result, first_chunk.get("snapshot_hash") or None
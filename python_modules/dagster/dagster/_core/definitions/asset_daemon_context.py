@@ -3,7 +3,9 @@
 import itertools
 import logging
 import os
+import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
     TYPE_CHECKING,
     AbstractSet,
@@ -11,6 +13,7 @@
     Dict,
     FrozenSet,
     Iterable,
+    Iterator,
     List,
     Mapping,
     Optional,
@@ -38,8 +41,10 @@
 from .asset_graph import AssetGraph
 from .auto_materialize_rule import (
     AutoMaterializeAssetEvaluation,
+    AutoMaterializeAssetEvaluationTiming,
     AutoMaterializeRule,
     AutoMaterializeRuleEvaluation,
+    AutoMaterializeRuleSnapshot,
     DiscardOnMaxMaterializationsExceededRule,
     RuleEvaluationContext,
 )
@@ -52,7 +57,10 @@
 
 if TYPE_CHECKING:
     from dagster._core.instance import DagsterInstance
-    from dagster._utils.caching_instance_queryer import CachingInstanceQueryer  # expensive import
+    from dagster._utils.caching_instance_queryer import (  # expensive import
+        CachingInstanceQueryer,
+        SharedQueryerCache,
+    )
 
 
 def get_implicit_auto_materialize_policy(
@@ -98,11 +106,17 @@ def __init__(
         respect_materialization_data_versions: bool,
         logger: logging.Logger,
         evaluation_time: Optional[datetime.datetime] = None,
+        shared_queryer_cache: Optional["SharedQueryerCache"] = None,
+        evaluation_executor: Optional[ThreadPoolExecutor] = None,
     ):
         from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
 
         self._instance_queryer = CachingInstanceQueryer(
-            instance, asset_graph, evaluation_time=evaluation_time, logger=logger
+            instance,
+            asset_graph,
+            evaluation_time=evaluation_time,
+            logger=logger,
+            shared_cache=shared_queryer_cache,
         )
         self._data_time_resolver = CachingDataTimeResolver(self.instance_queryer)
         self._cursor = cursor
@@ -116,6 +130,8 @@ def __init__(
         self._auto_observe = auto_observe
         self._respect_materialization_data_versions = respect_materialization_data_versions
         self._logger = logger
+        # if set, independent parts of the asset graph are evaluated in parallel on this executor
+        self._evaluation_executor = evaluation_executor
 
         # fetch some data in advance to batch some queries
         self.instance_queryer.prefetch_asset_records(
@@ -314,10 +330,13 @@ def evaluate_asset(
             - The set of AssetKeyPartitionKeys that should be materialized.
             - The set of AssetKeyPartitionKeys that should be discarded.
         """
+        start_time = time.perf_counter()
         auto_materialize_policy = check.not_none(
             self.asset_graph.auto_materialize_policies_by_key.get(asset_key)
         )
 
+        # the time spent evaluating each rule
+        rule_duration_seconds: List[Tuple[AutoMaterializeRuleSnapshot, float]] = []
         # the results of evaluating individual rules
         all_results: List[
             Tuple[AutoMaterializeRuleEvaluation, AbstractSet[AssetKeyPartitionKey]]
@@ -339,6 +358,7 @@ def evaluate_asset(
         )
 
         for materialize_rule in auto_materialize_policy.materialize_rules:
+            rule_start_time = time.perf_counter()
             rule_snapshot = materialize_rule.to_snapshot()
 
             self._verbose_log_fn(f"Evaluating materialize rule: {rule_snapshot}")
@@ -355,11 +375,13 @@ def evaluate_asset(
                 )
                 self._verbose_log_fn(f"Rule returned {len(asset_partitions)} partitions")
                 to_materialize.update(asset_partitions)
+            rule_duration_seconds.append((rule_snapshot, time.perf_counter() - rule_start_time))
             self._verbose_log_fn("Done evaluating materialize rule")
 
         skip_context = dataclasses.replace(materialize_context, candidates=to_materialize)
 
         for skip_rule in auto_materialize_policy.skip_rules:
+            rule_start_time = time.perf_counter()
             rule_snapshot = skip_rule.to_snapshot()
             self._verbose_log_fn(f"Evaluating skip rule: {rule_snapshot}")
             for evaluation_data, asset_partitions in skip_rule.evaluate_for_asset(skip_context):
@@ -373,11 +395,13 @@ def evaluate_asset(
                 )
                 self._verbose_log_fn(f"Rule returned {len(asset_partitions)} partitions")
                 to_skip.update(asset_partitions)
+            rule_duration_seconds.append((rule_snapshot, time.perf_counter() - rule_start_time))
             self._verbose_log_fn("Done evaluating skip rule")
         to_materialize.difference_update(to_skip)
 
         # this is treated separately from other rules, for now
         if auto_materialize_policy.max_materializations_per_minute is not None:
+            rule_start_time = time.perf_counter()
             rule = DiscardOnMaxMaterializationsExceededRule(
                 limit=auto_materialize_policy.max_materializations_per_minute
             )
@@ -398,6 +422,7 @@ def evaluate_asset(
                 )
                 self._verbose_log_fn(f"Discard rule returned {len(asset_partitions)} partitions")
                 to_discard.update(asset_partitions)
+            rule_duration_seconds.append((rule_snapshot, time.perf_counter() - rule_start_time))
             self._verbose_log_fn("Done evaluating discard rule")
 
         to_materialize.difference_update(to_discard)
@@ -412,20 +437,61 @@ def evaluate_asset(
                 num_skipped=len(to_skip),
                 num_discarded=len(to_discard),
                 dynamic_partitions_store=self.instance_queryer,
+                timing=AutoMaterializeAssetEvaluationTiming(
+                    duration_seconds=time.perf_counter() - start_time,
+                    rule_duration_seconds=rule_duration_seconds,
+                ),
             ),
             to_materialize,
             to_discard,
         )
 
-    def get_auto_materialize_asset_evaluations(
-        self,
+    def _get_evaluation_shards(self) -> Sequence[Sequence[AssetKey]]:
+        """Splits the target asset keys into shards that can be evaluated independently of each
+        other: the connected components of the asset graph, treating assets that must be
+        materialized together as connected. The keys within each shard are in topological order.
+        """
+        toposorted_asset_keys = list(itertools.chain(*self.asset_graph.toposort_asset_keys()))
+        component_parent_by_key: Dict[AssetKey, AssetKey] = {}
+
+        def _find(asset_key: AssetKey) -> AssetKey:
+            root = asset_key
+            while component_parent_by_key.get(root, root) != root:
+                root = component_parent_by_key[root]
+            # point every key on the path directly at the root, to keep later lookups short
+            while asset_key != root:
+                next_key = component_parent_by_key[asset_key]
+                component_parent_by_key[asset_key] = root
+                asset_key = next_key
+            return root
+
+        def _union(asset_key: AssetKey, other_asset_key: AssetKey) -> None:
+            root, other_root = _find(asset_key), _find(other_asset_key)
+            if root != other_root:
+                component_parent_by_key[other_root] = root
+
+        for asset_key in toposorted_asset_keys:
+            for parent_key in self.asset_graph.get_parents(asset_key):
+                _union(asset_key, parent_key)
+            if asset_key in self.target_asset_keys:
+                for neighbor_key in self.asset_graph.get_required_multi_asset_keys(asset_key):
+                    _union(asset_key, neighbor_key)
+
+        shards_by_root: Dict[AssetKey, List[AssetKey]] = {}
+        for asset_key in toposorted_asset_keys:
+            if asset_key in self.target_asset_keys:
+                shards_by_root.setdefault(_find(asset_key), []).append(asset_key)
+        return list(shards_by_root.values())
+
+    def _evaluate_shard(
+        self, asset_keys: Sequence[AssetKey], checked_asset_counter: Iterator[int]
     ) -> Tuple[
         Mapping[AssetKey, AutoMaterializeAssetEvaluation],
-        AbstractSet[AssetKeyPartitionKey],
+        Mapping[AssetKey, AbstractSet[AssetKeyPartitionKey]],
         AbstractSet[AssetKeyPartitionKey],
     ]:
-        """Returns a mapping from asset key to the AutoMaterializeAssetEvaluation for that key, as
-        well as sets of all asset partitions that should be materialized or discarded this tick.
+        """Evaluates the given asset keys, which must be in topological order and include all the
+        target asset keys upstream of them.
         """
         evaluations_by_key: Dict[AssetKey, AutoMaterializeAssetEvaluation] = {}
         will_materialize_mapping: Dict[AssetKey, AbstractSet[AssetKeyPartitionKey]] = defaultdict(
@@ -435,15 +501,10 @@ def get_auto_materialize_asset_evaluations(
         expected_data_time_mapping: Dict[AssetKey, Optional[datetime.datetime]] = defaultdict()
         visited_multi_asset_keys = set()
 
-        num_checked_assets = 0
         num_target_asset_keys = len(self.target_asset_keys)
 
-        for asset_key in itertools.chain(*self.asset_graph.toposort_asset_keys()):
-            # an asset may have already been visited if it was part of a non-subsettable multi-asset
-            if asset_key not in self.target_asset_keys:
-                continue
-
-            num_checked_assets = num_checked_assets + 1
+        for asset_key in asset_keys:
+            num_checked_assets = next(checked_asset_counter)
             self._verbose_log_fn(
                 "Evaluating asset"
                 f" {asset_key.to_user_string()} ({num_checked_assets}/{num_target_asset_keys})"
@@ -520,7 +581,49 @@ def get_auto_materialize_asset_evaluations(
                     expected_data_time_mapping[neighbor_key] = expected_data_time
                     visited_multi_asset_keys.add(neighbor_key)
 
-        to_materialize = set().union(*will_materialize_mapping.values())
+        return evaluations_by_key, will_materialize_mapping, to_discard
+
+    def get_auto_materialize_asset_evaluations(
+        self,
+    ) -> Tuple[
+        Mapping[AssetKey, AutoMaterializeAssetEvaluation],
+        AbstractSet[AssetKeyPartitionKey],
+        AbstractSet[AssetKeyPartitionKey],
+    ]:
+        """Returns a mapping from asset key to the AutoMaterializeAssetEvaluation for that key, as
+        well as sets of all asset partitions that should be materialized or discarded this tick.
+        """
+        shards = self._get_evaluation_shards()
+        checked_asset_counter = itertools.count(1)
+
+        if self._evaluation_executor is None or len(shards) <= 1:
+            shard_results = [self._evaluate_shard(shard, checked_asset_counter) for shard in shards]
+        else:
+            self._logger.info(f"Evaluating {len(shards)} independent groups of assets in parallel")
+            # compute the data shared by all shards up front, so that the shards don't race to
+            # compute it
+            self._get_never_handled_and_newly_handled_root_asset_partitions()
+            self._get_asset_partitions_with_newly_updated_parents_by_key_and_new_latest_storage_id()
+            # map returns the results in the order of the shards, so that they are merged
+            # deterministically
+            shard_results = list(
+                self._evaluation_executor.map(
+                    lambda shard: self._evaluate_shard(shard, checked_asset_counter), shards
+                )
+            )
+
+        evaluations_by_key: Dict[AssetKey, AutoMaterializeAssetEvaluation] = {}
+        to_materialize: Set[AssetKeyPartitionKey] = set()
+        to_discard: Set[AssetKeyPartitionKey] = set()
+        for (
+            shard_evaluations_by_key,
+            shard_will_materialize_mapping,
+            shard_to_discard,
+        ) in shard_results:
+            evaluations_by_key.update(shard_evaluations_by_key)
+            to_materialize.update(*shard_will_materialize_mapping.values())
+            to_discard.update(shard_to_discard)
+
         return (evaluations_by_key, to_materialize, to_discard)
 
     def evaluate(
@@ -151,7 +151,9 @@ def with_updates(
             )
 
         latest_evaluation_by_asset_key = {
-            evaluation.asset_key: evaluation for evaluation in evaluations
+            # timings are only useful on the stored evaluation records, so don't grow the cursor
+            evaluation.asset_key: evaluation._replace(timing=None)
+            for evaluation in evaluations
         }
 
         return AssetDaemonCursor(
@@ -28,13 +28,13 @@
 from dagster._core.instance import DynamicPartitionsStore
 from dagster._core.selector.subset_selector import (
     DependencyGraph,
-    fetch_sources,
     generate_asset_dep_graph,
 )
 from dagster._utils.cached_method import cached_method
 
 from .asset_check_spec import AssetCheckKey
 from .asset_checks import AssetChecksDefinition
+from .asset_graph_index import AssetGraphIndex
 from .assets import AssetsDefinition
 from .backfill_policy import BackfillPolicy
 from .events import AssetKey, AssetKeyPartitionKey
@@ -133,9 +133,7 @@ def root_materializable_or_observable_asset_keys(self) -> AbstractSet[AssetKey]:
         observable_keys = {
             key for key, is_observable in self._is_observable_by_key.items() if is_observable
         }
-        return fetch_sources(
-            self._asset_dep_graph, observable_keys | self.materializable_asset_keys
-        )
+        return self.get_index().get_sources(observable_keys | self.materializable_asset_keys)
 
     @property
     def freshness_policies_by_key(self) -> Mapping[AssetKey, Optional[FreshnessPolicy]]:
@@ -286,15 +284,26 @@ def get_parents(self, asset_key: AssetKey) -> AbstractSet[AssetKey]:
         """Returns all first-order dependencies of an asset."""
         return self._asset_dep_graph["upstream"].get(asset_key) or set()
 
+    @cached_method
+    def get_index(self) -> AssetGraphIndex:
+        """Returns an integer-indexed representation of the dependency structure of the graph,
+        used for traversals over many assets.
+        """
+        return AssetGraphIndex(
+            upstream=self._asset_dep_graph["upstream"],
+            downstream=self._asset_dep_graph["downstream"],
+        )
+
     def get_ancestors(
         self, asset_key: AssetKey, include_self: bool = False
     ) -> AbstractSet[AssetKey]:
         """Returns all nth-order dependencies of an asset."""
-        ancestors = {asset_key} if include_self else set()
-        parents = self.get_parents(asset_key) - {asset_key}  # remove self-dependencies
-        return ancestors.union(
-            *[self.get_ancestors(parent, include_self=True) for parent in parents]
-        )
+        ancestors = self.get_index().get_connected_keys([asset_key], "upstream")
+        # remove self-dependencies
+        ancestors.discard(asset_key)
+        if include_self:
+            ancestors.add(asset_key)
+        return ancestors
 
     def get_children_partitions(
         self,
@@ -570,7 +579,10 @@ def bfs_filter_subsets(
             len(initial_subset.asset_keys) == 1, "Multiple initial assets not yet supported"
         )
         initial_asset_key = next(iter(initial_subset.asset_keys))
-        queue = deque([initial_asset_key])
+        # visit assets in topological order, so that each asset is visited once the subsets
+        # queued by all of its visited parents have been combined
+        index = self.get_index()
+        queue = [(index.get_level(initial_asset_key), initial_asset_key)]
 
         queued_subsets_by_asset_key: Dict[AssetKey, Optional[PartitionsSubset]] = {
             initial_asset_key: (
@@ -582,7 +594,7 @@ def bfs_filter_subsets(
         result = AssetGraphSubset(self)
 
         while len(queue) > 0:
-            asset_key = queue.popleft()
+            _, asset_key = heappop(queue)
             partitions_subset = queued_subsets_by_asset_key.get(asset_key)
 
             if condition_fn(asset_key, partitions_subset):
@@ -626,7 +638,7 @@ def bfs_filter_subsets(
                         child_partitions_subset = None
 
                     if child not in all_assets:
-                        queue.append(child)
+                        heappush(queue, (index.get_level(child), child))
                         all_assets.add(child)
 
         return result
@@ -818,12 +830,7 @@ def __init__(
         self._asset_graph = asset_graph
         self._include_required_multi_assets = include_required_multi_assets
 
-        toposorted_asset_keys = asset_graph.toposort_asset_keys()
-        self._toposort_level_by_asset_key = {
-            asset_key: i
-            for i, asset_keys in enumerate(toposorted_asset_keys)
-            for asset_key in asset_keys
-        }
+        self._index = asset_graph.get_index()
         self._heap = [self._queue_item(asset_partition) for asset_partition in items]
         heapify(self._heap)
 
@@ -848,7 +855,7 @@ def _queue_item(
             required_multi_asset_keys = {asset_key}
 
         level = max(
-            self._toposort_level_by_asset_key[required_asset_key]
+            self._index.get_level(required_asset_key)
             for required_asset_key in required_multi_asset_keys
         )
 
@@ -0,0 +1,284 @@
+from array import array
+from collections import OrderedDict
+from itertools import compress
+from threading import Lock
+from typing import AbstractSet, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+from dagster._core.selector.subset_selector import Direction
+
+from .events import AssetKey
+
+# translate between bytearrays of 0/1 flags and the ascii digits of a binary number
+_FLAGS_TO_BINARY_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+_BINARY_DIGITS_TO_FLAGS = bytes.maketrans(b"01", b"\x00\x01")
+
+# number of transitive closures kept per direction
+DEFAULT_MAX_CACHED_CLOSURES = 2048
+
+
+def _build_csr(neighbors_by_index: Sequence[Iterable[int]]) -> Tuple["array[int]", "array[int]"]:
+    """Packs adjacency lists into compressed sparse row arrays: the neighbors of node i are
+    `indices[offsets[i]:offsets[i + 1]]`.
+    """
+    offsets = array("q", [0])
+    indices = array("q")
+    for neighbors in neighbors_by_index:
+        indices.extend(sorted(neighbors))
+        offsets.append(len(indices))
+    return offsets, indices
+
+
+class AssetGraphIndex:
+    """A compact, integer-indexed representation of the dependency structure of an AssetGraph.
+
+    Each asset key is assigned an index in topological order, and the parents and children of
+    every key are stored as compressed sparse row arrays. Sets of keys are represented as bitsets
+    (python ints, where bit i is set if key i is in the set), so that transitive closures can be
+    cached and combined cheaply.
+
+    The index is built once per AssetGraph, and is used to answer the traversal queries that
+    asset selections and the daemons make many times per request or tick.
+    """
+
+    def __init__(
+        self,
+        upstream: Mapping[AssetKey, AbstractSet[AssetKey]],
+        downstream: Mapping[AssetKey, AbstractSet[AssetKey]],
+        max_cached_closures: int = DEFAULT_MAX_CACHED_CLOSURES,
+    ):
+        all_keys: Set[AssetKey] = set(upstream.keys()) | set(downstream.keys())
+        for keys in upstream.values():
+            all_keys.update(keys)
+        for keys in downstream.values():
+            all_keys.update(keys)
+
+        unordered_keys = sorted(all_keys)
+        unordered_index_by_key = {key: i for i, key in enumerate(unordered_keys)}
+
+        # edges from either mapping constrain the topological order
+        parents_by_index: List[Set[int]] = [set() for _ in unordered_keys]
+        for key, parent_keys in upstream.items():
+            parents_by_index[unordered_index_by_key[key]].update(
+                unordered_index_by_key[parent_key] for parent_key in parent_keys
+            )
+        for key, child_keys in downstream.items():
+            for child_key in child_keys:
+                parents_by_index[unordered_index_by_key[child_key]].add(
+                    unordered_index_by_key[key]
+                )
+
+        levels, order = self._toposort(parents_by_index)
+
+        self._keys: Sequence[AssetKey] = [unordered_keys[i] for i in order]
+        self._index_by_key: Mapping[AssetKey, int] = {
+            key: i for i, key in enumerate(self._keys)
+        }
+        self._levels = array("q", [levels[i] for i in order])
+        self._num_levels = max(self._levels) + 1 if self._keys else 0
+
+        self._parent_offsets, self._parent_indices = _build_csr(
+            [
+                [self._index_by_key[parent_key] for parent_key in upstream.get(key, ())]
+                for key in self._keys
+            ]
+        )
+        self._child_offsets, self._child_indices = _build_csr(
+            [
+                [self._index_by_key[child_key] for child_key in downstream.get(key, ())]
+                for key in self._keys
+            ]
+        )
+
+        self._max_cached_closures = max_cached_closures
+        self._closures_lock = Lock()
+        self._closures_by_direction: Dict[Direction, "OrderedDict[int, int]"] = {
+            "upstream": OrderedDict(),
+            "downstream": OrderedDict(),
+        }
+
+    @staticmethod
+    def _toposort(parents_by_index: Sequence[AbstractSet[int]]) -> Tuple[List[int], List[int]]:
+        """Returns the topological level of each node, and the nodes ordered by level. Nodes on a
+        cycle (which a valid asset graph can't contain) are placed after all other nodes.
+        """
+        num_nodes = len(parents_by_index)
+        children_by_index: List[List[int]] = [[] for _ in range(num_nodes)]
+        num_unvisited_parents = [0] * num_nodes
+        for i, parents in enumerate(parents_by_index):
+            for parent in parents:
+                # self-dependencies don't constrain the order
+                if parent != i:
+                    children_by_index[parent].append(i)
+                    num_unvisited_parents[i] += 1
+
+        levels = [0] * num_nodes
+        order: List[int] = []
+        frontier = [i for i in range(num_nodes) if num_unvisited_parents[i] == 0]
+        level = 0
+        while frontier:
+            next_frontier = []
+            for i in frontier:
+                levels[i] = level
+                order.append(i)
+                for child in children_by_index[i]:
+                    num_unvisited_parents[child] -= 1
+                    if num_unvisited_parents[child] == 0:
+                        next_frontier.append(child)
+            frontier = next_frontier
+            level += 1
+
+        if len(order) < num_nodes:
+            visited = set(order)
+            for i in range(num_nodes):
+                if i not in visited:
+                    levels[i] = level
+                    order.append(i)
+
+        return levels, order
+
+    @property
+    def asset_keys(self) -> Sequence[AssetKey]:
+        """All asset keys in the index, in topological order."""
+        return self._keys
+
+    @property
+    def num_levels(self) -> int:
+        return self._num_levels
+
+    def get_level(self, asset_key: AssetKey) -> int:
+        """The topological level of the given asset key: 0 for keys with no parents, and otherwise
+        one more than the maximum level of its parents.
+        """
+        return self._levels[self._index_by_key[asset_key]]
+
+    def get_keys_by_level(self) -> Sequence[AbstractSet[AssetKey]]:
+        keys_by_level: List[Set[AssetKey]] = [set() for _ in range(self._num_levels)]
+        for key, level in zip(self._keys, self._levels):
+            keys_by_level[level].add(key)
+        return keys_by_level
+
+    def to_bits(self, asset_keys: Iterable[AssetKey]) -> int:
+        """Returns the bitset of the given asset keys, ignoring keys that are not in the index."""
+        return self._indices_to_bits(
+            self._index_by_key[key] for key in asset_keys if key in self._index_by_key
+        )
+
+    def to_keys(self, bits: int) -> Set[AssetKey]:
+        """Returns the asset keys in the given bitset."""
+        # the binary digits of the bitset, least significant first
+        flags = bin(bits)[:1:-1].encode("ascii").translate(_BINARY_DIGITS_TO_FLAGS)
+        return set(compress(self._keys, flags))
+
+    def _indices_to_bits(self, indices: Iterable[int]) -> int:
+        if not self._keys:
+            return 0
+        flags = bytearray(len(self._keys))
+        for i in indices:
+            flags[i] = 1
+        return int(flags.translate(_FLAGS_TO_BINARY_DIGITS)[::-1], 2)
+
+    def _get_csr(self, direction: Direction) -> Tuple["array[int]", "array[int]"]:
+        if direction == "upstream":
+            return self._parent_offsets, self._parent_indices
+        return self._child_offsets, self._child_indices
+
+    def _traverse(
+        self, start_indices: Iterable[int], direction: Direction, depth: Optional[int] = None
+    ) -> List[int]:
+        """Returns the indices of all nodes reachable from the start nodes in at most `depth` steps
+        in the given direction. Start nodes are only included if they are reachable from a start
+        node.
+        """
+        offsets, indices = self._get_csr(direction)
+        discovered = bytearray(len(self._keys))
+        result: List[int] = []
+        frontier = list(start_indices)
+        remaining_depth = depth
+        while frontier and (remaining_depth is None or remaining_depth > 0):
+            next_frontier = []
+            for i in frontier:
+                for neighbor in indices[offsets[i] : offsets[i + 1]]:
+                    if not discovered[neighbor]:
+                        discovered[neighbor] = 1
+                        next_frontier.append(neighbor)
+            result.extend(next_frontier)
+            frontier = next_frontier
+            if remaining_depth is not None:
+                remaining_depth -= 1
+        return result
+
+    def get_closure_bits(self, asset_key: AssetKey, direction: Direction) -> int:
+        """Returns the bitset of all keys upstream or downstream of the given key. The key itself
+        is only included if it depends on itself. Closures are cached.
+        """
+        index = self._index_by_key.get(asset_key)
+        if index is None:
+            return 0
+
+        closures = self._closures_by_direction[direction]
+        with self._closures_lock:
+            if index in closures:
+                closures.move_to_end(index)
+                return closures[index]
+
+        bits = self._indices_to_bits(self._traverse([index], direction))
+
+        with self._closures_lock:
+            closures[index] = bits
+            if len(closures) > self._max_cached_closures:
+                closures.popitem(last=False)
+        return bits
+
+    def get_connected_keys(
+        self,
+        asset_keys: Iterable[AssetKey],
+        direction: Direction,
+        depth: Optional[int] = None,
+    ) -> Set[AssetKey]:
+        """Returns all keys within `depth` steps upstream or downstream of any of the given keys.
+        The given keys are only included if they are upstream or downstream of one of the given
+        keys (or themselves).
+        """
+        start_indices = [self._index_by_key[key] for key in asset_keys if key in self._index_by_key]
+        if depth is None and len(start_indices) == 1:
+            return self.to_keys(self.get_closure_bits(self._keys[start_indices[0]], direction))
+        return {self._keys[i] for i in self._traverse(start_indices, direction, depth)}
+
+    def _get_keys_without_selected_neighbors(
+        self, within_selection: AbstractSet[AssetKey], direction: Direction
+    ) -> Set[AssetKey]:
+        """Returns the keys in the selection which have no keys of the selection upstream or
+        downstream of them, other than themselves.
+        """
+        offsets, indices = self._get_csr(direction)
+        selected_indices = [
+            self._index_by_key[key] for key in within_selection if key in self._index_by_key
+        ]
+        is_selected = bytearray(len(self._keys))
+        for i in selected_indices:
+            is_selected[i] = 1
+
+        # visit every node that may lead to a selected node, furthest first, so that we know
+        # whether each node's neighbors reach the selection before visiting the node itself
+        relevant = set(selected_indices).union(self._traverse(selected_indices, direction))
+        reaches_selection = bytearray(len(self._keys))
+        for i in sorted(
+            relevant, key=self._levels.__getitem__, reverse=(direction == "downstream")
+        ):
+            for neighbor in indices[offsets[i] : offsets[i + 1]]:
+                if neighbor != i and (is_selected[neighbor] or reaches_selection[neighbor]):
+                    reaches_selection[i] = 1
+                    break
+
+        # keys that are not in the index have no neighbors
+        return {key for key in within_selection if key not in self._index_by_key} | {
+            self._keys[i] for i in selected_indices if not reaches_selection[i]
+        }
+
+    def get_sinks(self, within_selection: AbstractSet[AssetKey]) -> Set[AssetKey]:
+        """Returns the keys in the selection that have no downstream keys within the selection."""
+        return self._get_keys_without_selected_neighbors(within_selection, "downstream")
+
+    def get_sources(self, within_selection: AbstractSet[AssetKey]) -> Set[AssetKey]:
+        """Returns the keys in the selection that have no upstream keys within the selection."""
+        return self._get_keys_without_selected_neighbors(within_selection, "upstream")
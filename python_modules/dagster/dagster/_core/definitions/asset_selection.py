@@ -10,12 +10,7 @@
 from dagster._annotations import deprecated, public
 from dagster._core.definitions.asset_checks import AssetChecksDefinition
 from dagster._core.errors import DagsterInvalidSubsetError
-from dagster._core.selector.subset_selector import (
-    fetch_connected,
-    fetch_sinks,
-    fetch_sources,
-    parse_clause,
-)
+from dagster._core.selector.subset_selector import parse_clause
 
 from .asset_check_spec import AssetCheckKey
 from .asset_graph import AssetGraph, InternalAssetGraph
@@ -451,7 +446,7 @@ def __init__(self, child: AssetSelection):
 
     def resolve_inner(self, asset_graph: AssetGraph) -> AbstractSet[AssetKey]:
         selection = self._child.resolve_inner(asset_graph)
-        return fetch_sinks(asset_graph.asset_dep_graph, selection)
+        return asset_graph.get_index().get_sinks(selection)
 
 
 class RequiredNeighborsAssetSelection(AssetSelection):
@@ -472,7 +467,7 @@ def __init__(self, child: AssetSelection):
 
     def resolve_inner(self, asset_graph: AssetGraph) -> AbstractSet[AssetKey]:
         selection = self._child.resolve_inner(asset_graph)
-        return fetch_sources(asset_graph.asset_dep_graph, selection)
+        return asset_graph.get_index().get_sources(selection)
 
 
 class DownstreamAssetSelection(AssetSelection):
@@ -490,18 +485,9 @@ def __init__(
     def resolve_inner(self, asset_graph: AssetGraph) -> AbstractSet[AssetKey]:
         selection = self._child.resolve_inner(asset_graph)
         return operator.sub(
-            reduce(
-                operator.or_,
-                [
-                    {asset_key}
-                    | fetch_connected(
-                        item=asset_key,
-                        graph=asset_graph.asset_dep_graph,
-                        direction="downstream",
-                        depth=self.depth,
-                    )
-                    for asset_key in selection
-                ],
+            selection
+            | asset_graph.get_index().get_connected_keys(
+                selection, direction="downstream", depth=self.depth
             ),
             selection if not self.include_self else set(),
         )
@@ -578,20 +564,8 @@ def _fetch_all_upstream(
     include_self: bool = True,
 ) -> AbstractSet[AssetKey]:
     return operator.sub(
-        reduce(
-            operator.or_,
-            [
-                {asset_key}
-                | fetch_connected(
-                    item=asset_key,
-                    graph=asset_graph.asset_dep_graph,
-                    direction="upstream",
-                    depth=depth,
-                )
-                for asset_key in selection
-            ],
-            set(),
-        ),
+        selection
+        | asset_graph.get_index().get_connected_keys(selection, direction="upstream", depth=depth),
         selection if not include_self else set(),
     )
 
@@ -880,6 +880,21 @@ def evaluate_for_asset(self, context: RuleEvaluationContext) -> RuleEvaluationRe
         return []
 
 
+@whitelist_for_serdes
+class AutoMaterializeAssetEvaluationTiming(NamedTuple):
+    """Wall-clock time spent by the asset daemon evaluating the auto-materialize policy of a single
+    asset on a given tick.
+
+    Properties:
+        duration_seconds (float): The total time spent evaluating the asset.
+        rule_duration_seconds (Sequence[Tuple[AutoMaterializeRuleSnapshot, float]]): The time spent
+            evaluating each of the rules on the asset's policy, in the order they were evaluated.
+    """
+
+    duration_seconds: float
+    rule_duration_seconds: Sequence[Tuple[AutoMaterializeRuleSnapshot, float]]
+
+
 @whitelist_for_serdes
 class AutoMaterializeAssetEvaluation(NamedTuple):
     """Represents the results of the auto-materialize logic for a single asset.
@@ -897,6 +912,7 @@ class AutoMaterializeAssetEvaluation(NamedTuple):
         run_ids (Set[str]): The set of run IDs created for this evaluation
         rule_snapshots (Optional[Sequence[AutoMaterializeRuleSnapshot]]): The snapshots of the
             rules on the policy at the time it was evaluated.
+        timing (Optional[AutoMaterializeAssetEvaluationTiming]): How long the evaluation took.
     """
 
     asset_key: AssetKey
@@ -908,6 +924,7 @@ class AutoMaterializeAssetEvaluation(NamedTuple):
     num_discarded: int
     run_ids: Set[str] = set()
     rule_snapshots: Optional[Sequence[AutoMaterializeRuleSnapshot]] = None
+    timing: Optional[AutoMaterializeAssetEvaluationTiming] = None
 
     @staticmethod
     def from_rule_evaluation_results(
@@ -920,6 +937,7 @@ def from_rule_evaluation_results(
         num_skipped: int,
         num_discarded: int,
         dynamic_partitions_store: "DynamicPartitionsStore",
+        timing: Optional[AutoMaterializeAssetEvaluationTiming] = None,
     ) -> "AutoMaterializeAssetEvaluation":
         auto_materialize_policy = asset_graph.auto_materialize_policies_by_key.get(asset_key)
 
@@ -938,6 +956,7 @@ def from_rule_evaluation_results(
                 num_skipped=num_skipped,
                 num_discarded=num_discarded,
                 rule_snapshots=auto_materialize_policy.rule_snapshots,
+                timing=timing,
             )
         else:
             return AutoMaterializeAssetEvaluation(
@@ -959,6 +978,7 @@ def from_rule_evaluation_results(
                 num_skipped=num_skipped,
                 num_discarded=num_discarded,
                 rule_snapshots=auto_materialize_policy.rule_snapshots,
+                timing=timing,
             )
 
     def _deserialize_rule_evaluation_result(
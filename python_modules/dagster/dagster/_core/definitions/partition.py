@@ -1,6 +1,9 @@
+import base64
 import copy
 import hashlib
 import json
+import re
+import zlib
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from datetime import (
@@ -19,6 +22,7 @@
     Optional,
     Sequence,
     Set,
+    Tuple,
     Type,
     Union,
     cast,
@@ -54,6 +58,9 @@
 
 DEFAULT_DATE_FORMAT = "%Y-%m-%d"
 
+# StaticPartitionsDefinitions with at least this many partitions represent their subsets as bitmaps
+BITMAP_PARTITIONS_SUBSET_MIN_PARTITIONS = 1000
+
 T_cov = TypeVar("T_cov", default=Any, covariant=True)
 T_str = TypeVar("T_str", bound=str, default=str, covariant=True)
 T_PartitionsDefinition = TypeVar(
@@ -345,6 +352,12 @@ def __init__(self, partition_keys: Sequence[str]):
 
         self._partition_keys = partition_keys
 
+    @property
+    def partitions_subset_class(self) -> Type["PartitionsSubset[str]"]:
+        if len(self._partition_keys) >= BITMAP_PARTITIONS_SUBSET_MIN_PARTITIONS:
+            return BitmapPartitionsSubset
+        return DefaultPartitionsSubset
+
     @public
     def get_partition_keys(
         self,
@@ -387,6 +400,11 @@ def get_num_partitions(
         # This ensures that partition counts are correct in the Dagster UI.
         return len(set(self.get_partition_keys(current_time, dynamic_partitions_store)))
 
+    @cached_method
+    def get_partition_key_indices(self) -> Mapping[str, int]:
+        """Returns a mapping from each partition key to its position in the partitions definition."""
+        return {partition_key: i for i, partition_key in enumerate(self._partition_keys)}
+
 
 class CachingDynamicPartitionsLoader(DynamicPartitionsStore):
     """A batch loader that caches the partition keys for a given dynamic partitions definition,
@@ -1078,6 +1096,10 @@ def deserialize(self, partitions_def: PartitionsDefinition) -> PartitionsSubset:
         return partitions_def.deserialize_subset(self.serialized_subset)
 
 
+def _is_serialized_bitmap_subset(data: object) -> bool:
+    return isinstance(data, dict) and data.get("bitmap") is not None
+
+
 class DefaultPartitionsSubset(PartitionsSubset[T_str]):
     # Every time we change the serialization format, we should increment the version number.
     # This will ensure that we can gracefully degrade when deserializing old data.
@@ -1178,10 +1200,14 @@ def can_deserialize(
         serialized_partitions_def_unique_id: Optional[str],
         serialized_partitions_def_class_name: Optional[str],
     ) -> bool:
+        data = json.loads(serialized)
+        if _is_serialized_bitmap_subset(data):
+            # written by a BitmapPartitionsSubset, e.g. before the partitions definition shrank
+            return False
+
         if serialized_partitions_def_class_name is not None:
             return serialized_partitions_def_class_name == partitions_def.__class__.__name__
 
-        data = json.loads(serialized)
         return isinstance(data, list) or (
             data.get("subset") is not None and data.get("version") == cls.SERIALIZATION_VERSION
         )
@@ -1211,3 +1237,217 @@ def __repr__(self) -> str:
     @classmethod
     def empty_subset(cls, partitions_def: PartitionsDefinition[T_str]) -> "PartitionsSubset[T_str]":
         return cls(partitions_def=partitions_def)
+
+
+class BitmapPartitionsSubset(PartitionsSubset[str]):
+    """A subset of the partitions of a StaticPartitionsDefinition, represented as a bitmap over
+    the positions of the keys in the definition.
+
+    Bit i of the bitmap is set when the i-th partition key of the definition is in the subset, so
+    that unions, intersections and differences with other bitmap subsets of the same definition
+    are single bitwise operations, and the subset serializes to a compressed, base64-encoded
+    bitmap rather than a list of every key.
+
+    StaticPartitionsDefinitions with at least BITMAP_PARTITIONS_SUBSET_MIN_PARTITIONS keys use
+    this class as their `partitions_subset_class`.
+    """
+
+    # Every time we change the serialization format, we should increment the version number.
+    # This will ensure that we can gracefully degrade when deserializing old data.
+    SERIALIZATION_VERSION = 1
+
+    def __init__(self, partitions_def: "StaticPartitionsDefinition", bitmap: int = 0):
+        check.inst_param(partitions_def, "partitions_def", StaticPartitionsDefinition)
+        check.int_param(bitmap, "bitmap")
+        check.param_invariant(bitmap >= 0, "bitmap", "bitmap must be non-negative")
+        self._partitions_def = partitions_def
+        self._bitmap = bitmap
+
+    @property
+    def bitmap(self) -> int:
+        return self._bitmap
+
+    def _index_ranges(self) -> Iterable[Tuple[int, int]]:
+        # Each run of set bits in the bitmap corresponds to a contiguous range of partition keys.
+        # The binary string is reversed so that string position i corresponds to bit i.
+        for match in re.finditer("1+", bin(self._bitmap)[:1:-1]):
+            yield match.span()
+
+    def _with_bitmap(self, bitmap: int) -> "BitmapPartitionsSubset":
+        return self.__class__(self._partitions_def, bitmap)
+
+    def get_partition_keys_not_in_subset(
+        self,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Iterable[str]:
+        num_partitions = len(
+            self._partitions_def.get_partition_keys(
+                current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+            )
+        )
+        return self._with_bitmap(
+            ((1 << num_partitions) - 1) & ~self._bitmap
+        ).get_partition_keys(current_time=current_time)
+
+    def get_partition_keys(self, current_time: Optional[datetime] = None) -> Sequence[str]:
+        partition_keys = self._partitions_def.get_partition_keys(current_time=current_time)
+        return [
+            key for start, end in self._index_ranges() for key in partition_keys[start:end]
+        ]
+
+    def get_partition_key_ranges(
+        self,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Sequence[PartitionKeyRange]:
+        partition_keys = self._partitions_def.get_partition_keys(
+            current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+        )
+        return [
+            PartitionKeyRange(partition_keys[start], partition_keys[end - 1])
+            for start, end in self._index_ranges()
+        ]
+
+    def with_partition_keys(self, partition_keys: Iterable[str]) -> "PartitionsSubset[str]":
+        key_indices = self._partitions_def.get_partition_key_indices()
+        partition_keys = list(partition_keys)
+        bitmap = self._bitmap
+        for partition_key in partition_keys:
+            index = key_indices.get(partition_key)
+            if index is None:
+                # keys that are not part of the partitions definition cannot be represented in a
+                # bitmap, so fall back to a set of keys to avoid losing them
+                return DefaultPartitionsSubset(
+                    self._partitions_def, set(self.get_partition_keys()) | set(partition_keys)
+                )
+            bitmap |= 1 << index
+        return self._with_bitmap(bitmap)
+
+    def with_partition_key_range(
+        self,
+        partition_key_range: PartitionKeyRange,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> "BitmapPartitionsSubset":
+        key_indices = self._partitions_def.get_partition_key_indices()
+        start = key_indices.get(partition_key_range.start)
+        end = key_indices.get(partition_key_range.end)
+        if start is None or end is None:
+            raise DagsterInvalidInvocationError(
+                f"Partition range {partition_key_range.start} to {partition_key_range.end} is not"
+                " a valid range."
+            )
+        if start > end:
+            # matches get_partition_keys_in_range, which returns no keys for a reversed range
+            return self
+        return self._with_bitmap(self._bitmap | ((1 << (end + 1)) - (1 << start)))
+
+    def _is_compatible(self, other: PartitionsSubset) -> bool:
+        return isinstance(other, BitmapPartitionsSubset) and (
+            self._partitions_def is other.partitions_def
+            or self._partitions_def == other.partitions_def
+        )
+
+    def __or__(self, other: PartitionsSubset) -> "PartitionsSubset[str]":
+        if self._is_compatible(other):
+            return self._with_bitmap(self._bitmap | cast(BitmapPartitionsSubset, other).bitmap)
+        return super().__or__(other)
+
+    def __sub__(self, other: PartitionsSubset) -> "PartitionsSubset[str]":
+        if self._is_compatible(other):
+            return self._with_bitmap(self._bitmap & ~cast(BitmapPartitionsSubset, other).bitmap)
+        return super().__sub__(other)
+
+    def __and__(self, other: PartitionsSubset) -> "PartitionsSubset[str]":
+        if self._is_compatible(other):
+            return self._with_bitmap(self._bitmap & cast(BitmapPartitionsSubset, other).bitmap)
+        return super().__and__(other)
+
+    def serialize(self) -> str:
+        bitmap_bytes = self._bitmap.to_bytes((self._bitmap.bit_length() + 7) // 8, "little")
+        return json.dumps(
+            {
+                "version": self.SERIALIZATION_VERSION,
+                "bitmap": base64.b64encode(zlib.compress(bitmap_bytes)).decode("ascii"),
+            }
+        )
+
+    @classmethod
+    def from_serialized(
+        cls, partitions_def: PartitionsDefinition, serialized: str
+    ) -> "PartitionsSubset[str]":
+        data = json.loads(serialized)
+
+        if not _is_serialized_bitmap_subset(data):
+            # subsets serialized by DefaultPartitionsSubset, e.g. before the partitions definition
+            # grew large enough to use bitmap subsets
+            return cls.empty_subset(partitions_def).with_partition_keys(
+                DefaultPartitionsSubset.from_serialized(
+                    partitions_def, serialized
+                ).get_partition_keys()
+            )
+
+        if data.get("version") != cls.SERIALIZATION_VERSION:
+            raise DagsterInvalidDeserializationVersionError(
+                f"Attempted to deserialize partition subset with version {data.get('version')},"
+                f" but only version {cls.SERIALIZATION_VERSION} is supported."
+            )
+        bitmap_bytes = zlib.decompress(base64.b64decode(data["bitmap"]))
+        return cls(
+            cast(StaticPartitionsDefinition, partitions_def),
+            int.from_bytes(bitmap_bytes, "little"),
+        )
+
+    @classmethod
+    def can_deserialize(
+        cls,
+        partitions_def: PartitionsDefinition,
+        serialized: str,
+        serialized_partitions_def_unique_id: Optional[str],
+        serialized_partitions_def_class_name: Optional[str],
+    ) -> bool:
+        data = json.loads(serialized)
+        if not _is_serialized_bitmap_subset(data):
+            return DefaultPartitionsSubset.can_deserialize(
+                partitions_def,
+                serialized,
+                serialized_partitions_def_unique_id,
+                serialized_partitions_def_class_name,
+            )
+
+        # a bitmap is only meaningful against the exact ordering of keys it was written with
+        return (
+            data.get("version") == cls.SERIALIZATION_VERSION
+            and serialized_partitions_def_class_name == partitions_def.__class__.__name__
+            and serialized_partitions_def_unique_id is not None
+            and serialized_partitions_def_unique_id
+            == partitions_def.get_serializable_unique_identifier()
+        )
+
+    @property
+    def partitions_def(self) -> PartitionsDefinition[str]:
+        return self._partitions_def
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, BitmapPartitionsSubset)
+            and self._partitions_def == other._partitions_def
+            and self._bitmap == other._bitmap
+        )
+
+    def __len__(self) -> int:
+        return bin(self._bitmap).count("1")
+
+    def __contains__(self, value) -> bool:
+        index = self._partitions_def.get_partition_key_indices().get(value)
+        return index is not None and bool((self._bitmap >> index) & 1)
+
+    def __repr__(self) -> str:
+        return (
+            f"BitmapPartitionsSubset(bitmap={bin(self._bitmap)},"
+            f" partitions_def={self._partitions_def})"
+        )
+
+    @classmethod
+    def empty_subset(cls, partitions_def: PartitionsDefinition) -> "BitmapPartitionsSubset":
+        return cls(partitions_def=cast(StaticPartitionsDefinition, partitions_def))
@@ -1,5 +1,7 @@
+import bisect
 import functools
 import hashlib
+import heapq
 import json
 import re
 from datetime import datetime
@@ -28,7 +30,9 @@
 from dagster._core.instance import DynamicPartitionsStore
 from dagster._utils.partitions import DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE
 from dagster._utils.schedules import (
+    RegularCronSchedule,
     cron_string_iterator,
+    get_regular_cron_schedule,
     is_valid_cron_schedule,
     reverse_cron_string_iterator,
 )
@@ -174,6 +178,16 @@ def get_num_partitions(
         # string format datetimes.
         current_timestamp = self.get_current_timestamp(current_time=current_time)
 
+        regular_schedule = self._regular_schedule
+        if regular_schedule is not None:
+            first_index, last_index = self._get_partition_tick_index_range(
+                regular_schedule, current_timestamp
+            )
+            num_partitions = max(last_index - first_index + 1, 0)
+            if self.end_offset < 0:
+                num_partitions += self.end_offset
+            return num_partitions
+
         partitions_past_current_time = 0
 
         num_partitions = 0
@@ -239,6 +253,16 @@ def get_partition_keys(
     ) -> Sequence[str]:
         current_timestamp = self.get_current_timestamp(current_time=current_time)
 
+        regular_schedule = self._regular_schedule
+        if regular_schedule is not None:
+            first_index, last_index = self._get_partition_tick_index_range(
+                regular_schedule, current_timestamp
+            )
+            partition_keys = self._format_partition_keys(
+                regular_schedule, range(first_index, last_index + 1)
+            )
+            return partition_keys[: self.end_offset] if self.end_offset < 0 else partition_keys
+
         partitions_past_current_time = 0
         partition_keys: List[str] = []
         for time_window in self._iterate_time_windows(self.start):
@@ -533,6 +557,16 @@ def end_time_for_partition_key(self, partition_key: str) -> datetime:
 
     @functools.lru_cache(maxsize=5)
     def get_partition_keys_in_time_window(self, time_window: TimeWindow) -> Sequence[str]:
+        regular_schedule = self._regular_schedule
+        if regular_schedule is not None:
+            return self._format_partition_keys(
+                regular_schedule,
+                range(
+                    regular_schedule.get_index_at_or_after(time_window.start.timestamp()),
+                    regular_schedule.get_index_at_or_after(time_window.end.timestamp()),
+                ),
+            )
+
         result: List[str] = []
         for partition_time_window in self._iterate_time_windows(time_window.start):
             if partition_time_window.start < time_window.end:
@@ -541,6 +575,20 @@ def get_partition_keys_in_time_window(self, time_window: TimeWindow) -> Sequence
                 break
         return result
 
+    def get_num_partitions_in_time_window(self, time_window: TimeWindow) -> int:
+        """Returns the number of partitions whose start falls within the given time window,
+        without formatting their keys when the cron schedule is regular.
+        """
+        regular_schedule = self._regular_schedule
+        if regular_schedule is not None:
+            return max(
+                regular_schedule.get_index_at_or_after(time_window.end.timestamp())
+                - regular_schedule.get_index_at_or_after(time_window.start.timestamp()),
+                0,
+            )
+
+        return len(self.get_partition_keys_in_time_window(time_window))
+
     def get_partition_key_range_for_time_window(self, time_window: TimeWindow) -> PartitionKeyRange:
         start_partition_key = self.get_partition_key_for_timestamp(time_window.start.timestamp())
         end_partition_key = self.get_partition_key_for_timestamp(
@@ -696,9 +744,66 @@ def get_cron_schedule(
             day_offset=day_offset,
         )
 
+    @property
+    def _regular_schedule(self) -> Optional[RegularCronSchedule]:
+        """The closed-form representation of the cron schedule, if it has one. When it does,
+        partition keys and time windows are computed from tick indices rather than by iterating
+        over the schedule.
+        """
+        return get_regular_cron_schedule(self.cron_schedule, self.timezone)
+
+    def _get_tick_datetime(
+        self, regular_schedule: RegularCronSchedule, tick_index: int
+    ) -> datetime:
+        return pendulum.from_timestamp(regular_schedule.get_timestamp(tick_index), tz=self.timezone)
+
+    def _format_partition_keys(
+        self, regular_schedule: RegularCronSchedule, tick_indices: Iterable[int]
+    ) -> List[str]:
+        """Returns the partition keys of the partitions that start at the given ticks."""
+        if "%z" in self.fmt or "%Z" in self.fmt:
+            return [
+                self._get_tick_datetime(regular_schedule, tick_index).strftime(self.fmt)
+                for tick_index in tick_indices
+            ]
+        # formatting naive datetimes is much cheaper, and gives the same result for formats
+        # without timezone directives
+        return [
+            regular_schedule.get_local_datetime(tick_index).strftime(self.fmt)
+            for tick_index in tick_indices
+        ]
+
+    def _get_partition_tick_index_range(
+        self, regular_schedule: RegularCronSchedule, current_timestamp: float
+    ) -> Tuple[int, int]:
+        """Returns the indices of the ticks that start the first and the last partition, before
+        a negative end_offset is applied. The range is empty if there are no partitions.
+        """
+        first_index = regular_schedule.get_index_at_or_after(self.start.timestamp())
+        # the last partition that ends at or before the current time, extended by the end_offset
+        last_index = max(
+            regular_schedule.get_index_at_or_before(current_timestamp) - 1, first_index - 1
+        ) + max(self.end_offset, 0)
+        if self.end:
+            last_index = min(
+                last_index, regular_schedule.get_index_at_or_before(self.end.timestamp()) - 1
+            )
+        return first_index, last_index
+
     def _iterate_time_windows(self, start: datetime) -> Iterable[TimeWindow]:
         """Returns an infinite generator of time windows that start after the given start time."""
         start_timestamp = pendulum.instance(start, tz=self.timezone).timestamp()
+
+        regular_schedule = self._regular_schedule
+        if regular_schedule is not None:
+            tick_index = regular_schedule.get_index_at_or_after(start_timestamp)
+            prev_time = self._get_tick_datetime(regular_schedule, tick_index)
+            while True:
+                tick_index += 1
+                next_time = self._get_tick_datetime(regular_schedule, tick_index)
+                yield TimeWindow(prev_time, next_time)
+                prev_time = next_time
+
         iterator = cron_string_iterator(
             start_timestamp=start_timestamp,
             cron_string=self.cron_schedule,
@@ -716,6 +821,17 @@ def _iterate_time_windows(self, start: datetime) -> Iterable[TimeWindow]:
     def _reverse_iterate_time_windows(self, end: datetime) -> Iterable[TimeWindow]:
         """Returns an infinite generator of time windows that end before the given end time."""
         end_timestamp = pendulum.instance(end, tz=self.timezone).timestamp()
+
+        regular_schedule = self._regular_schedule
+        if regular_schedule is not None:
+            tick_index = regular_schedule.get_index_at_or_before(end_timestamp)
+            prev_time = self._get_tick_datetime(regular_schedule, tick_index)
+            while True:
+                tick_index -= 1
+                next_time = self._get_tick_datetime(regular_schedule, tick_index)
+                yield TimeWindow(next_time, prev_time)
+                prev_time = next_time
+
         iterator = reverse_cron_string_iterator(
             end_timestamp=end_timestamp,
             cron_string=self.cron_schedule,
@@ -736,6 +852,15 @@ def get_partition_key_for_timestamp(self, timestamp: float, end_closed: bool = F
         timestamp (float): Timestamp from the unix epoch, UTC.
         end_closed (bool): Whether the interval is closed at the end or at the beginning.
         """
+        regular_schedule = self._regular_schedule
+        if regular_schedule is not None:
+            tick_index = (
+                regular_schedule.get_index_at_or_after(timestamp) - 1
+                if end_closed
+                else regular_schedule.get_index_at_or_before(timestamp)
+            )
+            return self._format_partition_keys(regular_schedule, [tick_index])[0]
+
         iterator = cron_string_iterator(
             timestamp, self.cron_schedule, self.timezone, start_offset=-1
         )
@@ -762,6 +887,25 @@ def partitions_subset_class(self) -> Type["PartitionsSubset"]:
     def empty_subset(self) -> "PartitionsSubset":
         return self.partitions_subset_class.empty_subset(self)
 
+    def subset_with_all_partitions(
+        self,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> "PartitionsSubset":
+        # all partitions are contiguous, so they can be represented by a single time window
+        # instead of a list of every partition key
+        current_time = current_time or pendulum.now(self.timezone)
+        first_window = self.get_first_partition_window(current_time=current_time)
+        last_window = self.get_last_partition_window(current_time=current_time)
+        if first_window is None or last_window is None or first_window.start >= last_window.end:
+            return self.empty_subset()
+
+        return TimeWindowPartitionsSubset(
+            self,
+            num_partitions=self.get_num_partitions(current_time=current_time),
+            included_time_windows=[TimeWindow(first_window.start, last_window.end)],
+        )
+
     def is_valid_partition_key(self, partition_key: str) -> bool:
         try:
             partition_time = pendulum.instance(
@@ -1392,6 +1536,65 @@ def inner(
     return inner
 
 
+def _union_time_windows(
+    windows: Sequence[TimeWindow], other_windows: Sequence[TimeWindow]
+) -> List[TimeWindow]:
+    """Merges two sorted sequences of disjoint time windows into a sorted sequence of disjoint
+    time windows, coalescing windows that overlap or are adjacent.
+    """
+    result: List[TimeWindow] = []
+    for window in heapq.merge(windows, other_windows):
+        if result and window.start <= result[-1].end:
+            if window.end > result[-1].end:
+                result[-1] = TimeWindow(result[-1].start, window.end)
+        else:
+            result.append(window)
+    return result
+
+
+def _intersect_time_windows(
+    windows: Sequence[TimeWindow], other_windows: Sequence[TimeWindow]
+) -> List[TimeWindow]:
+    """Returns the sorted, disjoint time windows covered by both of the given sorted sequences of
+    disjoint time windows.
+    """
+    result: List[TimeWindow] = []
+    i = j = 0
+    while i < len(windows) and j < len(other_windows):
+        start = max(windows[i].start, other_windows[j].start)
+        end = min(windows[i].end, other_windows[j].end)
+        if start < end:
+            result.append(TimeWindow(start, end))
+        if windows[i].end < other_windows[j].end:
+            i += 1
+        else:
+            j += 1
+    return result
+
+
+def _subtract_time_windows(
+    windows: Sequence[TimeWindow], other_windows: Sequence[TimeWindow]
+) -> List[TimeWindow]:
+    """Returns the sorted, disjoint time windows covered by the first of the given sorted
+    sequences of disjoint time windows, but not by the second.
+    """
+    result: List[TimeWindow] = []
+    j = 0
+    for window in windows:
+        start = window.start
+        while j < len(other_windows) and other_windows[j].end <= start:
+            j += 1
+        k = j
+        while k < len(other_windows) and other_windows[k].start < window.end:
+            if other_windows[k].start > start:
+                result.append(TimeWindow(start, other_windows[k].start))
+            start = max(start, other_windows[k].end)
+            k += 1
+        if start < window.end:
+            result.append(TimeWindow(start, window.end))
+    return result
+
+
 class TimeWindowPartitionsSubset(PartitionsSubset):
     # Every time we change the serialization format, we should increment the version number.
     # This will ensure that we can gracefully degrade when deserializing old data.
@@ -1417,6 +1620,8 @@ def __init__(
         self._included_partition_keys = check.opt_nullable_set_param(
             included_partition_keys, "included_partition_keys", of_type=str
         )
+        # the start of each included time window, lazily computed to check membership by bisection
+        self._included_window_starts: Optional[Sequence[datetime]] = None
 
     @property
     def included_time_windows(self) -> Sequence[TimeWindow]:
@@ -1491,13 +1696,18 @@ def num_partitions(self) -> int:
             if self._included_partition_keys is not None:
                 self._num_partitions = len(self._included_partition_keys)
             else:
-                self._num_partitions = sum(
-                    len(self._partitions_def.get_partition_keys_in_time_window(time_window))
-                    for time_window in self.included_time_windows
+                self._num_partitions = self._get_num_partitions_in_time_windows(
+                    self.included_time_windows
                 )
 
         return self._num_partitions
 
+    def _get_num_partitions_in_time_windows(self, time_windows: Sequence[TimeWindow]) -> int:
+        return sum(
+            self._partitions_def.get_num_partitions_in_time_window(time_window)
+            for time_window in time_windows
+        )
+
     def _get_partition_time_windows_not_in_subset(
         self,
         current_time: Optional[datetime] = None,
@@ -1581,51 +1791,13 @@ def _add_partitions_to_time_windows(
         """Merges a set of partition keys into an existing set of time windows, returning the
         minimized set of time windows and the number of partitions added.
         """
-        result_windows = [*initial_windows]
         time_windows = self._partitions_def.time_windows_for_partition_keys(
             frozenset(partition_keys), validate=validate
         )
-        num_added_partitions = 0
-        for window in sorted(time_windows):
-            # go in reverse order because it's more common to add partitions at the end than the
-            # beginning
-            for i in reversed(range(len(result_windows))):
-                included_window = result_windows[i]
-                lt_end_of_range = window.start < included_window.end
-                gte_start_of_range = window.start >= included_window.start
-
-                if lt_end_of_range and gte_start_of_range:
-                    break
-
-                if not lt_end_of_range:
-                    merge_with_range = included_window.end == window.start
-                    merge_with_later_range = i + 1 < len(result_windows) and (
-                        window.end == result_windows[i + 1].start
-                    )
-
-                    if merge_with_range and merge_with_later_range:
-                        result_windows[i] = TimeWindow(
-                            included_window.start, result_windows[i + 1].end
-                        )
-                        del result_windows[i + 1]
-                    elif merge_with_range:
-                        result_windows[i] = TimeWindow(included_window.start, window.end)
-                    elif merge_with_later_range:
-                        result_windows[i + 1] = TimeWindow(window.start, result_windows[i + 1].end)
-                    else:
-                        result_windows.insert(i + 1, window)
-
-                    num_added_partitions += 1
-                    break
-            else:
-                if result_windows and window.start == result_windows[0].start:
-                    result_windows[0] = TimeWindow(window.start, included_window.end)  # type: ignore
-                else:
-                    result_windows.insert(0, window)
-
-                num_added_partitions += 1
-
-        return result_windows, num_added_partitions
+        # each window covers a single partition, so it is either entirely within the existing
+        # windows or entirely outside of them
+        added_windows = _subtract_time_windows(sorted(set(time_windows)), initial_windows)
+        return _union_time_windows(initial_windows, added_windows), len(added_windows)
 
     def with_partition_keys(self, partition_keys: Iterable[str]) -> "TimeWindowPartitionsSubset":
         # if we are representing things as a static set of keys, continue doing so
@@ -1647,6 +1819,115 @@ def with_partition_keys(self, partition_keys: Iterable[str]) -> "TimeWindowParti
             included_time_windows=result_windows,
         )
 
+    def with_partition_key_range(
+        self,
+        partition_key_range: PartitionKeyRange,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> "TimeWindowPartitionsSubset":
+        range_window = TimeWindow(
+            self._partitions_def.start_time_for_partition_key(partition_key_range.start),
+            self._partitions_def.end_time_for_partition_key(partition_key_range.end),
+        )
+        if range_window.start >= range_window.end:
+            return self
+        return cast(
+            TimeWindowPartitionsSubset,
+            self
+            | TimeWindowPartitionsSubset(
+                self._partitions_def, num_partitions=None, included_time_windows=[range_window]
+            ),
+        )
+
+    def _get_time_window_subset_operand(
+        self, other: PartitionsSubset
+    ) -> Optional["TimeWindowPartitionsSubset"]:
+        """Returns the other operand of a set operation if the operation can be computed directly
+        on the time windows of the two subsets.
+        """
+        if (
+            self is not other
+            and isinstance(other, TimeWindowPartitionsSubset)
+            and self._partitions_def == other._partitions_def
+        ):
+            return other
+        return None
+
+    def __or__(self, other: PartitionsSubset) -> "PartitionsSubset":
+        other_subset = self._get_time_window_subset_operand(other)
+        if other_subset is None:
+            return super().__or__(other)
+
+        if (
+            self._included_partition_keys is not None
+            and other_subset._included_partition_keys is not None
+        ):
+            return self.with_partition_keys(other_subset._included_partition_keys)
+
+        intersection = _intersect_time_windows(
+            self.included_time_windows, other_subset.included_time_windows
+        )
+        return TimeWindowPartitionsSubset(
+            self._partitions_def,
+            num_partitions=len(self)
+            + len(other_subset)
+            - self._get_num_partitions_in_time_windows(intersection),
+            included_time_windows=_union_time_windows(
+                self.included_time_windows, other_subset.included_time_windows
+            ),
+        )
+
+    def __sub__(self, other: PartitionsSubset) -> "PartitionsSubset":
+        other_subset = self._get_time_window_subset_operand(other)
+        if other_subset is None:
+            return super().__sub__(other)
+
+        if (
+            self._included_partition_keys is not None
+            and other_subset._included_partition_keys is not None
+        ):
+            remaining_keys = self._included_partition_keys - other_subset._included_partition_keys
+            return TimeWindowPartitionsSubset(
+                self._partitions_def,
+                num_partitions=len(remaining_keys),
+                included_partition_keys=remaining_keys,
+            )
+
+        intersection = _intersect_time_windows(
+            self.included_time_windows, other_subset.included_time_windows
+        )
+        return TimeWindowPartitionsSubset(
+            self._partitions_def,
+            num_partitions=len(self) - self._get_num_partitions_in_time_windows(intersection),
+            included_time_windows=_subtract_time_windows(
+                self.included_time_windows, other_subset.included_time_windows
+            ),
+        )
+
+    def __and__(self, other: PartitionsSubset) -> "PartitionsSubset":
+        other_subset = self._get_time_window_subset_operand(other)
+        if other_subset is None:
+            return super().__and__(other)
+
+        if (
+            self._included_partition_keys is not None
+            and other_subset._included_partition_keys is not None
+        ):
+            common_keys = self._included_partition_keys & other_subset._included_partition_keys
+            return TimeWindowPartitionsSubset(
+                self._partitions_def,
+                num_partitions=len(common_keys),
+                included_partition_keys=common_keys,
+            )
+
+        intersection = _intersect_time_windows(
+            self.included_time_windows, other_subset.included_time_windows
+        )
+        return TimeWindowPartitionsSubset(
+            self._partitions_def,
+            num_partitions=self._get_num_partitions_in_time_windows(intersection),
+            included_time_windows=intersection,
+        )
+
     @classmethod
     def from_serialized(
         cls, partitions_def: PartitionsDefinition, serialized: str
@@ -1780,13 +2061,13 @@ def __contains__(self, partition_key: str) -> bool:
         if self._included_partition_keys is not None:
             return partition_key in self._included_partition_keys
 
-        time_window = self._partitions_def.time_window_for_partition_key(partition_key)
+        partition_start = self._partitions_def.start_time_for_partition_key(partition_key)
+        if self._included_window_starts is None:
+            self._included_window_starts = [window.start for window in self.included_time_windows]
 
-        return any(
-            time_window.start >= included_time_window.start
-            and time_window.start < included_time_window.end
-            for included_time_window in self.included_time_windows
-        )
+        # the only window that can contain the partition is the last one that starts before it
+        i = bisect.bisect_right(self._included_window_starts, partition_start) - 1
+        return i >= 0 and partition_start < self.included_time_windows[i].end
 
     def __repr__(self) -> str:
         return f"TimeWindowPartitionsSubset({self.get_partition_key_ranges()})"
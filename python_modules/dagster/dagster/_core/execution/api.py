@@ -1,5 +1,5 @@
 import sys
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
 from typing import (
     TYPE_CHECKING,
     AbstractSet,
@@ -874,10 +874,19 @@ def __iter__(self) -> Iterator[DagsterEvent]:
             generator_closed = False
             try:
                 if self.job_context:  # False if we had a pipeline init failure
-                    yield from self.iterator(
-                        execution_plan=self.execution_plan,
-                        job_context=self.job_context,
+                    # Only the orchestrating process buffers its event log writes. Step workers
+                    # write through, since executors like the StepDelegatingExecutor poll the event
+                    # log for the events they produce.
+                    event_writes = (
+                        self.job_context.instance.buffered_event_writes(self.job_context.run_id)
+                        if isinstance(self.job_context, PlanOrchestrationContext)
+                        else nullcontext()
                     )
+                    with event_writes:
+                        yield from self.iterator(
+                            execution_plan=self.execution_plan,
+                            job_context=self.job_context,
+                        )
             except GeneratorExit:
                 # Shouldn't happen, but avoid runtime-exception in case this generator gets GC-ed
                 # (see https://amir.rachum.com/blog/2017/03/03/generator-cleanup/).
@@ -445,15 +445,14 @@ def from_partitions_by_assets(
             if partitions and partition_def:
                 if partitions.partition_range:
                     # a range of partitions is selected
-                    partition_keys_in_range = partition_def.get_partition_keys_in_range(
-                        partition_key_range=PartitionKeyRange(
-                            start=partitions.partition_range.start,
-                            end=partitions.partition_range.end,
-                        ),
-                        dynamic_partitions_store=dynamic_partitions_store,
-                    )
-                    partition_subset_in_range = partition_def.subset_with_partition_keys(
-                        partition_keys_in_range
+                    partition_subset_in_range = (
+                        partition_def.empty_subset().with_partition_key_range(
+                            partition_key_range=PartitionKeyRange(
+                                start=partitions.partition_range.start,
+                                end=partitions.partition_range.end,
+                            ),
+                            dynamic_partitions_store=dynamic_partitions_store,
+                        )
                     )
                     partitions_subsets_by_asset_key.update({asset_key: partition_subset_in_range})
                 else:
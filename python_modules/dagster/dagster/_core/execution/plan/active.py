@@ -1,4 +1,7 @@
 import time
+from bisect import bisect_right
+from collections import defaultdict
+from itertools import count
 from types import TracebackType
 from typing import (
     Any,
@@ -10,6 +13,7 @@
     Optional,
     Sequence,
     Set,
+    Tuple,
     Type,
     Union,
     cast,
@@ -87,7 +91,18 @@ def __init__(
         self._step_outputs: Set[StepOutputHandle] = set(self._plan.known_state.ready_outputs)
 
         # All steps to be executed start out here in _pending
-        self._pending: Dict[str, Set[str]] = dict(self._plan.get_executable_step_deps())
+        self._pending: Dict[str, Set[str]] = {}
+
+        # To avoid rescanning every pending step on each _update, readiness is tracked
+        # incrementally: for each upstream step we index the pending steps that depend on it, and
+        # for each pending step we count the upstream steps that have yet to succeed or skip. When a
+        # step completes, only its direct downstream steps are touched, and the ones that may have
+        # changed state are marked in _pending_to_evaluate for the next _update.
+        self._pending_dependents: Dict[str, Set[str]] = defaultdict(set)
+        self._pending_unresolved_dep_counts: Dict[str, int] = {}
+        self._pending_order: Dict[str, int] = {}
+        self._pending_counter = count()
+        self._pending_to_evaluate: Set[str] = set()
 
         # track mapping keys from DynamicOutputs, step_key, output_name -> list of keys
         # to _gathering while in flight
@@ -103,6 +118,10 @@ def __init__(
 
         # steps move in to these buckets as a result of _update calls
         self._executable: List[str] = []
+        # _executable is kept ordered by (sort key, order added), with the corresponding sort keys
+        # in _executable_order, so that steps do not need to be re-sorted on every tick
+        self._executable_order: List[Tuple[float, int]] = []
+        self._executable_counter = count()
         self._pending_skip: List[str] = []
         self._pending_retry: List[str] = []
         self._pending_abandon: List[str] = []
@@ -123,6 +142,9 @@ def __init__(
 
         self._interrupted: bool = False
 
+        for step_key, deps in self._plan.get_executable_step_deps().items():
+            self._add_pending(step_key, deps)
+
         # Start the show by loading _executable with the set of _pending steps that have no deps
         self._update()
 
@@ -198,6 +220,50 @@ def _pending_state_str(self) -> str:
             ),
         )
 
+    def _add_pending(self, step_key: str, requirements: Set[str]) -> None:
+        self._remove_pending(step_key)
+
+        self._pending[step_key] = requirements
+        self._pending_order[step_key] = next(self._pending_counter)
+
+        unresolved_dep_count = 0
+        has_failed_dep = False
+        for dep_key in requirements:
+            if dep_key in self._success or dep_key in self._skipped:
+                continue
+
+            unresolved_dep_count += 1
+            self._pending_dependents[dep_key].add(step_key)
+            if dep_key in self._failed or dep_key in self._abandoned:
+                has_failed_dep = True
+
+        self._pending_unresolved_dep_counts[step_key] = unresolved_dep_count
+        if unresolved_dep_count == 0 or has_failed_dep:
+            self._pending_to_evaluate.add(step_key)
+
+    def _remove_pending(self, step_key: str) -> None:
+        requirements = self._pending.pop(step_key, None)
+        if requirements is None:
+            return
+
+        for dep_key in requirements:
+            dependents = self._pending_dependents.get(dep_key)
+            if dependents:
+                dependents.discard(step_key)
+        del self._pending_unresolved_dep_counts[step_key]
+        del self._pending_order[step_key]
+        self._pending_to_evaluate.discard(step_key)
+
+    def _resolve_pending_dependents(self, step_key: str, succeeded_or_skipped: bool) -> None:
+        """Update the pending steps that depend on a step that has reached a terminal state."""
+        for dependent_key in self._pending_dependents.pop(step_key, ()):
+            if succeeded_or_skipped:
+                self._pending_unresolved_dep_counts[dependent_key] -= 1
+                if self._pending_unresolved_dep_counts[dependent_key] == 0:
+                    self._pending_to_evaluate.add(dependent_key)
+            else:
+                self._pending_to_evaluate.add(dependent_key)
+
     def _update(self) -> None:
         """Moves steps from _pending to _executable / _pending_skip / _pending_retry
         as a function of what has been _completed.
@@ -206,23 +272,29 @@ def _update(self) -> None:
         new_steps_to_skip: List[str] = []
         new_steps_to_abandon: List[str] = []
 
-        successful_or_skipped_steps = self._success | self._skipped
-        failed_or_abandoned_steps = self._failed | self._abandoned
-
         if self._new_dynamic_mappings:
             new_step_deps = self._plan.resolve(self._completed_dynamic_outputs)
             for step_key, deps in new_step_deps.items():
-                self._pending[step_key] = deps
+                self._add_pending(step_key, deps)
 
             self._new_dynamic_mappings = False
 
-        for step_key, requirements in self._pending.items():
+        # evaluate candidate steps in the order they were added to _pending, so that the resulting
+        # order of execution is deterministic
+        steps_to_evaluate = sorted(self._pending_to_evaluate, key=self._pending_order.__getitem__)
+        self._pending_to_evaluate = set()
+
+        for step_key in steps_to_evaluate:
+            requirements = self._pending[step_key]
+
             # If any upstream deps failed - this is not executable
-            if requirements.intersection(failed_or_abandoned_steps):
+            if any(
+                dep_key in self._failed or dep_key in self._abandoned for dep_key in requirements
+            ):
                 new_steps_to_abandon.append(step_key)
 
             # If all the upstream steps of a step are complete or skipped
-            elif requirements.issubset(successful_or_skipped_steps):
+            elif self._pending_unresolved_dep_counts[step_key] == 0:
                 step = self.get_step_by_key(step_key)
 
                 # The base case is downstream step won't skip
@@ -253,16 +325,16 @@ def _update(self) -> None:
                     new_steps_to_execute.append(step_key)
 
         for key in new_steps_to_execute:
-            self._executable.append(key)
-            del self._pending[key]
+            self._add_executable(key)
+            self._remove_pending(key)
 
         for key in new_steps_to_skip:
             self._pending_skip.append(key)
-            del self._pending[key]
+            self._remove_pending(key)
 
         for key in new_steps_to_abandon:
             self._pending_abandon.append(key)
-            del self._pending[key]
+            self._remove_pending(key)
 
         ready_to_retry = []
         tick_time = time.time()
@@ -271,9 +343,15 @@ def _update(self) -> None:
                 ready_to_retry.append(key)
 
         for key in ready_to_retry:
-            self._executable.append(key)
+            self._add_executable(key)
             del self._waiting_to_retry[key]
 
+    def _add_executable(self, step_key: str) -> None:
+        order = (self._sort_key_fn(self.get_step_by_key(step_key)), next(self._executable_counter))
+        index = bisect_right(self._executable_order, order)
+        self._executable_order.insert(index, order)
+        self._executable.insert(index, step_key)
+
     def sleep_interval(self):
         now = time.time()
         intervals = []
@@ -323,11 +401,6 @@ def get_steps_to_execute(
 
         self._update()
 
-        steps = sorted(
-            [self.get_step_by_key(key) for key in self._executable],
-            key=self._sort_key_fn,
-        )
-
         run_scoped_concurrency_limits_counter = None
         if self._tag_concurrency_limits:
             in_flight_steps = [self.get_step_by_key(key) for key in self._in_flight]
@@ -337,8 +410,9 @@ def get_steps_to_execute(
             )
 
         batch: List[ExecutionStep] = []
+        batch_indices: List[int] = []
 
-        for step in steps:
+        for index, step_key in enumerate(self._executable):
             if limit is not None and len(batch) >= limit:
                 break
 
@@ -348,6 +422,8 @@ def get_steps_to_execute(
             ):
                 break
 
+            step = self.get_step_by_key(step_key)
+
             if run_scoped_concurrency_limits_counter:
                 if run_scoped_concurrency_limits_counter.is_blocked(step):
                     continue
@@ -368,10 +444,14 @@ def get_steps_to_execute(
                     continue
 
             batch.append(step)
+            batch_indices.append(index)
+
+        for index in reversed(batch_indices):
+            del self._executable[index]
+            del self._executable_order[index]
 
         for step in batch:
             self._in_flight.add(step.key)
-            self._executable.remove(step.key)
             self._prep_for_dynamic_outputs(step)
 
         return batch
@@ -450,20 +530,24 @@ def plan_events_iterator(
 
     def mark_failed(self, step_key: str) -> None:
         self._failed.add(step_key)
+        self._resolve_pending_dependents(step_key, succeeded_or_skipped=False)
         self._mark_complete(step_key)
 
     def mark_success(self, step_key: str) -> None:
         self._success.add(step_key)
+        self._resolve_pending_dependents(step_key, succeeded_or_skipped=True)
         self._mark_complete(step_key)
         self._resolve_any_dynamic_outputs(step_key)
 
     def mark_skipped(self, step_key: str) -> None:
         self._skipped.add(step_key)
+        self._resolve_pending_dependents(step_key, succeeded_or_skipped=True)
         self._mark_complete(step_key)
         self._resolve_any_dynamic_outputs(step_key)
 
     def mark_abandoned(self, step_key: str) -> None:
         self._abandoned.add(step_key)
+        self._resolve_pending_dependents(step_key, succeeded_or_skipped=False)
         self._mark_complete(step_key)
 
     def mark_interrupted(self) -> None:
@@ -484,11 +568,12 @@ def mark_up_for_retry(self, step_key: str, at_time: Optional[float] = None) -> N
             if at_time:
                 self._waiting_to_retry[step_key] = at_time
             else:
-                self._pending[step_key] = self._plan.get_executable_step_deps()[step_key]
+                self._add_pending(step_key, self._plan.get_executable_step_deps()[step_key])
 
         elif self._retry_mode.deferred:
             # do not attempt to execute again
             self._abandoned.add(step_key)
+            self._resolve_pending_dependents(step_key, succeeded_or_skipped=False)
 
         self._retry_state.mark_attempt(step_key)
 
@@ -2,10 +2,12 @@
 import logging.config
 import os
 import sys
+import threading
 import time
 import weakref
 from abc import abstractmethod
 from collections import defaultdict
+from contextlib import contextmanager
 from enum import Enum
 from tempfile import TemporaryDirectory
 from types import TracebackType
@@ -17,6 +19,7 @@
     Dict,
     Generic,
     Iterable,
+    Iterator,
     List,
     Mapping,
     Optional,
@@ -55,6 +58,7 @@
     DagsterRunStatus,
     JobBucket,
     RunPartitionData,
+    RunQueueEntry,
     RunRecord,
     RunsFilter,
     TagBucket,
@@ -158,6 +162,7 @@
         EventRecordsFilter,
         EventRecordsResult,
     )
+    from dagster._core.storage.event_log.buffered_writer import BufferedEventLogWriter
     from dagster._core.storage.partition_status_cache import (
         AssetPartitionStatus,
         AssetStatusCacheValue,
@@ -454,6 +459,8 @@ def __init__(
         self._ref = check.opt_inst_param(ref, "ref", InstanceRef)
 
         self._subscribers: Dict[str, List[Callable]] = defaultdict(list)
+        # the buffered event writer for the run being executed on the current thread, if any
+        self._event_writer_local = threading.local()
 
         run_monitoring_enabled = self.run_monitoring_settings.get("enabled", False)
         self._run_monitoring_enabled = run_monitoring_enabled
@@ -887,6 +894,48 @@ def cancellation_thread_poll_interval_seconds(self) -> int:
             "cancellation_thread_poll_interval_seconds", 10
         )
 
+    # event log writes
+
+    @property
+    def event_log_buffer_settings(self) -> Any:
+        return self.get_settings("event_log_buffer")
+
+    @property
+    def event_log_buffer_enabled(self) -> bool:
+        return self.event_log_buffer_settings.get("enabled", False)
+
+    @property
+    def event_log_buffer_flush_size(self) -> int:
+        from dagster._core.storage.event_log.buffered_writer import (
+            DEFAULT_EVENT_BUFFER_FLUSH_SIZE,
+        )
+
+        return self.event_log_buffer_settings.get("flush_size", DEFAULT_EVENT_BUFFER_FLUSH_SIZE)
+
+    @property
+    def event_log_buffer_flush_interval_seconds(self) -> float:
+        from dagster._core.storage.event_log.buffered_writer import (
+            DEFAULT_EVENT_BUFFER_FLUSH_INTERVAL_SECONDS,
+        )
+
+        return self.event_log_buffer_settings.get(
+            "flush_interval_seconds", DEFAULT_EVENT_BUFFER_FLUSH_INTERVAL_SECONDS
+        )
+
+    # compact encoding of stored bodies
+
+    @property
+    def compact_encoding_settings(self) -> Any:
+        return self.get_settings("compact_encoding")
+
+    @property
+    def event_log_compact_encoding_enabled(self) -> bool:
+        return self.compact_encoding_settings.get("event_log_storage", False)
+
+    @property
+    def run_storage_compact_encoding_enabled(self) -> bool:
+        return self.compact_encoding_settings.get("run_storage", False)
+
     @property
     def run_retries_enabled(self) -> bool:
         return self.get_settings("run_retries").get("enabled", False)
@@ -913,6 +962,14 @@ def auto_materialize_respect_materialization_data_versions(self) -> bool:
             "respect_materialization_data_versions", False
         )
 
+    @property
+    def auto_materialize_use_threads(self) -> bool:
+        return self.get_settings("auto_materialize").get("use_threads", False)
+
+    @property
+    def auto_materialize_num_workers(self) -> Optional[int]:
+        return self.get_settings("auto_materialize").get("num_workers")
+
     # python logs
 
     @property
@@ -1016,6 +1073,13 @@ def get_run_record_by_id(self, run_id: str) -> Optional[RunRecord]:
             return None
         return records[0]
 
+    async def get_run_record_by_id_async(self, run_id: str) -> Optional[RunRecord]:
+        """Async variant of `get_run_record_by_id`."""
+        records = await self._run_storage.get_run_records_async(RunsFilter(run_ids=[run_id]))
+        if not records:
+            return None
+        return records[0]
+
     @traced
     def get_job_snapshot(self, snapshot_id: str) -> "JobSnapshot":
         return self._run_storage.get_job_snapshot(snapshot_id)
@@ -1759,6 +1823,27 @@ def get_run_records(
             filters, limit, order_by, ascending, cursor, bucket_by
         )
 
+    async def get_run_records_async(
+        self,
+        filters: Optional[RunsFilter] = None,
+        limit: Optional[int] = None,
+        order_by: Optional[str] = None,
+        ascending: bool = False,
+        cursor: Optional[str] = None,
+        bucket_by: Optional[Union[JobBucket, TagBucket]] = None,
+    ) -> Sequence[RunRecord]:
+        """Async variant of `get_run_records`."""
+        return await self._run_storage.get_run_records_async(
+            filters, limit, order_by, ascending, cursor, bucket_by
+        )
+
+    @traced
+    def get_run_queue_entries(self, filters: RunsFilter) -> Sequence[RunQueueEntry]:
+        """Return lightweight run queue entries for the runs matching the given filter, ordered by
+        descending priority and then in the order in which they were submitted.
+        """
+        return self._run_storage.get_run_queue_entries(filters)
+
     @traced
     def get_run_partition_data(self, runs_filter: RunsFilter) -> Sequence[RunPartitionData]:
         """Get run partition data for a given partitioned job."""
@@ -1814,6 +1899,19 @@ def get_records_for_run(
     ) -> "EventLogConnection":
         return self._event_storage.get_records_for_run(run_id, cursor, of_type, limit, ascending)
 
+    async def get_records_for_run_async(
+        self,
+        run_id: str,
+        cursor: Optional[str] = None,
+        of_type: Optional[Union["DagsterEventType", Set["DagsterEventType"]]] = None,
+        limit: Optional[int] = None,
+        ascending: bool = True,
+    ) -> "EventLogConnection":
+        """Async variant of `get_records_for_run`."""
+        return await self._event_storage.get_records_for_run_async(
+            run_id, cursor, of_type, limit, ascending
+        )
+
     def watch_event_logs(self, run_id: str, cursor: Optional[str], cb: "EventHandlerFn") -> None:
         return self._event_storage.watch(run_id, cursor, cb)
 
@@ -1938,6 +2036,18 @@ def fetch_materializations(
         """
         return self._event_storage.fetch_materializations(records_filter, limit, cursor, ascending)
 
+    async def fetch_materializations_async(
+        self,
+        records_filter: Union[AssetKey, "AssetRecordsFilter"],
+        limit: int,
+        cursor: Optional[str] = None,
+        ascending: bool = False,
+    ) -> "EventRecordsResult":
+        """Async variant of `fetch_materializations`."""
+        return await self._event_storage.fetch_materializations_async(
+            records_filter, limit, cursor, ascending
+        )
+
     @public
     @traced
     def fetch_planned_materializations(
@@ -2080,6 +2190,12 @@ def get_asset_records(
         """
         return self._event_storage.get_asset_records(asset_keys)
 
+    async def get_asset_records_async(
+        self, asset_keys: Optional[Sequence[AssetKey]] = None
+    ) -> Sequence["AssetRecord"]:
+        """Async variant of `get_asset_records`."""
+        return await self._event_storage.get_asset_records_async(asset_keys)
+
     @traced
     def get_event_tags_for_asset(
         self,
@@ -2245,15 +2361,73 @@ def store_event(self, event: "EventLogEntry") -> None:
         self._event_storage.store_event(event)
 
     def handle_new_event(self, event: "EventLogEntry") -> None:
-        run_id = event.run_id
+        event_writer = self._get_event_writer(event.run_id)
+        if event_writer is not None and event_writer.write(event):
+            return
 
-        self._event_storage.store_event(event)
+        self._handle_new_events([event])
+
+    def _handle_new_events(self, events: Sequence["EventLogEntry"]) -> None:
+        if len(events) == 1:
+            self._event_storage.store_event(events[0])
+        else:
+            self._event_storage.store_events(events)
+
+        for event in events:
+            if event.is_dagster_event and event.get_dagster_event().is_job_event:
+                self._run_storage.handle_run_event(event.run_id, event.get_dagster_event())
+
+            for sub in self._subscribers[event.run_id]:
+                sub(event)
 
-        if event.is_dagster_event and event.get_dagster_event().is_job_event:
-            self._run_storage.handle_run_event(run_id, event.get_dagster_event())
+    def _get_event_writer(self, run_id: str) -> Optional["BufferedEventLogWriter"]:
+        if getattr(self._event_writer_local, "run_id", None) != run_id:
+            return None
+        return self._event_writer_local.writer
+
+    @contextmanager
+    def buffered_event_writes(
+        self,
+        run_id: str,
+        flush_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+    ) -> Iterator[None]:
+        """Context manager within which events for the given run, handled by this instance on the
+        current thread, are written to the event log in batches using `EventLogStorage.store_events`.
+        Events for other runs, or handled on other threads, are written immediately.
+
+        Buffering is only applied if enabled via the `event_log_buffer` instance setting (or if an
+        explicit `flush_size` is passed). Run status events and asset events are always written
+        immediately, along with any events buffered before them. Buffered events are not visible
+        to readers of the event log until they are flushed, which happens once `flush_size` events
+        have been buffered, every `flush_interval` seconds, and when the context manager exits.
+        """
+        from dagster._core.storage.event_log.buffered_writer import BufferedEventLogWriter
 
-        for sub in self._subscribers[run_id]:
-            sub(event)
+        check.str_param(run_id, "run_id")
+        if getattr(self._event_writer_local, "writer", None) is not None or (
+            flush_size is None and not self.event_log_buffer_enabled
+        ):
+            yield
+            return
+
+        event_writer = BufferedEventLogWriter(
+            self._handle_new_events,
+            flush_size=flush_size if flush_size is not None else self.event_log_buffer_flush_size,
+            flush_interval=(
+                flush_interval
+                if flush_interval is not None
+                else self.event_log_buffer_flush_interval_seconds
+            ),
+        )
+        self._event_writer_local.run_id = run_id
+        self._event_writer_local.writer = event_writer
+        try:
+            yield
+        finally:
+            self._event_writer_local.run_id = None
+            self._event_writer_local.writer = None
+            event_writer.close()
 
     def add_event_listener(self, run_id: str, cb) -> None:
         self._subscribers[run_id].append(cb)
@@ -335,6 +335,21 @@ def dagster_instance_config_schema() -> Mapping[str, Field]:
                 "free_slots_after_run_end_seconds": Field(int, is_required=False),
             },
         ),
+        "event_log_buffer": Field(
+            {
+                "enabled": Field(Bool, is_required=False),
+                "flush_size": Field(int, is_required=False),
+                "flush_interval_seconds": Field(float, is_required=False),
+            },
+            is_required=False,
+        ),
+        "compact_encoding": Field(
+            {
+                "event_log_storage": Field(Bool, is_required=False),
+                "run_storage": Field(Bool, is_required=False),
+            },
+            is_required=False,
+        ),
         "run_retries": Field(
             {
                 "enabled": Field(bool, is_required=False, default_value=False),
@@ -359,6 +374,15 @@ def dagster_instance_config_schema() -> Mapping[str, Field]:
                 "minimum_interval_seconds": Field(int, is_required=False),
                 "run_tags": Field(dict, is_required=False),
                 "respect_materialization_data_versions": Field(Bool, is_required=False),
+                "use_threads": Field(Bool, is_required=False, default_value=False),
+                "num_workers": Field(
+                    int,
+                    is_required=False,
+                    description=(
+                        "How many threads to use to evaluate independent groups of assets in"
+                        " parallel"
+                    ),
+                ),
             }
         ),
     }
@@ -449,6 +449,8 @@ def from_dir(
             "telemetry",
             "python_logs",
             "run_monitoring",
+            "event_log_buffer",
+            "compact_encoding",
             "run_retries",
             "code_servers",
             "retention",
@@ -0,0 +1,51 @@
+"""Support for the async variants of the storage read APIs (e.g.
+`EventLogStorage.get_records_for_run_async`), which let async callers such as the webserver's
+GraphQL subscriptions read from storage without blocking their event loop.
+
+By default, the async variants run the corresponding synchronous read on a dedicated thread pool,
+so that slow storage reads can't exhaust the thread pool shared by the webserver's other requests.
+Storages backed by an async database driver can override them with native implementations.
+"""
+
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Optional, TypeVar
+
+from typing_extensions import ParamSpec
+
+from dagster._core.utils import InheritContextThreadPoolExecutor
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+# number of threads used to run synchronous storage reads for async callers
+DEFAULT_STORAGE_READ_THREADS = 8
+
+_STORAGE_READ_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_STORAGE_READ_EXECUTOR_LOCK = threading.Lock()
+
+
+def get_storage_read_threads() -> int:
+    return int(os.getenv("DAGSTER_STORAGE_READ_THREADS", str(DEFAULT_STORAGE_READ_THREADS)))
+
+
+def get_storage_read_executor() -> ThreadPoolExecutor:
+    """Returns the process-wide thread pool that synchronous storage reads are run on."""
+    global _STORAGE_READ_EXECUTOR  # noqa: PLW0603
+
+    with _STORAGE_READ_EXECUTOR_LOCK:
+        if _STORAGE_READ_EXECUTOR is None:
+            _STORAGE_READ_EXECUTOR = InheritContextThreadPoolExecutor(
+                max_workers=get_storage_read_threads(),
+                thread_name_prefix="dagster_storage_read",
+            )
+        return _STORAGE_READ_EXECUTOR
+
+
+async def run_storage_read(fn: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+    """Runs a synchronous storage read on the storage read thread pool and awaits its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_storage_read_executor(), partial(fn, *args, **kwargs))
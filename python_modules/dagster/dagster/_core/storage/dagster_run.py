@@ -20,7 +20,7 @@
 from dagster._core.definitions.asset_check_spec import AssetCheckKey
 from dagster._core.definitions.events import AssetKey
 from dagster._core.origin import JobPythonOrigin
-from dagster._core.storage.tags import PARENT_RUN_ID_TAG, ROOT_RUN_ID_TAG
+from dagster._core.storage.tags import PARENT_RUN_ID_TAG, PRIORITY_TAG, ROOT_RUN_ID_TAG
 from dagster._core.utils import make_new_run_id
 from dagster._serdes.serdes import (
     NamedTupleSerializer,
@@ -581,6 +581,91 @@ def __new__(
         )
 
 
+def get_run_priority(tags: Mapping[str, str]) -> int:
+    """The priority of a run in the run queue, as set by its `dagster/priority` tag."""
+    try:
+        return int(tags.get(PRIORITY_TAG, "0"))
+    except ValueError:
+        return 0
+
+
+class RunQueueEntry(
+    NamedTuple(
+        "_RunQueueEntry",
+        [
+            ("run_id", str),
+            ("priority", int),
+            ("tags", Mapping[str, str]),
+            ("location_name", Optional[str]),
+            ("create_timestamp", datetime),
+        ],
+    )
+):
+    """Lightweight representation of a run in the run queue, containing just the fields needed to
+    decide which runs to dequeue without loading the full run body from storage.
+
+    Users should not invoke this class directly.
+    """
+
+    def __new__(
+        cls,
+        run_id: str,
+        priority: int,
+        tags: Mapping[str, str],
+        location_name: Optional[str],
+        create_timestamp: datetime,
+    ):
+        return super(RunQueueEntry, cls).__new__(
+            cls,
+            run_id=check.str_param(run_id, "run_id"),
+            priority=check.int_param(priority, "priority"),
+            tags=check.mapping_param(tags, "tags", key_type=str, value_type=str),
+            location_name=check.opt_str_param(location_name, "location_name"),
+            create_timestamp=check.inst_param(create_timestamp, "create_timestamp", datetime),
+        )
+
+    @staticmethod
+    def from_storage_tags(
+        run_id: str, storage_tags: Mapping[str, str], create_timestamp: datetime
+    ) -> "RunQueueEntry":
+        """Builds an entry from the tags stored for the run in the run_tags table, which include
+        the repository label tag added by `DagsterRun.tags_for_storage`.
+        """
+        tags = {key: value for key, value in storage_tags.items() if key != REPOSITORY_LABEL_TAG}
+        repository_label = storage_tags.get(REPOSITORY_LABEL_TAG)
+        return RunQueueEntry(
+            run_id=run_id,
+            priority=get_run_priority(tags),
+            tags=tags,
+            location_name=(
+                repository_label.split("@", 1)[1]
+                if repository_label and "@" in repository_label
+                else None
+            ),
+            create_timestamp=create_timestamp,
+        )
+
+    @staticmethod
+    def from_run_record(run_record: RunRecord) -> "RunQueueEntry":
+        run = run_record.dagster_run
+        return RunQueueEntry(
+            run_id=run.run_id,
+            priority=get_run_priority(run.tags),
+            tags=run.tags,
+            location_name=(
+                run.external_job_origin.location_name if run.external_job_origin else None
+            ),
+            create_timestamp=run_record.create_timestamp,
+        )
+
+
+def sort_run_queue_entries(entries: Sequence[RunQueueEntry]) -> Sequence[RunQueueEntry]:
+    """Sorts run queue entries, given in the order in which they were submitted, by descending
+    priority. The sort is stable, so runs with the same priority stay in FIFO order.
+    """
+    return sorted(entries, key=lambda entry: entry.priority, reverse=True)
+
+
 @whitelist_for_serdes
 class RunPartitionData(
     NamedTuple(
@@ -4,7 +4,10 @@
     EventLogStorage as EventLogStorage,
 )
 from .in_memory import InMemoryEventLogStorage as InMemoryEventLogStorage
-from .polling_event_watcher import SqlPollingEventWatcher as SqlPollingEventWatcher
+from .polling_event_watcher import (
+    SqlMultiplexedPollingEventWatcher as SqlMultiplexedPollingEventWatcher,
+    SqlPollingEventWatcher as SqlPollingEventWatcher,
+)
 from .schema import (
     AssetKeyTable as AssetKeyTable,
     DynamicPartitionsTable as DynamicPartitionsTable,
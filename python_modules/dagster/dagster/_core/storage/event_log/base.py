@@ -32,6 +32,7 @@
 )
 from dagster._core.instance import MayHaveInstanceWeakref, T_DagsterInstance
 from dagster._core.storage.asset_check_execution_record import AssetCheckExecutionRecord
+from dagster._core.storage.async_reads import run_storage_read
 from dagster._core.storage.dagster_run import DagsterRunStatsSnapshot
 from dagster._core.storage.sql import AlembicVersion
 from dagster._utils import PrintFn
@@ -160,6 +161,19 @@ def get_records_for_run(
             limit (Optional[int]): Max number of records to return.
         """
 
+    async def get_records_for_run_async(
+        self,
+        run_id: str,
+        cursor: Optional[str] = None,
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = None,
+        limit: Optional[int] = None,
+        ascending: bool = True,
+    ) -> EventLogConnection:
+        """Async variant of `get_records_for_run`, see `dagster._core.storage.async_reads`."""
+        return await run_storage_read(
+            self.get_records_for_run, run_id, cursor, of_type, limit, ascending
+        )
+
     def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
         """Get a summary of events that have ocurred in a run."""
         return build_run_stats_from_events(run_id, self.get_logs_for_run(run_id))
@@ -186,6 +200,18 @@ def store_event(self, event: "EventLogEntry") -> None:
             event (EventLogEntry): The event to store.
         """
 
+    def store_events(self, events: Sequence["EventLogEntry"]) -> None:
+        """Store a batch of events corresponding to one or more runs.
+
+        Storages that can write multiple events more efficiently than one at a time should
+        override this method.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store, in the order they occurred.
+        """
+        for event in events:
+            self.store_event(event)
+
     @abstractmethod
     def delete_events(self, run_id: str) -> None:
         """Remove events for a given run id."""
@@ -266,6 +292,12 @@ def get_asset_records(
     ) -> Sequence[AssetRecord]:
         pass
 
+    async def get_asset_records_async(
+        self, asset_keys: Optional[Sequence[AssetKey]] = None
+    ) -> Sequence[AssetRecord]:
+        """Async variant of `get_asset_records`, see `dagster._core.storage.async_reads`."""
+        return await run_storage_read(self.get_asset_records, asset_keys)
+
     @abstractmethod
     def has_asset_key(self, asset_key: AssetKey) -> bool:
         pass
@@ -482,6 +514,18 @@ def fetch_materializations(
     ) -> EventRecordsResult:
         raise NotImplementedError()
 
+    async def fetch_materializations_async(
+        self,
+        records_filter: Union[AssetKey, AssetRecordsFilter],
+        limit: int,
+        cursor: Optional[str] = None,
+        ascending: bool = False,
+    ) -> EventRecordsResult:
+        """Async variant of `fetch_materializations`, see `dagster._core.storage.async_reads`."""
+        return await run_storage_read(
+            self.fetch_materializations, records_filter, limit, cursor, ascending
+        )
+
     @abstractmethod
     def fetch_observations(
         self,
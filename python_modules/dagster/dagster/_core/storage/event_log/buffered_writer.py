@@ -0,0 +1,124 @@
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, List, Optional, Sequence
+
+import dagster._check as check
+from dagster._core.events import ASSET_CHECK_EVENTS, ASSET_EVENTS
+
+if TYPE_CHECKING:
+    from dagster._core.events.log import EventLogEntry
+
+DEFAULT_EVENT_BUFFER_FLUSH_SIZE = 100
+DEFAULT_EVENT_BUFFER_FLUSH_INTERVAL_SECONDS = 1.0
+
+
+def _requires_immediate_write(event: "EventLogEntry") -> bool:
+    # Run status changes are reflected in run storage and asset events may be read back by the
+    # step that produced them (e.g. when computing data provenance), so these are never held in the
+    # buffer.
+    if not event.is_dagster_event:
+        return False
+
+    dagster_event = event.get_dagster_event()
+    return (
+        dagster_event.is_job_event
+        or dagster_event.event_type in ASSET_EVENTS
+        or dagster_event.event_type in ASSET_CHECK_EVENTS
+    )
+
+
+class BufferedEventLogWriter:
+    """Accumulates events in memory and hands them off in batches to `write_fn`.
+
+    The buffer is flushed once it holds `flush_size` events, whenever an event that must be visible
+    immediately is added, and when the writer is closed. A background thread also flushes the
+    buffer every `flush_interval` seconds, so that events are not held indefinitely while no new
+    events are being written (e.g. during a long-running step). Events are always written in the
+    order they were added.
+
+    If a flush on the background thread fails, the error is raised from the next call to `write`,
+    `flush` or `close`.
+    """
+
+    def __init__(
+        self,
+        write_fn: Callable[[Sequence["EventLogEntry"]], None],
+        flush_size: int = DEFAULT_EVENT_BUFFER_FLUSH_SIZE,
+        flush_interval: float = DEFAULT_EVENT_BUFFER_FLUSH_INTERVAL_SECONDS,
+    ):
+        self._write_fn = check.callable_param(write_fn, "write_fn")
+        self._flush_size = check.int_param(flush_size, "flush_size")
+        check.invariant(self._flush_size > 0, "flush_size must be positive")
+        self._flush_interval = check.numeric_param(flush_interval, "flush_interval")
+        check.invariant(self._flush_interval > 0, "flush_interval must be positive")
+
+        self._lock = threading.RLock()
+        self._buffer: List["EventLogEntry"] = []
+        self._last_flush = time.monotonic()
+        self._closed = False
+        self._background_error: Optional[Exception] = None
+
+        self._shutdown_event = threading.Event()
+        self._flush_thread = threading.Thread(
+            target=self._flush_periodically, name="event-log-buffer-flush", daemon=True
+        )
+        self._flush_thread.start()
+
+    @property
+    def is_closed(self) -> bool:
+        return self._closed
+
+    def _flush_periodically(self) -> None:
+        while not self._shutdown_event.wait(self._flush_interval):
+            with self._lock:
+                if self._closed or self._background_error is not None:
+                    return
+                if time.monotonic() - self._last_flush < self._flush_interval:
+                    continue
+                try:
+                    self._flush()
+                except Exception as e:
+                    self._background_error = e
+                    return
+
+    def _raise_background_error(self) -> None:
+        if self._background_error is not None:
+            error = self._background_error
+            self._background_error = None
+            raise error
+
+    def write(self, event: "EventLogEntry") -> bool:
+        """Adds an event to the buffer, flushing if needed. Returns False if the writer has already
+        been closed, in which case the caller is responsible for writing the event.
+        """
+        with self._lock:
+            if self._closed:
+                return False
+
+            self._buffer.append(event)
+            if len(self._buffer) >= self._flush_size or _requires_immediate_write(event):
+                self._flush()
+            self._raise_background_error()
+            return True
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush()
+            self._raise_background_error()
+
+    def _flush(self) -> None:
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+
+        events = self._buffer
+        self._buffer = []
+        self._write_fn(events)
+
+    def close(self) -> None:
+        self._shutdown_event.set()
+        with self._lock:
+            self._closed = True
+            self.flush()
+        if self._flush_thread is not threading.current_thread():
+            self._flush_thread.join()
@@ -1,10 +1,24 @@
+import logging
 import threading
-from typing import Callable, List, MutableMapping, NamedTuple, Optional
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    List,
+    MutableMapping,
+    NamedTuple,
+    Optional,
+    cast,
+)
 
 import dagster._check as check
+from dagster._core.errors import DagsterEventLogInvalidForRun
 from dagster._core.events.log import EventLogEntry
 from dagster._core.storage.event_log.base import EventLogCursor, EventLogStorage
 
+if TYPE_CHECKING:
+    from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
+
 INIT_POLL_PERIOD = 0.250  # 250ms
 MAX_POLL_PERIOD = 16.0  # 16s
 
@@ -171,3 +185,167 @@ def run(self):
                                 str(EventLogCursor.from_storage_id(event_record.storage_id)),
                             )
             wait_time = INIT_POLL_PERIOD if conn.records else min(wait_time * 2, MAX_POLL_PERIOD)
+
+
+class _WatchCallback:
+    """A callback watching a run, along with the storage id of the last event it was called with
+    (or None if it should be called with all of the run's events).
+    """
+
+    def __init__(self, callback: Callable[[EventLogEntry, str], None], storage_id: Optional[int]):
+        self.callback = callback
+        self.storage_id = storage_id
+
+
+class SqlMultiplexedPollingEventWatcher:
+    """Event Log Watcher that polls for new events of all watched runs from a single thread.
+
+    Unlike SqlPollingEventWatcher, which polls the event log once per watched run, each poll fetches
+    the new events of every watched run with a single query, so the load on the database does not
+    grow with the number of watched runs. Requires an event log storage that is not run-sharded.
+
+    Each callback is called with every event of its run after the cursor it was registered with,
+    including events stored before it was registered.
+
+    LOCKING INFO:
+        INVARIANTS: _lock protects _callbacks_by_run_id. Callbacks are called without holding it.
+    """
+
+    def __init__(self, event_log_storage: "SqlEventLogStorage"):
+        from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
+
+        self._event_log_storage = check.inst_param(
+            event_log_storage, "event_log_storage", SqlEventLogStorage
+        )
+        check.invariant(
+            not event_log_storage.is_run_sharded,
+            "SqlMultiplexedPollingEventWatcher requires an event log storage that is not run-sharded",
+        )
+        self._lock = threading.Lock()
+        self._callbacks_by_run_id: Dict[str, List[_WatchCallback]] = {}
+        self._thread: Optional[threading.Thread] = None
+        # set to poll immediately, e.g. when a run is added or the watcher is closed
+        self._wake = threading.Event()
+        self._should_thread_exit = threading.Event()
+        self._disposed = False
+
+    def has_run_id(self, run_id: str) -> bool:
+        run_id = check.str_param(run_id, "run_id")
+        with self._lock:
+            return run_id in self._callbacks_by_run_id
+
+    def watch_run(
+        self, run_id: str, cursor: Optional[str], callback: Callable[[EventLogEntry, str], None]
+    ):
+        run_id = check.str_param(run_id, "run_id")
+        cursor = check.opt_str_param(cursor, "cursor")
+        callback = check.callable_param(callback, "callback")
+        storage_id = EventLogCursor.parse(cursor).storage_id() if cursor else None
+        with self._lock:
+            if self._disposed:
+                return
+            self._callbacks_by_run_id.setdefault(run_id, []).append(
+                _WatchCallback(callback, storage_id)
+            )
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="sql-event-watch-multiplexed", daemon=True
+                )
+                self._thread.start()
+        self._wake.set()
+
+    def unwatch_run(self, run_id: str, handler: Callable[[EventLogEntry, str], None]):
+        run_id = check.str_param(run_id, "run_id")
+        handler = check.callable_param(handler, "handler")
+        with self._lock:
+            if run_id in self._callbacks_by_run_id:
+                callbacks = [
+                    watch_callback
+                    for watch_callback in self._callbacks_by_run_id[run_id]
+                    if watch_callback.callback != handler
+                ]
+                if callbacks:
+                    self._callbacks_by_run_id[run_id] = callbacks
+                else:
+                    del self._callbacks_by_run_id[run_id]
+
+    def __del__(self):
+        self.close()
+
+    def close(self):
+        if not self._disposed:
+            with self._lock:
+                self._disposed = True
+                self._callbacks_by_run_id = {}
+                thread = self._thread
+            self._should_thread_exit.set()
+            self._wake.set()
+            if thread and thread is not threading.current_thread():
+                thread.join()
+
+    def _poll(self) -> bool:
+        """Fetches the new events of all watched runs and calls their callbacks. Returns whether
+        any new events were found.
+        """
+        with self._lock:
+            callbacks_by_run_id = {
+                run_id: list(callbacks) for run_id, callbacks in self._callbacks_by_run_id.items()
+            }
+
+        if not callbacks_by_run_id:
+            return False
+
+        # fetch each run's events after the earliest cursor of its callbacks
+        storage_id_by_run_id: Dict[str, Optional[int]] = {}
+        for run_id, callbacks in callbacks_by_run_id.items():
+            storage_ids = [watch_callback.storage_id for watch_callback in callbacks]
+            storage_id_by_run_id[run_id] = (
+                None if None in storage_ids else min(cast(List[int], storage_ids))
+            )
+
+        try:
+            records = self._event_log_storage._get_records_for_runs_after_storage_ids(  # noqa: SLF001
+                storage_id_by_run_id
+            )
+        except DagsterEventLogInvalidForRun as err:
+            # stop watching the run with invalid events, so that the other runs can still be watched
+            logging.exception(f"Stopped watching run {err.run_id} due to invalid events")
+            with self._lock:
+                self._callbacks_by_run_id.pop(err.run_id, None)
+            return False
+
+        for record in records:
+            if self._should_thread_exit.is_set():
+                break
+            for watch_callback in callbacks_by_run_id.get(record.event_log_entry.run_id, []):
+                if watch_callback.storage_id is None or watch_callback.storage_id < record.storage_id:
+                    watch_callback.storage_id = record.storage_id
+                    watch_callback.callback(
+                        record.event_log_entry,
+                        str(EventLogCursor.from_storage_id(record.storage_id)),
+                    )
+
+        return bool(records)
+
+    def _run(self):
+        """Polls for new events every INIT_POLL_PERIOD, backing off up to MAX_POLL_PERIOD while none
+        of the watched runs have new events.
+        """
+        wait_time = INIT_POLL_PERIOD
+        while True:
+            woken = self._wake.wait(wait_time)
+            self._wake.clear()
+            if self._should_thread_exit.is_set():
+                return
+
+            try:
+                has_new_records = self._poll()
+            except Exception:
+                logging.exception("Error polling the event log for new events of watched runs")
+                has_new_records = False
+
+            wait_time = (
+                INIT_POLL_PERIOD
+                if has_new_records or woken
+                else min(wait_time * 2, MAX_POLL_PERIOD)
+            )
@@ -3,6 +3,7 @@
 from abc import abstractmethod
 from collections import OrderedDict, defaultdict
 from datetime import datetime
+from itertools import groupby
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -69,6 +70,7 @@
     deserialize_value,
     serialize_value,
 )
+from dagster._serdes.compact import compact_encode
 from dagster._serdes.errors import DeserializationError
 from dagster._utils import (
     PrintFn,
@@ -174,6 +176,15 @@ def prepare_insert_event(self, event):
         the `dagster-postgres` implementation which overrides the generic SQL implementation of
         `store_event`.
         """
+        return SqlEventLogStorageTable.insert().values(**self._get_event_insert_values(event))
+
+    def _serialize_event_body(self, event: EventLogEntry) -> str:
+        serialized_event = serialize_value(event)
+        if self.has_instance and self._instance.event_log_compact_encoding_enabled:
+            return compact_encode(serialized_event)
+        return serialized_event
+
+    def _get_event_insert_values(self, event: EventLogEntry) -> Dict[str, Any]:
         dagster_event_type = None
         asset_key_str = None
         partition = None
@@ -188,9 +199,9 @@ def prepare_insert_event(self, event):
                 partition = event.dagster_event.partition
 
         # https://stackoverflow.com/a/54386260/324449
-        return SqlEventLogStorageTable.insert().values(
+        return dict(
             run_id=event.run_id,
-            event=serialize_value(event),
+            event=self._serialize_event_body(event),
             dagster_event_type=dagster_event_type,
             # Postgres requires a datetime that is in UTC but has no timezone info set
             # in order to be stored correctly
@@ -380,12 +391,7 @@ def store_asset_event_tags(self, event: EventLogEntry, event_id: int) -> None:
         check.int_param(event_id, "event_id")
 
         if event.dagster_event and event.dagster_event.asset_key:
-            if event.dagster_event.is_step_materialization:
-                tags = event.dagster_event.step_materialization_data.materialization.tags
-            elif event.dagster_event.is_asset_observation:
-                tags = event.dagster_event.asset_observation_data.asset_observation.tags
-            else:
-                tags = None
+            tags = self._get_asset_event_tags(event)
 
             if not tags or not self.has_table(AssetEventTagsTable.name):
                 # If tags table does not exist, silently exit. This is to support OSS
@@ -393,26 +399,43 @@ def store_asset_event_tags(self, event: EventLogEntry, event_id: int) -> None:
                 # On read, we will throw an error if the table does not exist.
                 return
 
-            check.inst_param(event.dagster_event.asset_key, "asset_key", AssetKey)
-            asset_key_str = event.dagster_event.asset_key.to_string()
-
             with self.index_connection() as conn:
                 conn.execute(
-                    AssetEventTagsTable.insert(),
-                    [
-                        dict(
-                            event_id=event_id,
-                            asset_key=asset_key_str,
-                            key=key,
-                            value=value,
-                            # Postgres requires a datetime that is in UTC but has no timezone info
-                            # set in order to be stored correctly
-                            event_timestamp=datetime.utcfromtimestamp(event.timestamp),
-                        )
-                        for key, value in tags.items()
-                    ],
+                    AssetEventTagsTable.insert(), self._get_asset_event_tag_rows(event, event_id)
                 )
 
+    def _get_asset_event_tags(self, event: EventLogEntry) -> Optional[Mapping[str, str]]:
+        if not (event.dagster_event and event.dagster_event.asset_key):
+            return None
+        if event.dagster_event.is_step_materialization:
+            return event.dagster_event.step_materialization_data.materialization.tags
+        if event.dagster_event.is_asset_observation:
+            return event.dagster_event.asset_observation_data.asset_observation.tags
+        return None
+
+    def _get_asset_event_tag_rows(
+        self, event: EventLogEntry, event_id: int
+    ) -> Sequence[Mapping[str, Any]]:
+        tags = self._get_asset_event_tags(event)
+        if not tags:
+            return []
+
+        asset_key = check.not_none(event.dagster_event).asset_key
+        check.inst_param(asset_key, "asset_key", AssetKey)
+        asset_key_str = check.not_none(asset_key).to_string()
+        return [
+            dict(
+                event_id=event_id,
+                asset_key=asset_key_str,
+                key=key,
+                value=value,
+                # Postgres requires a datetime that is in UTC but has no timezone info
+                # set in order to be stored correctly
+                event_timestamp=datetime.utcfromtimestamp(event.timestamp),
+            )
+            for key, value in tags.items()
+        ]
+
     def store_event(self, event: EventLogEntry) -> None:
         """Store an event corresponding to a pipeline run.
 
@@ -446,6 +469,141 @@ def store_event(self, event: EventLogEntry) -> None:
         if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
             self.store_asset_check_event(event, event_id)
 
+    def store_events(self, events: Sequence[EventLogEntry]) -> None:
+        """Store a batch of events.
+
+        Consecutive events for the same run are inserted using a single connection and
+        transaction. The asset key, asset event tag and asset check tables are updated in bulk
+        once all of the event rows have been written, in separate transactions. The batch as a
+        whole is therefore not atomic: a failure while updating the index tables can leave event
+        rows without their index rows, as with `store_event`.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store, in the order they occurred.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+
+        event_ids: List[Optional[int]] = []
+        for run_id, run_events in groupby(events, key=lambda event: event.run_id):
+            with self.run_connection(run_id) as conn:
+                event_ids.extend(self._insert_event_rows(conn, list(run_events)))
+
+        self._store_event_index_data(list(zip(events, event_ids)))
+
+    def _requires_event_id(self, event: EventLogEntry) -> bool:
+        return event.is_dagster_event and (
+            (
+                event.dagster_event_type in ASSET_EVENTS
+                and check.not_none(event.dagster_event).asset_key is not None
+            )
+            or event.dagster_event_type in ASSET_CHECK_EVENTS
+        )
+
+    def _insert_event_rows(
+        self, conn: Connection, events: Sequence[EventLogEntry]
+    ) -> Sequence[Optional[int]]:
+        """Inserts event rows using the given connection, returning the storage id of each event
+        that needs one to be written to the index tables (and None for all other events).
+
+        Events that do not need a storage id are written using multi-row inserts, while events that
+        do are inserted individually so that the generated primary key can be read back. Rows are
+        always written in order so that storage ids remain monotonic with respect to the batch.
+        """
+        event_ids: List[Optional[int]] = []
+        pending_rows: List[Mapping[str, Any]] = []
+
+        def _flush_pending_rows():
+            if pending_rows:
+                conn.execute(SqlEventLogStorageTable.insert(), pending_rows)
+                pending_rows.clear()
+
+        for event in events:
+            values = self._get_event_insert_values(event)
+            if self._requires_event_id(event):
+                _flush_pending_rows()
+                result = conn.execute(SqlEventLogStorageTable.insert().values(**values))
+                event_ids.append(result.inserted_primary_key[0])
+            else:
+                pending_rows.append(values)
+                event_ids.append(None)
+
+        _flush_pending_rows()
+        return event_ids
+
+    def _store_event_index_data(
+        self, events_with_ids: Sequence[Tuple[EventLogEntry, Optional[int]]]
+    ) -> None:
+        asset_entry_values: Dict[str, Dict[str, Any]] = OrderedDict()
+        tag_rows: List[Mapping[str, Any]] = []
+        has_asset_key_index_cols = None
+
+        for event, event_id in events_with_ids:
+            if not (
+                event.is_dagster_event
+                and event.dagster_event_type in ASSET_EVENTS
+                and check.not_none(event.dagster_event).asset_key
+            ):
+                continue
+
+            if event_id is None:
+                raise DagsterInvariantViolationError(
+                    "Cannot store asset event tags for null event id."
+                )
+
+            if has_asset_key_index_cols is None:
+                has_asset_key_index_cols = self.has_asset_key_index_cols()
+
+            # later events for the same asset key overwrite the columns set by earlier ones, which
+            # matches the end state of applying each event's update in order
+            asset_key_str = check.not_none(check.not_none(event.dagster_event).asset_key).to_string()
+            asset_entry_values.setdefault(asset_key_str, {}).update(
+                self._get_asset_entry_values(event, event_id, has_asset_key_index_cols)
+            )
+            tag_rows.extend(self._get_asset_event_tag_rows(event, event_id))
+
+        if asset_entry_values:
+            self._store_asset_entries(asset_entry_values)
+
+        if tag_rows and self.has_table(AssetEventTagsTable.name):
+            with self.index_connection() as conn:
+                conn.execute(AssetEventTagsTable.insert(), tag_rows)
+
+        for event, event_id in events_with_ids:
+            if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
+                self.store_asset_check_event(event, event_id)
+
+    def _store_asset_entries(self, values_by_asset_key: Mapping[str, Mapping[str, Any]]) -> None:
+        """Bulk upsert of rows in the asset key table, keyed by the serialized asset key."""
+        with self.index_connection() as conn:
+            existing_asset_keys = {
+                row[0]
+                for row in conn.execute(
+                    db_select([AssetKeyTable.c.asset_key]).where(
+                        AssetKeyTable.c.asset_key.in_(list(values_by_asset_key.keys()))
+                    )
+                ).fetchall()
+            }
+
+            for asset_key_str, values in values_by_asset_key.items():
+                update_statement = (
+                    AssetKeyTable.update()
+                    .values(**values)
+                    .where(AssetKeyTable.c.asset_key == asset_key_str)
+                )
+                if asset_key_str in existing_asset_keys:
+                    if values:
+                        conn.execute(update_statement)
+                    continue
+
+                try:
+                    conn.execute(
+                        AssetKeyTable.insert().values(asset_key=asset_key_str, **values)
+                    )
+                except db_exc.IntegrityError:
+                    # the row was concurrently inserted since we checked for existing keys
+                    if values:
+                        conn.execute(update_statement)
+
     def get_records_for_run(
         self,
         run_id,
@@ -539,6 +697,61 @@ def get_records_for_run(
             has_more=bool(limit and len(results) == limit),
         )
 
+    def _get_records_for_runs_after_storage_ids(
+        self, storage_id_by_run_id: Mapping[str, Optional[int]]
+    ) -> Sequence[EventLogRecord]:
+        """Fetches the records of several runs in a single query, in storage id order. For each run,
+        only records after the given storage id are returned (or all of the run's records, if the
+        storage id is None). Used by `SqlMultiplexedPollingEventWatcher`.
+        """
+        check.mapping_param(storage_id_by_run_id, "storage_id_by_run_id", key_type=str)
+        check.invariant(
+            not self.is_run_sharded,
+            "Cannot fetch the records of several runs in one query from a run-sharded storage",
+        )
+
+        if not storage_id_by_run_id:
+            return []
+
+        run_ids_from_start = [
+            run_id for run_id, storage_id in storage_id_by_run_id.items() if storage_id is None
+        ]
+        run_filters = [
+            db.and_(
+                SqlEventLogStorageTable.c.run_id == run_id,
+                SqlEventLogStorageTable.c.id > storage_id,
+            )
+            for run_id, storage_id in storage_id_by_run_id.items()
+            if storage_id is not None
+        ]
+        if run_ids_from_start:
+            run_filters.append(SqlEventLogStorageTable.c.run_id.in_(run_ids_from_start))
+
+        query = (
+            db_select(
+                [
+                    SqlEventLogStorageTable.c.id,
+                    SqlEventLogStorageTable.c.run_id,
+                    SqlEventLogStorageTable.c.event,
+                ]
+            )
+            .where(db.or_(*run_filters))
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+
+        with self.index_connection() as conn:
+            results = conn.execute(query).fetchall()
+
+        records = []
+        for record_id, run_id, json_str in results:
+            try:
+                event_log_entry = deserialize_value(json_str, EventLogEntry)
+            except (seven.JSONDecodeError, DeserializationError) as err:
+                raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+            records.append(EventLogRecord(storage_id=record_id, event_log_entry=event_log_entry))
+
+        return records
+
     def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
         check.str_param(run_id, "run_id")
 
@@ -755,7 +968,7 @@ def update_event_log_record(self, record_id: int, event: EventLogEntry) -> None:
                 SqlEventLogStorageTable.update()
                 .where(SqlEventLogStorageTable.c.id == record_id)
                 .values(
-                    event=serialize_value(event),
+                    event=self._serialize_event_body(event),
                     dagster_event_type=dagster_event_type,
                     timestamp=datetime.utcfromtimestamp(event.timestamp),
                     step_key=event.step_key,
@@ -8,6 +8,7 @@
 import time
 from collections import defaultdict
 from contextlib import contextmanager
+from itertools import groupby
 from typing import TYPE_CHECKING, Any, ContextManager, Iterator, Optional, Sequence, Union
 
 import sqlalchemy as db
@@ -273,6 +274,55 @@ def store_event(self, event: EventLogEntry) -> None:
             with self.index_connection() as conn:
                 conn.execute(insert_event_statement)
 
+    def store_events(self, events: Sequence[EventLogEntry]) -> None:
+        """Overridden method to write each run's events to its shard in a single transaction, and
+        to mirror asset and run status events into the index shard in a single transaction.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store, in the order they occurred.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+
+        for run_id, run_events in groupby(events, key=lambda event: event.run_id):
+            with self.run_connection(run_id) as conn:
+                conn.execute(
+                    SqlEventLogStorageTable.insert(),
+                    [self._get_event_insert_values(event) for event in run_events],
+                )
+
+        index_events = []
+        for event in events:
+            if not event.is_dagster_event:
+                continue
+
+            if event.dagster_event.asset_key:  # type: ignore
+                check.invariant(
+                    event.dagster_event_type in ASSET_EVENTS,
+                    "Can only store asset materializations, materialization_planned, and"
+                    " observations in index database",
+                )
+                index_events.append(event)
+            elif event.dagster_event_type in EVENT_TYPE_TO_PIPELINE_RUN_STATUS:
+                # should mirror run status change events in the index shard
+                index_events.append(event)
+
+        event_ids: Sequence[Optional[int]] = []
+        if index_events:
+            with self.index_connection() as conn:
+                event_ids = self._insert_event_rows(conn, index_events)
+
+        self._store_event_index_data(
+            [
+                *zip(index_events, event_ids),
+                # asset check events are not mirrored in the index shard, so have no storage id
+                *(
+                    (event, None)
+                    for event in events
+                    if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS
+                ),
+            ]
+        )
+
     def get_event_records(
         self,
         event_records_filter: EventRecordsFilter,
@@ -60,6 +60,7 @@
         DagsterRunStatsSnapshot,
         JobBucket,
         RunPartitionData,
+        RunQueueEntry,
         RunRecord,
         RunsFilter,
         TagBucket,
@@ -234,6 +235,9 @@ def get_run_records(
             filters, limit, order_by, ascending, cursor, bucket_by
         )
 
+    def get_run_queue_entries(self, filters: "RunsFilter") -> Sequence["RunQueueEntry"]:
+        return self._storage.run_storage.get_run_queue_entries(filters)
+
     def get_run_tags(
         self,
         tag_keys: Optional[Sequence[str]] = None,
@@ -409,6 +413,9 @@ def get_step_stats_for_run(
     def store_event(self, event: "EventLogEntry") -> None:
         return self._storage.event_log_storage.store_event(event)
 
+    def store_events(self, events: Sequence["EventLogEntry"]) -> None:
+        return self._storage.event_log_storage.store_events(events)
+
     def delete_events(self, run_id: str) -> None:
         return self._storage.event_log_storage.delete_events(run_id)
 
@@ -326,18 +326,23 @@ def build_failed_and_in_progress_partition_subset(
     failed_partitions_subset: Optional[PartitionsSubset] = None,
     after_storage_id: Optional[int] = None,
 ) -> Tuple[PartitionsSubset, PartitionsSubset, Optional[int]]:
-    failed_partitions: Set[str] = (
-        set(failed_partitions_subset.get_partition_keys()) if failed_partitions_subset else set()
-    )
-    in_progress_partitions: Set[str] = set()
-    if failed_partitions:
+    failed_subset = failed_partitions_subset or partitions_def.empty_subset()
+    if len(failed_subset) > 0:
         # These partitions were cached as having been failed.  If they have since been materialized,
-        # then we can remove them from the set of failed partitions.
+        # then we can remove them from the set of failed partitions. The subsets are combined
+        # directly, so that time window subsets don't need to be expanded into partition keys.
         materialized_partitions = instance.event_log_storage.get_materialized_partitions(
             asset_key, after_cursor=after_storage_id
         )
-        failed_partitions.difference_update(materialized_partitions)
+        if materialized_partitions:
+            failed_subset = failed_subset - partitions_def.empty_subset().with_partition_keys(
+                get_validated_partition_keys(
+                    dynamic_partitions_store, partitions_def, materialized_partitions
+                )
+            )
 
+    failed_partitions: Set[str] = set()
+    in_progress_partitions: Set[str] = set()
     incomplete_materializations = instance.event_log_storage.get_latest_asset_partition_materialization_attempts_without_materializations(
         asset_key, after_storage_id=after_storage_id
     )
@@ -366,13 +371,14 @@ def build_failed_and_in_progress_partition_subset(
 
     return (
         (
-            partitions_def.empty_subset().with_partition_keys(
+            failed_subset
+            | partitions_def.empty_subset().with_partition_keys(
                 get_validated_partition_keys(
                     dynamic_partitions_store, partitions_def, failed_partitions
                 )
             )
             if failed_partitions
-            else partitions_def.empty_subset()
+            else failed_subset
         ),
         (
             partitions_def.empty_subset().with_partition_keys(
@@ -7,13 +7,16 @@
 from dagster._core.execution.backfill import BulkActionStatus, PartitionBackfill
 from dagster._core.instance import MayHaveInstanceWeakref, T_DagsterInstance
 from dagster._core.snap import ExecutionPlanSnapshot, JobSnapshot
+from dagster._core.storage.async_reads import run_storage_read
 from dagster._core.storage.dagster_run import (
     DagsterRun,
     JobBucket,
     RunPartitionData,
+    RunQueueEntry,
     RunRecord,
     RunsFilter,
     TagBucket,
+    sort_run_queue_entries,
 )
 from dagster._core.storage.sql import AlembicVersion
 from dagster._daemon.types import DaemonHeartbeat
@@ -155,6 +158,40 @@ def get_run_records(
             List[RunRecord]: List of run records stored in the run storage.
         """
 
+    async def get_run_records_async(
+        self,
+        filters: Optional[RunsFilter] = None,
+        limit: Optional[int] = None,
+        order_by: Optional[str] = None,
+        ascending: bool = False,
+        cursor: Optional[str] = None,
+        bucket_by: Optional[Union[JobBucket, TagBucket]] = None,
+    ) -> Sequence[RunRecord]:
+        """Async variant of `get_run_records`, see `dagster._core.storage.async_reads`."""
+        return await run_storage_read(
+            self.get_run_records, filters, limit, order_by, ascending, cursor, bucket_by
+        )
+
+    def get_run_queue_entries(self, filters: RunsFilter) -> Sequence[RunQueueEntry]:
+        """Return lightweight entries for the runs matching the given filter, in the order in which
+        they should be dequeued: by descending priority, and then in the order in which they were
+        submitted.
+
+        Storages should override this to avoid loading and deserializing the full run bodies.
+
+        Args:
+            filters (RunsFilter): the filter by which to filter runs.
+
+        Returns:
+            List[RunQueueEntry]: List of run queue entries, in dequeue order.
+        """
+        return sort_run_queue_entries(
+            [
+                RunQueueEntry.from_run_record(record)
+                for record in self.get_run_records(filters=filters, order_by="id", ascending=True)
+            ]
+        )
+
     @abstractmethod
     def get_run_tags(
         self,
@@ -60,6 +60,7 @@
     deserialize_value,
     serialize_value,
 )
+from dagster._serdes.compact import compact_encode
 from dagster._seven import JSONDecodeError
 from dagster._utils import PrintFn, utc_datetime_from_timestamp
 from dagster._utils.merger import merge_dicts
@@ -69,9 +70,11 @@
     DagsterRunStatus,
     JobBucket,
     RunPartitionData,
+    RunQueueEntry,
     RunRecord,
     RunsFilter,
     TagBucket,
+    sort_run_queue_entries,
 )
 from .base import RunStorage
 from .migration import (
@@ -121,6 +124,12 @@ def fetchone(self, query: SqlAlchemyQuery) -> Optional[Any]:
             else:
                 return conn.execute(query).fetchone()
 
+    def _serialize_run_body(self, dagster_run: DagsterRun) -> str:
+        serialized_run = serialize_value(dagster_run)
+        if self.has_instance and self._instance.run_storage_compact_encoding_enabled:
+            return compact_encode(serialized_run)
+        return serialized_run
+
     def add_run(self, dagster_run: DagsterRun) -> DagsterRun:
         check.inst_param(dagster_run, "dagster_run", DagsterRun)
 
@@ -137,7 +146,7 @@ def add_run(self, dagster_run: DagsterRun) -> DagsterRun:
             run_id=dagster_run.run_id,
             pipeline_name=dagster_run.job_name,
             status=dagster_run.status.value,
-            run_body=serialize_value(dagster_run),
+            run_body=self._serialize_run_body(dagster_run),
             snapshot_id=dagster_run.job_snapshot_id,
             partition=partition,
             partition_set=partition_set,
@@ -197,7 +206,7 @@ def handle_run_event(self, run_id: str, event: DagsterEvent) -> None:
                 RunsTable.update()
                 .where(RunsTable.c.run_id == run_id)
                 .values(
-                    run_body=serialize_value(run.with_status(new_job_status)),
+                    run_body=self._serialize_run_body(run.with_status(new_job_status)),
                     status=new_job_status.value,
                     update_timestamp=now,
                     **kwargs,
@@ -410,6 +419,42 @@ def get_run_records(
             for row in rows
         ]
 
+    def get_run_queue_entries(self, filters: RunsFilter) -> Sequence[RunQueueEntry]:
+        check.inst_param(filters, "filters", RunsFilter)
+
+        # only fetch the columns and tags needed to decide which runs to dequeue, so that the run
+        # bodies of a large queue never need to be loaded and deserialized
+        rows = self.fetchall(
+            self._runs_query(
+                filters=filters,
+                columns=["run_id", "create_timestamp"],
+                order_by="id",
+                ascending=True,
+            )
+        )
+        if not rows:
+            return []
+
+        tags_by_run_id: Dict[str, Dict[str, str]] = defaultdict(dict)
+        tags_query = db_select(
+            [RunTagsTable.c.run_id, RunTagsTable.c.key, RunTagsTable.c.value]
+        ).where(
+            RunTagsTable.c.run_id.in_(self._runs_query(filters=filters, columns=["run_id"]))
+        )
+        for tag_row in self.fetchall(tags_query):
+            tags_by_run_id[tag_row["run_id"]][tag_row["key"]] = tag_row["value"]
+
+        return sort_run_queue_entries(
+            [
+                RunQueueEntry.from_storage_tags(
+                    run_id=row["run_id"],
+                    storage_tags=tags_by_run_id.get(row["run_id"], {}),
+                    create_timestamp=check.inst(row["create_timestamp"], datetime),
+                )
+                for row in rows
+            ]
+        )
+
     def get_run_tags(
         self,
         tag_keys: Optional[Sequence[str]] = None,
@@ -458,7 +503,9 @@ def add_run_tags(self, run_id: str, new_tags: Mapping[str, str]) -> None:
                 RunsTable.update()
                 .where(RunsTable.c.run_id == run_id)
                 .values(
-                    run_body=serialize_value(run.with_tags(merge_dicts(current_tags, new_tags))),
+                    run_body=self._serialize_run_body(
+                        run.with_tags(merge_dicts(current_tags, new_tags))
+                    ),
                     partition=partition,
                     partition_set=partition_set,
                     update_timestamp=pendulum.now("UTC"),
@@ -905,7 +952,7 @@ def replace_job_origin(self, run: DagsterRun, job_origin: ExternalJobOrigin) ->
                 RunsTable.update()
                 .where(RunsTable.c.run_id == run.run_id)
                 .values(
-                    run_body=serialize_value(run.with_job_origin(job_origin)),
+                    run_body=self._serialize_run_body(run.with_job_origin(job_origin)),
                 )
             )
             conn.execute(
@@ -1,8 +1,11 @@
 import logging
 import sys
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from types import TracebackType
 from typing import (
+    TYPE_CHECKING,
     Dict,
     List,
     Optional,
@@ -38,6 +41,7 @@
     AUTO_MATERIALIZE_TAG,
     AUTO_OBSERVE_TAG,
 )
+from dagster._core.utils import InheritContextThreadPoolExecutor
 from dagster._core.workspace.context import IWorkspaceProcessContext
 from dagster._core.workspace.workspace import IWorkspace
 from dagster._daemon.daemon import DaemonIterator, IntervalDaemon
@@ -48,6 +52,9 @@
 )
 from dagster._utils.error import serializable_error_info_from_exc_info
 
+if TYPE_CHECKING:
+    from dagster._utils.caching_instance_queryer import SharedQueryerCache
+
 CURSOR_KEY = "ASSET_DAEMON_CURSOR"
 ASSET_DAEMON_PAUSED_KEY = "ASSET_DAEMON_PAUSED"
 
@@ -151,6 +158,33 @@ def _write(self) -> None:
 class AssetDaemon(IntervalDaemon):
     def __init__(self, interval_seconds: int):
         super().__init__(interval_seconds=interval_seconds)
+        # asset data kept across ticks, so that each tick only needs to fetch what has changed
+        self._shared_queryer_cache: Optional["SharedQueryerCache"] = None
+        self._exit_stack = ExitStack()
+        self._evaluation_executor: Optional[ThreadPoolExecutor] = None
+
+    def _get_evaluation_executor(self, max_workers: Optional[int]) -> ThreadPoolExecutor:
+        if self._evaluation_executor is None:
+            # assumes max_workers wont change
+            self._evaluation_executor = self._exit_stack.enter_context(
+                InheritContextThreadPoolExecutor(
+                    max_workers=max_workers,
+                    thread_name_prefix="asset_daemon_evaluation_worker",
+                )
+            )
+        return self._evaluation_executor
+
+    def __exit__(self, _exception_type, _exception_value, _traceback):
+        self._evaluation_executor = None
+        self._exit_stack.close()
+        super().__exit__(_exception_type, _exception_value, _traceback)
+
+    def _get_shared_queryer_cache(self) -> "SharedQueryerCache":
+        from dagster._utils.caching_instance_queryer import SharedQueryerCache
+
+        if self._shared_queryer_cache is None:
+            self._shared_queryer_cache = SharedQueryerCache()
+        return self._shared_queryer_cache
 
     @classmethod
     def daemon_type(cls) -> str:
@@ -258,6 +292,12 @@ def _run_iteration_impl(
                 auto_observe=True,
                 respect_materialization_data_versions=instance.auto_materialize_respect_materialization_data_versions,
                 logger=self._logger,
+                shared_queryer_cache=self._get_shared_queryer_cache(),
+                evaluation_executor=(
+                    self._get_evaluation_executor(instance.auto_materialize_num_workers)
+                    if instance.auto_materialize_use_threads
+                    else None
+                ),
             ).evaluate()
 
             self._logger.info(
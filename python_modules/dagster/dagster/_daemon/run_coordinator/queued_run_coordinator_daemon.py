@@ -3,7 +3,7 @@
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import ExitStack
-from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+from typing import Dict, Iterator, List, Optional, Sequence
 
 from dagster import (
     DagsterEvent,
@@ -23,11 +23,10 @@
 )
 from dagster._core.storage.dagster_run import (
     IN_PROGRESS_RUN_STATUSES,
-    DagsterRun,
     DagsterRunStatus,
+    RunQueueEntry,
     RunsFilter,
 )
-from dagster._core.storage.tags import PRIORITY_TAG
 from dagster._core.utils import InheritContextThreadPoolExecutor
 from dagster._core.workspace.context import IWorkspaceProcessContext
 from dagster._core.workspace.workspace import IWorkspace
@@ -46,6 +45,9 @@ def __init__(self, interval_seconds) -> None:
         self._executor: Optional[ThreadPoolExecutor] = None
         self._location_timeouts_lock = threading.Lock()
         self._location_timeouts: Dict[str, float] = {}
+        # entries for the in-progress runs as of the last iteration, kept so that each iteration
+        # only needs to fetch the tags of the runs that started since the previous one
+        self._in_progress_entries: Dict[str, RunQueueEntry] = {}
         super().__init__(interval_seconds)
 
     def _get_executor(self, max_workers) -> ThreadPoolExecutor:
@@ -95,7 +97,7 @@ def _dequeue_runs_iter(
         self,
         workspace_process_context: IWorkspaceProcessContext,
         run_coordinator: QueuedRunCoordinator,
-        runs_to_dequeue: List[DagsterRun],
+        runs_to_dequeue: List[RunQueueEntry],
         run_queue_config: RunQueueConfig,
         fixed_iteration_time: Optional[float],
     ) -> Iterator[None]:
@@ -118,7 +120,7 @@ def _dequeue_runs_iter(
     def _dequeue_run_thread(
         self,
         workspace_process_context: IWorkspaceProcessContext,
-        run: DagsterRun,
+        run: RunQueueEntry,
         run_queue_config: RunQueueConfig,
         fixed_iteration_time: Optional[float],
     ) -> bool:
@@ -133,7 +135,7 @@ def _dequeue_run_thread(
     def _dequeue_runs_iter_threaded(
         self,
         workspace_process_context: IWorkspaceProcessContext,
-        runs_to_dequeue: List[DagsterRun],
+        runs_to_dequeue: List[RunQueueEntry],
         max_workers: Optional[int],
         run_queue_config: RunQueueConfig,
         fixed_iteration_time: Optional[float],
@@ -161,7 +163,7 @@ def _dequeue_runs_iter_threaded(
     def _dequeue_runs_iter_loop(
         self,
         workspace_process_context: IWorkspaceProcessContext,
-        runs_to_dequeue: List[DagsterRun],
+        runs_to_dequeue: List[RunQueueEntry],
         run_queue_config: RunQueueConfig,
         fixed_iteration_time: Optional[float],
     ) -> Iterator[None]:
@@ -186,14 +188,14 @@ def _get_runs_to_dequeue(
         instance: DagsterInstance,
         run_queue_config: RunQueueConfig,
         fixed_iteration_time: Optional[float],
-    ) -> List[DagsterRun]:
+    ) -> List[RunQueueEntry]:
         if not isinstance(instance.run_coordinator, QueuedRunCoordinator):
             check.failed(f"Expected QueuedRunCoordinator, got {instance.run_coordinator}")
 
         max_concurrent_runs = run_queue_config.max_concurrent_runs
         tag_concurrency_limits = run_queue_config.tag_concurrency_limits
 
-        in_progress_runs = self._get_in_progress_runs(instance)
+        in_progress_runs = self._get_in_progress_run_entries(instance)
 
         max_concurrent_runs_enabled = max_concurrent_runs != -1  # setting to -1 disables the limit
         max_runs_to_launch = max_concurrent_runs - len(in_progress_runs)
@@ -207,7 +209,10 @@ def _get_runs_to_dequeue(
                 )
                 return []
 
-        queued_runs = self._get_queued_runs(instance)
+        # already in dequeue order
+        queued_runs = instance.get_run_queue_entries(
+            RunsFilter(statuses=[DagsterRunStatus.QUEUED])
+        )
 
         if not queued_runs:
             self._logger.debug("Poll returned no queued runs.")
@@ -234,24 +239,19 @@ def _get_runs_to_dequeue(
             len(queued_runs),
         )
 
-        # place in order
-        sorted_runs = self._priority_sort(queued_runs)
         tag_concurrency_limits_counter = TagConcurrencyLimitsCounter(
             tag_concurrency_limits, in_progress_runs
         )
 
-        batch: List[DagsterRun] = []
-        for run in sorted_runs:
+        batch: List[RunQueueEntry] = []
+        for run in queued_runs:
             if max_concurrent_runs_enabled and len(batch) >= max_runs_to_launch:
                 break
 
             if tag_concurrency_limits_counter.is_blocked(run):
                 continue
 
-            location_name = (
-                run.external_job_origin.location_name if run.external_job_origin else None
-            )
-            if location_name and location_name in paused_location_names:
+            if run.location_name and run.location_name in paused_location_names:
                 continue
 
             tag_concurrency_limits_counter.update_counters_with_launched_item(run)
@@ -259,26 +259,28 @@ def _get_runs_to_dequeue(
 
         return batch
 
-    def _get_queued_runs(self, instance: DagsterInstance) -> Sequence[DagsterRun]:
-        queued_runs_filter = RunsFilter(statuses=[DagsterRunStatus.QUEUED])
-
-        # Reversed for fifo ordering
-        runs = instance.get_runs(filters=queued_runs_filter)[::-1]
-        return runs
-
-    def _get_in_progress_runs(self, instance: DagsterInstance) -> Sequence[DagsterRun]:
-        return instance.get_runs(filters=RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES))
+    def _get_in_progress_run_entries(self, instance: DagsterInstance) -> List[RunQueueEntry]:
+        """Returns the entries for the in-progress runs, reusing the entries fetched in previous
+        iterations for runs that are still in progress.
+        """
+        in_progress_run_ids = instance.get_run_ids(
+            filters=RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES)
+        )
 
-    def _priority_sort(self, runs: Iterable[DagsterRun]) -> Sequence[DagsterRun]:
-        def get_priority(run: DagsterRun) -> int:
-            priority_tag_value = run.tags.get(PRIORITY_TAG, "0")
-            try:
-                return int(priority_tag_value)
-            except ValueError:
-                return 0
+        entries_by_run_id = {
+            run_id: self._in_progress_entries[run_id]
+            for run_id in in_progress_run_ids
+            if run_id in self._in_progress_entries
+        }
+        new_run_ids = [run_id for run_id in in_progress_run_ids if run_id not in entries_by_run_id]
+        if new_run_ids:
+            for entry in instance.get_run_queue_entries(
+                RunsFilter(run_ids=new_run_ids, statuses=IN_PROGRESS_RUN_STATUSES)
+            ):
+                entries_by_run_id[entry.run_id] = entry
 
-        # sorted is stable, so fifo is maintained
-        return sorted(runs, key=get_priority, reverse=True)
+        self._in_progress_entries = entries_by_run_id
+        return list(entries_by_run_id.values())
 
     def _is_location_pausing_dequeues(self, location_name: str, now: float) -> bool:
         with self._location_timeouts_lock:
@@ -291,12 +293,12 @@ def _dequeue_run(
         self,
         instance: DagsterInstance,
         workspace: IWorkspace,
-        run: DagsterRun,
+        run_entry: RunQueueEntry,
         run_queue_config: RunQueueConfig,
         fixed_iteration_time: Optional[float],
     ) -> bool:
         # double check that the run is still queued before dequeing
-        run = check.not_none(instance.get_run_by_id(run.run_id))
+        run = check.not_none(instance.get_run_by_id(run_entry.run_id))
 
         now = fixed_iteration_time or time.time()
 
@@ -43,11 +43,17 @@
     b' \x01(\t"\x19\n\x17ListRepositoriesRequest"O\n\x15ListRepositoriesReply\x12\x36\n.serialized_list_repositories_response_or_error\x18\x01'
     b' \x01(\t"Y\n%ExternalPipelineSubsetSnapshotRequest\x12\x30\n(serialized_pipeline_subset_snapshot_args\x18\x01'
     b' \x01(\t"Y\n#ExternalPipelineSubsetSnapshotReply\x12\x32\n*serialized_external_pipeline_subset_result\x18\x01'
-    b' \x01(\t"a\n\x19\x45xternalRepositoryRequest\x12+\n#serialized_repository_python_origin\x18\x01'
+    b' \x01(\t"\xa5\x01\n\x19\x45xternalRepositoryRequest\x12+\n#serialized_repository_python_origin\x18\x01'
     b" \x01(\t\x12\x17\n\x0f\x64\x65\x66\x65r_snapshots\x18\x02"
-    b' \x01(\x08"F\n\x17\x45xternalRepositoryReply\x12+\n#serialized_external_repository_data\x18\x01'
-    b' \x01(\t"i\n StreamingExternalRepositoryEvent\x12\x17\n\x0fsequence_number\x18\x01'
-    b' \x01(\x05\x12,\n$serialized_external_repository_chunk\x18\x02 \x01(\t"W\n'
+    b" \x01(\x08\x12\x1d\n\x15stream_snapshot_parts\x18\x03"
+    b" \x01(\x08\x12#\n\x1b\x61\x63\x63\x65pted_compression_codecs\x18\x04"
+    b' \x03(\t"F\n\x17\x45xternalRepositoryReply\x12+\n#serialized_external_repository_data\x18\x01'
+    b' \x01(\t"\xb9\x01\n StreamingExternalRepositoryEvent\x12\x17\n\x0fsequence_number\x18\x01'
+    b" \x01(\x05\x12,\n$serialized_external_repository_chunk\x18\x02"
+    b" \x01(\t\x12\x1c\n\x14snapshot_parts_chunk\x18\x03"
+    b" \x01(\x0c\x12\x19\n\x11\x63ompression_codec\x18\x04 \x01(\t\x12\x15\n\rsnapshot_hash\x18\x05"
+    b' \x01(\t"Q\n\x1eGetRepositorySnapshotHashReply\x12\x15\n\rsnapshot_hash\x18\x01'
+    b' \x01(\t\x12\x18\n\x10serialized_error\x18\x02 \x01(\t"W\n'
     b" ExternalScheduleExecutionRequest\x12\x33\n+serialized_external_schedule_execution_args\x18\x01"
     b' \x01(\t"S\n\x1e\x45xternalSensorExecutionRequest\x12\x31\n)serialized_external_sensor_execution_args\x18\x01'
     b' \x01(\t"H\n\x13StreamingChunkEvent\x12\x17\n\x0fsequence_number\x18\x01'
@@ -66,9 +72,9 @@
     b' \x01(\t"I\n\x10\x45xternalJobReply\x12\x1b\n\x13serialized_job_data\x18\x01'
     b" \x01(\t\x12\x18\n\x10serialized_error\x18\x02"
     b' \x01(\t"\x13\n\x11ReloadCodeRequest"+\n\x0fReloadCodeReply\x12\x18\n\x10serialized_error\x18\x02'
-    b' \x01(\t2\x91\x0f\n\nDagsterApi\x12*\n\x04Ping\x12\x10.api.PingRequest\x1a\x0e.api.PingReply"\x00\x12/\n\tHeartbeat\x12\x10.api.PingRequest\x1a\x0e.api.PingReply"\x00\x12G\n\rStreamingPing\x12\x19.api.StreamingPingRequest\x1a\x17.api.StreamingPingEvent"\x00\x30\x01\x12\x32\n\x0bGetServerId\x12\n.api.Empty\x1a\x15.api.GetServerIdReply"\x00\x12]\n\x15\x45xecutionPlanSnapshot\x12!.api.ExecutionPlanSnapshotRequest\x1a\x1f.api.ExecutionPlanSnapshotReply"\x00\x12N\n\x10ListRepositories\x12\x1c.api.ListRepositoriesRequest\x1a\x1a.api.ListRepositoriesReply"\x00\x12`\n\x16\x45xternalPartitionNames\x12".api.ExternalPartitionNamesRequest\x1a'
+    b' \x01(\t2\xf5\x0f\n\nDagsterApi\x12*\n\x04Ping\x12\x10.api.PingRequest\x1a\x0e.api.PingReply"\x00\x12/\n\tHeartbeat\x12\x10.api.PingRequest\x1a\x0e.api.PingReply"\x00\x12G\n\rStreamingPing\x12\x19.api.StreamingPingRequest\x1a\x17.api.StreamingPingEvent"\x00\x30\x01\x12\x32\n\x0bGetServerId\x12\n.api.Empty\x1a\x15.api.GetServerIdReply"\x00\x12]\n\x15\x45xecutionPlanSnapshot\x12!.api.ExecutionPlanSnapshotRequest\x1a\x1f.api.ExecutionPlanSnapshotReply"\x00\x12N\n\x10ListRepositories\x12\x1c.api.ListRepositoriesRequest\x1a\x1a.api.ListRepositoriesReply"\x00\x12`\n\x16\x45xternalPartitionNames\x12".api.ExternalPartitionNamesRequest\x1a'
     b' .api.ExternalPartitionNamesReply"\x00\x12Z\n\x14\x45xternalNotebookData\x12'
-    b' .api.ExternalNotebookDataRequest\x1a\x1e.api.ExternalNotebookDataReply"\x00\x12\x63\n\x17\x45xternalPartitionConfig\x12#.api.ExternalPartitionConfigRequest\x1a!.api.ExternalPartitionConfigReply"\x00\x12]\n\x15\x45xternalPartitionTags\x12!.api.ExternalPartitionTagsRequest\x1a\x1f.api.ExternalPartitionTagsReply"\x00\x12t\n#ExternalPartitionSetExecutionParams\x12/.api.ExternalPartitionSetExecutionParamsRequest\x1a\x18.api.StreamingChunkEvent"\x00\x30\x01\x12x\n\x1e\x45xternalPipelineSubsetSnapshot\x12*.api.ExternalPipelineSubsetSnapshotRequest\x1a(.api.ExternalPipelineSubsetSnapshotReply"\x00\x12T\n\x12\x45xternalRepository\x12\x1e.api.ExternalRepositoryRequest\x1a\x1c.api.ExternalRepositoryReply"\x00\x12?\n\x0b\x45xternalJob\x12\x17.api.ExternalJobRequest\x1a\x15.api.ExternalJobReply"\x00\x12h\n\x1bStreamingExternalRepository\x12\x1e.api.ExternalRepositoryRequest\x1a%.api.StreamingExternalRepositoryEvent"\x00\x30\x01\x12`\n\x19\x45xternalScheduleExecution\x12%.api.ExternalScheduleExecutionRequest\x1a\x18.api.StreamingChunkEvent"\x00\x30\x01\x12\\\n\x17\x45xternalSensorExecution\x12#.api.ExternalSensorExecutionRequest\x1a\x18.api.StreamingChunkEvent"\x00\x30\x01\x12\x38\n\x0eShutdownServer\x12\n.api.Empty\x1a\x18.api.ShutdownServerReply"\x00\x12K\n\x0f\x43\x61ncelExecution\x12\x1b.api.CancelExecutionRequest\x1a\x19.api.CancelExecutionReply"\x00\x12T\n\x12\x43\x61nCancelExecution\x12\x1e.api.CanCancelExecutionRequest\x1a\x1c.api.CanCancelExecutionReply"\x00\x12\x36\n\x08StartRun\x12\x14.api.StartRunRequest\x1a\x12.api.StartRunReply"\x00\x12:\n\x0fGetCurrentImage\x12\n.api.Empty\x1a\x19.api.GetCurrentImageReply"\x00\x12\x38\n\x0eGetCurrentRuns\x12\n.api.Empty\x1a\x18.api.GetCurrentRunsReply"\x00\x12<\n\nReloadCode\x12\x16.api.ReloadCodeRequest\x1a\x14.api.ReloadCodeReply"\x00\x62\x06proto3'
+    b' .api.ExternalNotebookDataRequest\x1a\x1e.api.ExternalNotebookDataReply"\x00\x12\x63\n\x17\x45xternalPartitionConfig\x12#.api.ExternalPartitionConfigRequest\x1a!.api.ExternalPartitionConfigReply"\x00\x12]\n\x15\x45xternalPartitionTags\x12!.api.ExternalPartitionTagsRequest\x1a\x1f.api.ExternalPartitionTagsReply"\x00\x12t\n#ExternalPartitionSetExecutionParams\x12/.api.ExternalPartitionSetExecutionParamsRequest\x1a\x18.api.StreamingChunkEvent"\x00\x30\x01\x12x\n\x1e\x45xternalPipelineSubsetSnapshot\x12*.api.ExternalPipelineSubsetSnapshotRequest\x1a(.api.ExternalPipelineSubsetSnapshotReply"\x00\x12T\n\x12\x45xternalRepository\x12\x1e.api.ExternalRepositoryRequest\x1a\x1c.api.ExternalRepositoryReply"\x00\x12?\n\x0b\x45xternalJob\x12\x17.api.ExternalJobRequest\x1a\x15.api.ExternalJobReply"\x00\x12h\n\x1bStreamingExternalRepository\x12\x1e.api.ExternalRepositoryRequest\x1a%.api.StreamingExternalRepositoryEvent"\x00\x30\x01\x12\x62\n\x19GetRepositorySnapshotHash\x12\x1e.api.ExternalRepositoryRequest\x1a#.api.GetRepositorySnapshotHashReply"\x00\x12`\n\x19\x45xternalScheduleExecution\x12%.api.ExternalScheduleExecutionRequest\x1a\x18.api.StreamingChunkEvent"\x00\x30\x01\x12\\\n\x17\x45xternalSensorExecution\x12#.api.ExternalSensorExecutionRequest\x1a\x18.api.StreamingChunkEvent"\x00\x30\x01\x12\x38\n\x0eShutdownServer\x12\n.api.Empty\x1a\x18.api.ShutdownServerReply"\x00\x12K\n\x0f\x43\x61ncelExecution\x12\x1b.api.CancelExecutionRequest\x1a\x19.api.CancelExecutionReply"\x00\x12T\n\x12\x43\x61nCancelExecution\x12\x1e.api.CanCancelExecutionRequest\x1a\x1c.api.CanCancelExecutionReply"\x00\x12\x36\n\x08StartRun\x12\x14.api.StartRunRequest\x1a\x12.api.StartRunReply"\x00\x12:\n\x0fGetCurrentImage\x12\n.api.Empty\x1a\x19.api.GetCurrentImageReply"\x00\x12\x38\n\x0eGetCurrentRuns\x12\n.api.Empty\x1a\x18.api.GetCurrentRunsReply"\x00\x12<\n\nReloadCode\x12\x16.api.ReloadCodeRequest\x1a\x14.api.ReloadCodeReply"\x00\x62\x06proto3'
 )
 
 
@@ -104,6 +110,7 @@
 _STREAMINGEXTERNALREPOSITORYEVENT = DESCRIPTOR.message_types_by_name[
     "StreamingExternalRepositoryEvent"
 ]
+_GETREPOSITORYSNAPSHOTHASHREPLY = DESCRIPTOR.message_types_by_name["GetRepositorySnapshotHashReply"]
 _EXTERNALSCHEDULEEXECUTIONREQUEST = DESCRIPTOR.message_types_by_name[
     "ExternalScheduleExecutionRequest"
 ]
@@ -386,6 +393,17 @@
 )
 _sym_db.RegisterMessage(StreamingExternalRepositoryEvent)
 
+GetRepositorySnapshotHashReply = _reflection.GeneratedProtocolMessageType(
+    "GetRepositorySnapshotHashReply",
+    (_message.Message,),
+    {
+        "DESCRIPTOR": _GETREPOSITORYSNAPSHOTHASHREPLY,
+        "__module__": "api_pb2",
+        # @@protoc_insertion_point(class_scope:api.GetRepositorySnapshotHashReply)
+    },
+)
+_sym_db.RegisterMessage(GetRepositorySnapshotHashReply)
+
 ExternalScheduleExecutionRequest = _reflection.GeneratedProtocolMessageType(
     "ExternalScheduleExecutionRequest",
     (_message.Message,),
@@ -607,44 +625,46 @@
     _EXTERNALPIPELINESUBSETSNAPSHOTREQUEST._serialized_end = 1351
     _EXTERNALPIPELINESUBSETSNAPSHOTREPLY._serialized_start = 1353
     _EXTERNALPIPELINESUBSETSNAPSHOTREPLY._serialized_end = 1442
-    _EXTERNALREPOSITORYREQUEST._serialized_start = 1444
-    _EXTERNALREPOSITORYREQUEST._serialized_end = 1541
-    _EXTERNALREPOSITORYREPLY._serialized_start = 1543
-    _EXTERNALREPOSITORYREPLY._serialized_end = 1613
-    _STREAMINGEXTERNALREPOSITORYEVENT._serialized_start = 1615
-    _STREAMINGEXTERNALREPOSITORYEVENT._serialized_end = 1720
-    _EXTERNALSCHEDULEEXECUTIONREQUEST._serialized_start = 1722
-    _EXTERNALSCHEDULEEXECUTIONREQUEST._serialized_end = 1809
-    _EXTERNALSENSOREXECUTIONREQUEST._serialized_start = 1811
-    _EXTERNALSENSOREXECUTIONREQUEST._serialized_end = 1894
-    _STREAMINGCHUNKEVENT._serialized_start = 1896
-    _STREAMINGCHUNKEVENT._serialized_end = 1968
-    _SHUTDOWNSERVERREPLY._serialized_start = 1970
-    _SHUTDOWNSERVERREPLY._serialized_end = 2034
-    _CANCELEXECUTIONREQUEST._serialized_start = 2036
-    _CANCELEXECUTIONREQUEST._serialized_end = 2105
-    _CANCELEXECUTIONREPLY._serialized_start = 2107
-    _CANCELEXECUTIONREPLY._serialized_end = 2173
-    _CANCANCELEXECUTIONREQUEST._serialized_start = 2175
-    _CANCANCELEXECUTIONREQUEST._serialized_end = 2251
-    _CANCANCELEXECUTIONREPLY._serialized_start = 2253
-    _CANCANCELEXECUTIONREPLY._serialized_end = 2326
-    _STARTRUNREQUEST._serialized_start = 2328
-    _STARTRUNREQUEST._serialized_end = 2382
-    _STARTRUNREPLY._serialized_start = 2384
-    _STARTRUNREPLY._serialized_end = 2436
-    _GETCURRENTIMAGEREPLY._serialized_start = 2438
-    _GETCURRENTIMAGEREPLY._serialized_end = 2494
-    _GETCURRENTRUNSREPLY._serialized_start = 2496
-    _GETCURRENTRUNSREPLY._serialized_end = 2550
-    _EXTERNALJOBREQUEST._serialized_start = 2552
-    _EXTERNALJOBREQUEST._serialized_end = 2628
-    _EXTERNALJOBREPLY._serialized_start = 2630
-    _EXTERNALJOBREPLY._serialized_end = 2703
-    _RELOADCODEREQUEST._serialized_start = 2705
-    _RELOADCODEREQUEST._serialized_end = 2724
-    _RELOADCODEREPLY._serialized_start = 2726
-    _RELOADCODEREPLY._serialized_end = 2769
-    _DAGSTERAPI._serialized_start = 2772
-    _DAGSTERAPI._serialized_end = 4709
+    _EXTERNALREPOSITORYREQUEST._serialized_start = 1445
+    _EXTERNALREPOSITORYREQUEST._serialized_end = 1610
+    _EXTERNALREPOSITORYREPLY._serialized_start = 1612
+    _EXTERNALREPOSITORYREPLY._serialized_end = 1682
+    _STREAMINGEXTERNALREPOSITORYEVENT._serialized_start = 1685
+    _STREAMINGEXTERNALREPOSITORYEVENT._serialized_end = 1870
+    _GETREPOSITORYSNAPSHOTHASHREPLY._serialized_start = 1872
+    _GETREPOSITORYSNAPSHOTHASHREPLY._serialized_end = 1953
+    _EXTERNALSCHEDULEEXECUTIONREQUEST._serialized_start = 1955
+    _EXTERNALSCHEDULEEXECUTIONREQUEST._serialized_end = 2042
+    _EXTERNALSENSOREXECUTIONREQUEST._serialized_start = 2044
+    _EXTERNALSENSOREXECUTIONREQUEST._serialized_end = 2127
+    _STREAMINGCHUNKEVENT._serialized_start = 2129
+    _STREAMINGCHUNKEVENT._serialized_end = 2201
+    _SHUTDOWNSERVERREPLY._serialized_start = 2203
+    _SHUTDOWNSERVERREPLY._serialized_end = 2267
+    _CANCELEXECUTIONREQUEST._serialized_start = 2269
+    _CANCELEXECUTIONREQUEST._serialized_end = 2338
+    _CANCELEXECUTIONREPLY._serialized_start = 2340
+    _CANCELEXECUTIONREPLY._serialized_end = 2406
+    _CANCANCELEXECUTIONREQUEST._serialized_start = 2408
+    _CANCANCELEXECUTIONREQUEST._serialized_end = 2484
+    _CANCANCELEXECUTIONREPLY._serialized_start = 2486
+    _CANCANCELEXECUTIONREPLY._serialized_end = 2559
+    _STARTRUNREQUEST._serialized_start = 2561
+    _STARTRUNREQUEST._serialized_end = 2615
+    _STARTRUNREPLY._serialized_start = 2617
+    _STARTRUNREPLY._serialized_end = 2669
+    _GETCURRENTIMAGEREPLY._serialized_start = 2671
+    _GETCURRENTIMAGEREPLY._serialized_end = 2727
+    _GETCURRENTRUNSREPLY._serialized_start = 2729
+    _GETCURRENTRUNSREPLY._serialized_end = 2783
+    _EXTERNALJOBREQUEST._serialized_start = 2785
+    _EXTERNALJOBREQUEST._serialized_end = 2861
+    _EXTERNALJOBREPLY._serialized_start = 2863
+    _EXTERNALJOBREPLY._serialized_end = 2936
+    _RELOADCODEREQUEST._serialized_start = 2938
+    _RELOADCODEREQUEST._serialized_end = 2957
+    _RELOADCODEREPLY._serialized_start = 2959
+    _RELOADCODEREPLY._serialized_end = 3002
+    _DAGSTERAPI._serialized_start = 3005
+    _DAGSTERAPI._serialized_end = 5042
 # @@protoc_insertion_point(module_scope)
@@ -353,20 +353,56 @@ def streaming_external_repository(
         external_repository_origin: ExternalRepositoryOrigin,
         defer_snapshots: bool = False,
         timeout=DEFAULT_REPOSITORY_GRPC_TIMEOUT,
+        stream_snapshot_parts: bool = False,
+        accepted_compression_codecs: Optional[Sequence[str]] = None,
     ):
+        """Streams the repository snapshot in chunks.
+
+        If `stream_snapshot_parts` is set, servers that support it will send the snapshot as a
+        stream of individually serialized parts (see `dagster._grpc.snapshot_streaming`), in the
+        `snapshot_parts_chunk` of each event, compressed with the first of
+        `accepted_compression_codecs` that the server supports, along with the `snapshot_hash` of the
+        snapshot. Older servers ignore the option and send chunks of the serialized snapshot in
+        `serialized_external_repository_chunk`.
+        """
         for res in self._streaming_query(
             "StreamingExternalRepository",
             api_pb2.ExternalRepositoryRequest,
             # Rename parameter
             serialized_repository_python_origin=serialize_value(external_repository_origin),
             defer_snapshots=defer_snapshots,
+            stream_snapshot_parts=stream_snapshot_parts,
+            accepted_compression_codecs=accepted_compression_codecs or [],
             timeout=timeout,
         ):
             yield {
                 "sequence_number": res.sequence_number,
                 "serialized_external_repository_chunk": res.serialized_external_repository_chunk,
+                "snapshot_parts_chunk": res.snapshot_parts_chunk,
+                "compression_codec": res.compression_codec,
+                "snapshot_hash": res.snapshot_hash,
             }
 
+    def get_repository_snapshot_hash(
+        self,
+        external_repository_origin: ExternalRepositoryOrigin,
+        defer_snapshots: bool = False,
+        timeout=DEFAULT_REPOSITORY_GRPC_TIMEOUT,
+    ) -> Optional[Any]:
+        """Returns the GetRepositorySnapshotHashReply for the repository, or None if the server
+        predates the GetRepositorySnapshotHash API.
+        """
+        request = api_pb2.ExternalRepositoryRequest(
+            serialized_repository_python_origin=serialize_value(external_repository_origin),
+            defer_snapshots=defer_snapshots,
+        )
+        try:
+            return self._get_response("GetRepositorySnapshotHash", request, timeout=timeout)
+        except Exception as e:
+            if isinstance(e, grpc.RpcError) and e.code() == grpc.StatusCode.UNIMPLEMENTED:  # type: ignore  # (bad stubs)
+                return None
+            self._raise_grpc_exception(e, timeout=timeout)
+
     def external_schedule_execution(
         self, external_schedule_execution_args, timeout=DEFAULT_SCHEDULE_GRPC_TIMEOUT
     ):
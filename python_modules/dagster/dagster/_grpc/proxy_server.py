@@ -213,6 +213,9 @@ def GetCurrentImage(self, request, context):
     def StreamingExternalRepository(self, request, context):
         return self._streaming_query("StreamingExternalRepository", request, context)
 
+    def GetRepositorySnapshotHash(self, request, context):
+        return self._query("GetRepositorySnapshotHash", request, context)
+
     def Heartbeat(self, request, context):
         return self._query("Heartbeat", request, context)
 
@@ -24,6 +24,7 @@
     Optional,
     Sequence,
     Tuple,
+    Union,
     cast,
 )
 
@@ -39,6 +40,7 @@
 from dagster._core.host_representation.external_data import (
     ExternalJobSubsetResult,
     ExternalPartitionExecutionErrorData,
+    ExternalRepositoryData,
     ExternalRepositoryErrorData,
     ExternalScheduleExecutionErrorData,
     ExternalSensorExecutionErrorData,
@@ -76,6 +78,12 @@
     get_partition_tags,
     start_run_in_subprocess,
 )
+from .snapshot_cache import hash_repository_data_parts
+from .snapshot_streaming import (
+    encode_repository_data_parts,
+    iter_serialized_repository_data_parts,
+    select_compression_codec,
+)
 from .types import (
     CanCancelExecutionRequest,
     CanCancelExecutionResult,
@@ -262,6 +270,11 @@ def __init__(
 
         self._serializable_load_error = None
 
+        # Definitions are loaded once when the server starts, so each repository snapshot only
+        # needs to be built (and hashed) once
+        self._repository_snapshots: Dict[Tuple[str, bool], Tuple[ExternalRepositoryData, str]] = {}
+        self._repository_snapshots_lock = threading.Lock()
+
         self._entry_point = (
             check.sequence_param(entry_point, "entry_point", of_type=str)
             if entry_point is not None
@@ -598,23 +611,52 @@ def ExternalPipelineSubsetSnapshot(
             serialized_external_pipeline_subset_result=serialized_external_pipeline_subset_result
         )
 
-    def _get_serialized_external_repository_data(self, request):
+    def _get_external_repository_data_and_hash(
+        self, request
+    ) -> Tuple[Union[ExternalRepositoryData, ExternalRepositoryErrorData], Optional[str]]:
         try:
             repository_origin = deserialize_value(
                 request.serialized_repository_python_origin,
                 ExternalRepositoryOrigin,
             )
-
-            return serialize_value(
-                external_repository_data_from_def(
-                    self._get_repo_for_origin(repository_origin),
-                    defer_snapshots=request.defer_snapshots,
-                )
-            )
+            repo_def = self._get_repo_for_origin(repository_origin)
+            key = (repository_origin.repository_name, request.defer_snapshots)
+
+            with self._repository_snapshots_lock:
+                if key not in self._repository_snapshots:
+                    repository_data = external_repository_data_from_def(
+                        repo_def,
+                        defer_snapshots=request.defer_snapshots,
+                    )
+                    snapshot_hash = hash_repository_data_parts(
+                        check.not_none(self._loaded_repositories).code_pointers_by_repo_name[
+                            repository_origin.repository_name
+                        ],
+                        iter_serialized_repository_data_parts(repository_data),
+                    )
+                    self._repository_snapshots[key] = (repository_data, snapshot_hash)
+                return self._repository_snapshots[key]
         except Exception:
-            return serialize_value(
-                ExternalRepositoryErrorData(serializable_error_info_from_exc_info(sys.exc_info()))
+            return (
+                ExternalRepositoryErrorData(serializable_error_info_from_exc_info(sys.exc_info())),
+                None,
+            )
+
+    def _get_serialized_external_repository_data(self, request):
+        repository_data, _ = self._get_external_repository_data_and_hash(request)
+        return serialize_value(repository_data)
+
+    def GetRepositorySnapshotHash(
+        self, request, _context
+    ) -> api_pb2.GetRepositorySnapshotHashReply:
+        repository_data, snapshot_hash = self._get_external_repository_data_and_hash(request)
+        if isinstance(repository_data, ExternalRepositoryErrorData):
+            return api_pb2.GetRepositorySnapshotHashReply(  # type: ignore  # (grpc generated)
+                serialized_error=serialize_value(repository_data.error)
             )
+        return api_pb2.GetRepositorySnapshotHashReply(  # type: ignore  # (grpc generated)
+            snapshot_hash=snapshot_hash
+        )
 
     def ExternalRepository(self, request, _context) -> api_pb2.ExternalRepositoryReply:
         serialized_external_repository_data = self._get_serialized_external_repository_data(request)
@@ -642,6 +684,10 @@ def ExternalJob(self, request, _context) -> api_pb2.ExternalJobReply:
     def StreamingExternalRepository(
         self, request, _context
     ) -> Iterable[api_pb2.StreamingExternalRepositoryEvent]:
+        if request.stream_snapshot_parts:
+            yield from self._stream_external_repository_data_parts(request)
+            return
+
         serialized_external_repository_data = self._get_serialized_external_repository_data(request)
 
         num_chunks = int(
@@ -662,6 +708,26 @@ def StreamingExternalRepository(
                 ],
             )
 
+    def _stream_external_repository_data_parts(
+        self, request
+    ) -> Iterable[api_pb2.StreamingExternalRepositoryEvent]:
+        # Serialize the snapshot one asset node / job / schedule / etc. at a time, so that the
+        # serialized form of the whole repository is never held in memory at once.
+        compression_codec = select_compression_codec(request.accepted_compression_codecs)
+        repository_data, snapshot_hash = self._get_external_repository_data_and_hash(request)
+        chunks = encode_repository_data_parts(
+            iter_serialized_repository_data_parts(repository_data),
+            chunk_size=STREAMING_CHUNK_SIZE,
+            compression_codec=compression_codec,
+        )
+        for i, chunk in enumerate(chunks):
+            yield api_pb2.StreamingExternalRepositoryEvent(  # type: ignore  # (grpc generated)
+                sequence_number=i,
+                snapshot_parts_chunk=chunk,
+                compression_codec=compression_codec or "",
+                snapshot_hash=snapshot_hash or "",
+            )
+
     def _split_serialized_data_into_chunk_events(
         self, serialized_data
     ) -> Iterable[api_pb2.StreamingChunkEvent]:
@@ -0,0 +1,142 @@
+"""Content-addressed caching of repository snapshots.
+
+A code server builds each repository snapshot once and identifies it by a hash of the repository's
+code pointer and the serialized snapshot (see `hash_repository_data_parts`). Clients can ask for that
+hash with the cheap `GetRepositorySnapshotHash` call and skip fetching and deserializing the
+snapshot entirely when they already hold a snapshot with the same hash, e.g. when a code location
+is reloaded without any of its definitions having changed.
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Iterable, Optional
+
+import dagster._check as check
+from dagster._core.code_pointer import CodePointer
+from dagster._core.host_representation.external_data import ExternalRepositoryData
+from dagster._serdes import deserialize_value, serialize_value
+
+from .utils import repository_snapshot_cache_dir
+
+# number of deserialized snapshots kept in memory by each cache
+DEFAULT_MAX_CACHED_REPOSITORY_SNAPSHOTS = 32
+
+
+def hash_repository_data_parts(code_pointer: CodePointer, serialized_parts: Iterable[str]) -> str:
+    """Computes the content address of a repository snapshot from its code pointer and its
+    serialized parts (see `dagster._grpc.snapshot_streaming.iter_serialized_repository_data_parts`).
+    """
+    snapshot_hash = hashlib.sha256(serialize_value(code_pointer).encode("utf-8"))
+    for serialized_part in serialized_parts:
+        snapshot_hash.update(serialized_part.encode("utf-8"))
+        snapshot_hash.update(b"\n")
+    return snapshot_hash.hexdigest()
+
+
+class RepositorySnapshotCache:
+    """Caches repository snapshots by their snapshot hash.
+
+    The most recently used snapshots are kept deserialized in memory. If a cache directory is
+    provided, every snapshot is also written to `<cache_dir>/<snapshot hash>`, so that processes
+    that restart (e.g. the webserver or the daemon after a deploy) don't need to fetch unchanged
+    snapshots from the code server again.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_entries: int = DEFAULT_MAX_CACHED_REPOSITORY_SNAPSHOTS,
+    ):
+        self._cache_dir = check.opt_str_param(cache_dir, "cache_dir")
+        self._max_entries = check.int_param(max_entries, "max_entries")
+        self._lock = threading.Lock()
+        self._snapshots_by_hash: "OrderedDict[str, ExternalRepositoryData]" = OrderedDict()
+
+        if self._cache_dir:
+            os.makedirs(self._cache_dir, exist_ok=True)
+
+    @property
+    def cache_dir(self) -> Optional[str]:
+        return self._cache_dir
+
+    def _get_path(self, snapshot_hash: str) -> str:
+        check.invariant(
+            snapshot_hash.isalnum(), f"Invalid repository snapshot hash {snapshot_hash}"
+        )
+        return os.path.join(check.not_none(self._cache_dir), snapshot_hash)
+
+    def _remember(self, snapshot_hash: str, repository_data: ExternalRepositoryData) -> None:
+        with self._lock:
+            self._snapshots_by_hash[snapshot_hash] = repository_data
+            self._snapshots_by_hash.move_to_end(snapshot_hash)
+            while len(self._snapshots_by_hash) > self._max_entries:
+                self._snapshots_by_hash.popitem(last=False)
+
+    def get(self, snapshot_hash: str) -> Optional[ExternalRepositoryData]:
+        check.str_param(snapshot_hash, "snapshot_hash")
+
+        with self._lock:
+            repository_data = self._snapshots_by_hash.get(snapshot_hash)
+            if repository_data is not None:
+                self._snapshots_by_hash.move_to_end(snapshot_hash)
+                return repository_data
+
+        if not self._cache_dir:
+            return None
+
+        path = self._get_path(snapshot_hash)
+        try:
+            with open(path, encoding="utf-8") as f:
+                repository_data = deserialize_value(f.read(), ExternalRepositoryData)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # treat unreadable entries (e.g. written by an incompatible version) as a miss
+            return None
+
+        self._remember(snapshot_hash, repository_data)
+        return repository_data
+
+    def set(self, snapshot_hash: str, repository_data: ExternalRepositoryData) -> None:
+        check.str_param(snapshot_hash, "snapshot_hash")
+        check.inst_param(repository_data, "repository_data", ExternalRepositoryData)
+
+        self._remember(snapshot_hash, repository_data)
+
+        if not self._cache_dir:
+            return
+
+        path = self._get_path(snapshot_hash)
+        if os.path.exists(path):
+            return
+
+        # write to a temporary file first so that concurrent readers never see a partial entry
+        fd, temp_path = tempfile.mkstemp(dir=self._cache_dir, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(serialize_value(repository_data))
+            os.replace(temp_path, path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+
+_REPOSITORY_SNAPSHOT_CACHE: Optional[RepositorySnapshotCache] = None
+_REPOSITORY_SNAPSHOT_CACHE_LOCK = threading.Lock()
+
+
+def get_repository_snapshot_cache() -> RepositorySnapshotCache:
+    """Returns the process-wide repository snapshot cache. Snapshots are also persisted to disk if
+    the DAGSTER_REPOSITORY_SNAPSHOT_CACHE_DIR environment variable is set.
+    """
+    global _REPOSITORY_SNAPSHOT_CACHE  # noqa: PLW0603
+
+    with _REPOSITORY_SNAPSHOT_CACHE_LOCK:
+        cache_dir = repository_snapshot_cache_dir()
+        if _REPOSITORY_SNAPSHOT_CACHE is None or _REPOSITORY_SNAPSHOT_CACHE.cache_dir != cache_dir:
+            _REPOSITORY_SNAPSHOT_CACHE = RepositorySnapshotCache(cache_dir)
+        return _REPOSITORY_SNAPSHOT_CACHE
@@ -0,0 +1,213 @@
+"""Incremental encoding of repository snapshots for the StreamingExternalRepository API.
+
+Rather than serializing an entire ExternalRepositoryData to a single string, the snapshot is
+serialized as a sequence of parts: a header containing the repository data with its large
+collections emptied out, followed by one part per schedule, sensor, partition set, asset node,
+job, resource and asset check. Each part is written as a single line of the form
+`<field name>\\t<serialized value>`, and the resulting stream of lines is optionally compressed and
+split into chunks. This way neither the server nor the client ever needs to hold the serialized
+form of the entire snapshot in memory.
+"""
+
+import zlib
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+import dagster._check as check
+from dagster._core.host_representation.external_data import (
+    ExternalRepositoryData,
+    ExternalRepositoryErrorData,
+)
+from dagster._serdes import deserialize_value, serialize_value
+
+GZIP_COMPRESSION_CODEC = "gzip"
+ZSTD_COMPRESSION_CODEC = "zstd"
+
+# fields of ExternalRepositoryData that are streamed one element at a time
+STREAMED_REPOSITORY_DATA_FIELDS = (
+    "external_schedule_datas",
+    "external_partition_set_datas",
+    "external_sensor_datas",
+    "external_asset_graph_data",
+    "external_job_datas",
+    "external_job_refs",
+    "external_resource_data",
+    "external_asset_checks",
+)
+
+_REPOSITORY_HEADER_PART = "repository"
+_ERROR_PART = "error"
+_PART_SEPARATOR = "\t"
+_PART_TERMINATOR = b"\n"
+
+
+def get_supported_compression_codecs() -> Sequence[str]:
+    """Returns the compression codecs supported in this environment, in order of preference."""
+    codecs = []
+    try:
+        import zstandard  # noqa: F401
+
+        codecs.append(ZSTD_COMPRESSION_CODEC)
+    except ImportError:
+        pass
+    codecs.append(GZIP_COMPRESSION_CODEC)
+    return codecs
+
+
+def select_compression_codec(accepted_codecs: Iterable[str]) -> Optional[str]:
+    """Returns the first of the codecs accepted by a client that is supported here, if any."""
+    supported_codecs = get_supported_compression_codecs()
+    for codec in accepted_codecs:
+        if codec in supported_codecs:
+            return codec
+    return None
+
+
+class _IdentityCodec:
+    def compress(self, data: bytes) -> bytes:
+        return data
+
+    def decompress(self, data: bytes) -> bytes:
+        return data
+
+    def flush(self) -> bytes:
+        return b""
+
+
+class _ZstdCompressor:
+    def __init__(self):
+        import zstandard
+
+        self._compressor = zstandard.ZstdCompressor().compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+
+class _ZstdDecompressor:
+    def __init__(self):
+        import zstandard
+
+        self._decompressor = zstandard.ZstdDecompressor().decompressobj()
+
+    def decompress(self, data: bytes) -> bytes:
+        return self._decompressor.decompress(data)
+
+
+def _get_compressor(codec: Optional[str]):
+    if not codec:
+        return _IdentityCodec()
+    elif codec == GZIP_COMPRESSION_CODEC:
+        return zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    elif codec == ZSTD_COMPRESSION_CODEC:
+        return _ZstdCompressor()
+    check.failed(f"Unsupported compression codec {codec}")
+
+
+def _get_decompressor(codec: Optional[str]):
+    if not codec:
+        return _IdentityCodec()
+    elif codec == GZIP_COMPRESSION_CODEC:
+        return zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+    elif codec == ZSTD_COMPRESSION_CODEC:
+        return _ZstdDecompressor()
+    check.failed(f"Unsupported compression codec {codec}")
+
+
+def iter_serialized_repository_data_parts(
+    repository_data: Union[ExternalRepositoryData, ExternalRepositoryErrorData],
+) -> Iterator[str]:
+    """Serializes the repository data one part at a time."""
+    if isinstance(repository_data, ExternalRepositoryErrorData):
+        yield _ERROR_PART + _PART_SEPARATOR + serialize_value(repository_data)
+        return
+
+    # collections that are None (e.g. job datas when snapshots are deferred) stay None in the
+    # header, while the others are emptied and refilled by the streamed parts
+    header = repository_data._replace(
+        **{
+            field: [] if getattr(repository_data, field) is not None else None
+            for field in STREAMED_REPOSITORY_DATA_FIELDS
+        }
+    )
+    yield _REPOSITORY_HEADER_PART + _PART_SEPARATOR + serialize_value(header)
+
+    for field in STREAMED_REPOSITORY_DATA_FIELDS:
+        for value in getattr(repository_data, field) or []:
+            yield field + _PART_SEPARATOR + serialize_value(value)
+
+
+def encode_repository_data_parts(
+    parts: Iterable[str], chunk_size: int, compression_codec: Optional[str] = None
+) -> Iterator[bytes]:
+    """Encodes a stream of serialized parts into (optionally compressed) chunks of at most
+    `chunk_size` bytes.
+    """
+    compressor = _get_compressor(compression_codec)
+    buffer = bytearray()
+
+    for part in parts:
+        buffer += compressor.compress(part.encode("utf-8") + _PART_TERMINATOR)
+        while len(buffer) >= chunk_size:
+            yield bytes(buffer[:chunk_size])
+            del buffer[:chunk_size]
+
+    buffer += compressor.flush()
+    while buffer:
+        yield bytes(buffer[:chunk_size])
+        del buffer[:chunk_size]
+
+
+def decode_repository_data_parts(
+    chunks: Iterable[bytes], compression_codec: Optional[str] = None
+) -> Iterator[str]:
+    """Inverse of `encode_repository_data_parts`, yielding each serialized part as soon as all of
+    its chunks have been received.
+    """
+    decompressor = _get_decompressor(compression_codec)
+    buffer = bytearray()
+
+    for chunk in chunks:
+        buffer += decompressor.decompress(chunk)
+        start = 0
+        while True:
+            end = buffer.find(_PART_TERMINATOR, start)
+            if end == -1:
+                break
+            yield buffer[start:end].decode("utf-8")
+            start = end + 1
+        del buffer[:start]
+
+    check.invariant(not buffer, "Repository snapshot stream ended with an incomplete part")
+
+
+def build_repository_data_from_parts(
+    serialized_parts: Iterable[str],
+) -> Union[ExternalRepositoryData, ExternalRepositoryErrorData]:
+    """Deserializes each part as it arrives and assembles the full repository data."""
+    header: Optional[ExternalRepositoryData] = None
+    values_by_field: Dict[str, List[object]] = {}
+
+    for serialized_part in serialized_parts:
+        part_name, serialized_value = serialized_part.split(_PART_SEPARATOR, 1)
+        if part_name == _ERROR_PART:
+            return deserialize_value(serialized_value, ExternalRepositoryErrorData)
+        elif part_name == _REPOSITORY_HEADER_PART:
+            header = deserialize_value(serialized_value, ExternalRepositoryData)
+        else:
+            check.invariant(
+                part_name in STREAMED_REPOSITORY_DATA_FIELDS,
+                f"Unexpected repository snapshot part {part_name}",
+            )
+            values_by_field.setdefault(part_name, []).append(deserialize_value(serialized_value))
+
+    header = check.not_none(header, "Repository snapshot stream did not include a header")
+    return header._replace(
+        **{
+            field: values_by_field.get(field, [])
+            for field in STREAMED_REPOSITORY_DATA_FIELDS
+            if getattr(header, field) is not None
+        }
+    )
@@ -113,6 +113,12 @@ def default_sensor_grpc_timeout() -> int:
     return default_grpc_timeout()
 
 
+def repository_snapshot_cache_dir() -> Optional[str]:
+    # Directory in which clients persist the repository snapshots they fetch from code servers,
+    # keyed by snapshot hash. Snapshots are only cached in memory if unset.
+    return os.getenv("DAGSTER_REPOSITORY_SNAPSHOT_CACHE_DIR") or None
+
+
 def default_grpc_server_shutdown_grace_period():
     # Time to wait for calls to finish before shutting down the server
     # Defaults to the same as default_grpc_timeout() unless
@@ -0,0 +1,222 @@
+"""A compact, text-safe encoding for serialized values stored in SQL text columns.
+
+Storages write serdes JSON into text columns (e.g. event and run bodies), where the same class
+names, field names and event types are repeated in every row. `compact_encode` deflates the JSON
+with a preset dictionary of those tokens and base64-encodes the result, which typically shrinks an
+event body to a third of its size. Encoded values carry a versioned prefix, so `deserialize_value`
+transparently reads them alongside plain JSON values.
+
+The preset dictionary of each version must never change once released, since it is needed to
+decode every value written with that version. To improve the dictionary, add a new version.
+"""
+
+import base64
+import zlib
+
+import dagster._check as check
+
+# No JSON document starts with "z", so the prefix can't be confused with a plain JSON value.
+COMPACT_ENCODING_PREFIX = "z1:"
+
+_ZDICT_V1_TOKENS = (
+    '"event_type_value": "ALERT_FAILURE"',
+    '"event_type_value": "ALERT_START"',
+    '"event_type_value": "ALERT_SUCCESS"',
+    '"event_type_value": "ASSET_CHECK_EVALUATION"',
+    '"event_type_value": "ASSET_CHECK_EVALUATION_PLANNED"',
+    '"event_type_value": "ASSET_MATERIALIZATION"',
+    '"event_type_value": "ASSET_MATERIALIZATION_PLANNED"',
+    '"event_type_value": "ASSET_OBSERVATION"',
+    '"event_type_value": "ASSET_STORE_OPERATION"',
+    '"event_type_value": "ENGINE_EVENT"',
+    '"event_type_value": "HANDLED_OUTPUT"',
+    '"event_type_value": "HOOK_COMPLETED"',
+    '"event_type_value": "HOOK_ERRORED"',
+    '"event_type_value": "HOOK_SKIPPED"',
+    '"event_type_value": "LOADED_INPUT"',
+    '"event_type_value": "LOGS_CAPTURED"',
+    '"event_type_value": "OBJECT_STORE_OPERATION"',
+    '"event_type_value": "PIPELINE_CANCELED"',
+    '"event_type_value": "PIPELINE_CANCELING"',
+    '"event_type_value": "PIPELINE_DEQUEUED"',
+    '"event_type_value": "PIPELINE_ENQUEUED"',
+    '"event_type_value": "PIPELINE_FAILURE"',
+    '"event_type_value": "PIPELINE_START"',
+    '"event_type_value": "PIPELINE_STARTING"',
+    '"event_type_value": "PIPELINE_SUCCESS"',
+    '"event_type_value": "RESOURCE_INIT_FAILURE"',
+    '"event_type_value": "RESOURCE_INIT_STARTED"',
+    '"event_type_value": "RESOURCE_INIT_SUCCESS"',
+    '"event_type_value": "STEP_EXPECTATION_RESULT"',
+    '"event_type_value": "STEP_FAILURE"',
+    '"event_type_value": "STEP_INPUT"',
+    '"event_type_value": "STEP_OUTPUT"',
+    '"event_type_value": "STEP_RESTARTED"',
+    '"event_type_value": "STEP_SKIPPED"',
+    '"event_type_value": "STEP_START"',
+    '"event_type_value": "STEP_SUCCESS"',
+    '"event_type_value": "STEP_UP_FOR_RETRY"',
+    '"event_type_value": "STEP_WORKER_STARTED"',
+    '"event_type_value": "STEP_WORKER_STARTING"',
+    '{"__class__": "AssetCheckEvaluation", ',
+    '{"__class__": "AssetCheckEvaluationPlanned", ',
+    '{"__class__": "AssetCheckKey", ',
+    '{"__class__": "AssetKey", ',
+    '{"__class__": "AssetMaterialization", ',
+    '{"__class__": "AssetMaterializationPlannedData", ',
+    '{"__class__": "AssetObservation", ',
+    '{"__class__": "AssetObservationData", ',
+    '{"__class__": "BoolMetadataEntryData", ',
+    '{"__class__": "ComputeLogsCaptureData", ',
+    '{"__class__": "DagsterAssetMetadataEntryData", ',
+    '{"__class__": "DagsterEvent", ',
+    '{"__class__": "EngineEventData", ',
+    '{"__class__": "EventLogEntry", ',
+    '{"__class__": "EventMetadataEntry", ',
+    '{"__class__": "ExternalPipelineOrigin", ',
+    '{"__class__": "ExternalRepositoryOrigin", ',
+    '{"__class__": "FileCodePointer", ',
+    '{"__class__": "FloatMetadataEntryData", ',
+    '{"__class__": "GrpcServerRepositoryLocationOrigin", ',
+    '{"__class__": "HandledOutputData", ',
+    '{"__class__": "IntMetadataEntryData", ',
+    '{"__class__": "JobFailureData", ',
+    '{"__class__": "JsonMetadataEntryData", ',
+    '{"__class__": "LoadedInputData", ',
+    '{"__class__": "ManagedGrpcPythonEnvRepositoryLocationOrigin", ',
+    '{"__class__": "MarkdownMetadataEntryData", ',
+    '{"__class__": "ModuleCodePointer", ',
+    '{"__class__": "NullMetadataEntryData", ',
+    '{"__class__": "ObjectStoreOperationResultData", ',
+    '{"__class__": "PackageCodePointer", ',
+    '{"__class__": "PathMetadataEntryData", ',
+    '{"__class__": "PipelinePythonOrigin", ',
+    '{"__class__": "PipelineRun", ',
+    '{"__class__": "PipelineRunStatus", ',
+    '{"__class__": "PythonArtifactMetadataEntryData", ',
+    '{"__class__": "RepositoryPythonOrigin", ',
+    '{"__class__": "RunFailureReason", ',
+    '{"__class__": "SerializableErrorInfo", ',
+    '{"__class__": "SolidHandle", ',
+    '{"__class__": "StepExpectationResultData", ',
+    '{"__class__": "StepFailureData", ',
+    '{"__class__": "StepHandle", ',
+    '{"__class__": "StepInputData", ',
+    '{"__class__": "StepMaterializationData", ',
+    '{"__class__": "StepOutputData", ',
+    '{"__class__": "StepOutputHandle", ',
+    '{"__class__": "StepRetryData", ',
+    '{"__class__": "StepSuccessData", ',
+    '{"__class__": "TableMetadataEntryData", ',
+    '{"__class__": "TableSchemaMetadataEntryData", ',
+    '{"__class__": "TextMetadataEntryData", ',
+    '{"__class__": "TimestampMetadataValue", ',
+    '{"__class__": "TypeCheckData", ',
+    '{"__class__": "UrlMetadataEntryData", ',
+    '"__class__": ',
+    '"__enum__": ',
+    '"__frozenset__": ',
+    '"asset_check_selection": ',
+    '"asset_key": ',
+    '"asset_lineage": ',
+    '"asset_observation": ',
+    '"asset_selection": ',
+    '"dagster_event": ',
+    '"description": ',
+    '"duration_ms": ',
+    '"entry_data": ',
+    '"error": ',
+    '"error_info": ',
+    '"event_specific_data": ',
+    '"event_type_value": ',
+    '"execution_plan_snapshot_id": ',
+    '"external_pipeline_origin": ',
+    '"external_stderr_url": ',
+    '"external_stdout_url": ',
+    '"external_url": ',
+    '"has_repository_load_data": ',
+    '"input_name": ',
+    '"job_name": ',
+    '"key": ',
+    '"label": ',
+    '"level": ',
+    '"log_key": ',
+    '"logging_tags": ',
+    '"manager_key": ',
+    '"mapping_key": ',
+    '"marker_end": ',
+    '"marker_start": ',
+    '"materialization": ',
+    '"message": ',
+    '"metadata_entries": ',
+    '"mode": ',
+    '"module": ',
+    '"name": ',
+    '"op_name": ',
+    '"output_name": ',
+    '"parent": ',
+    '"parent_run_id": ',
+    '"partition": ',
+    '"path": ',
+    '"pid": ',
+    '"pipeline_code_origin": ',
+    '"pipeline_name": ',
+    '"pipeline_snapshot_id": ',
+    '"resource_fn_name": ',
+    '"resource_name": ',
+    '"root_run_id": ',
+    '"run_config": ',
+    '"run_id": ',
+    '"solid_handle": ',
+    '"solid_selection": ',
+    '"solids_to_execute": ',
+    '"status": ',
+    '"step_handle": ',
+    '"step_key": ',
+    '"step_keys": ',
+    '"step_keys_to_execute": ',
+    '"step_kind_value": ',
+    '"step_output_handle": ',
+    '"success": ',
+    '"tags": ',
+    '"text": ',
+    '"timestamp": ',
+    '"type_check_data": ',
+    '"upstream_output_name": ',
+    '"upstream_step_key": ',
+    '"user_message": ',
+    '"version": ',
+    '{"__enum__": "PipelineRunStatus.',
+    '{"__frozenset__": [',
+    'null, ',
+)
+
+_ZDICT_V1 = "".join(_ZDICT_V1_TOKENS).encode("utf-8")
+
+# raw deflate streams, without the zlib header and checksum
+_WBITS = -15
+
+
+def is_compact_encoded(val: str) -> bool:
+    return val.startswith(COMPACT_ENCODING_PREFIX)
+
+
+def compact_encode(serialized_value: str) -> str:
+    """Encodes a serialized value (as returned by `serialize_value`) in the compact encoding."""
+    check.str_param(serialized_value, "serialized_value")
+
+    compressor = zlib.compressobj(wbits=_WBITS, zdict=_ZDICT_V1)
+    compressed = compressor.compress(serialized_value.encode("utf-8")) + compressor.flush()
+    return COMPACT_ENCODING_PREFIX + base64.b64encode(compressed).decode("ascii")
+
+
+def compact_decode(encoded_value: str) -> str:
+    """Decodes a value encoded by `compact_encode` back to its serialized JSON form."""
+    check.str_param(encoded_value, "encoded_value")
+    check.invariant(
+        is_compact_encoded(encoded_value), "Value is not in a supported compact encoding"
+    )
+
+    decompressor = zlib.decompressobj(wbits=_WBITS, zdict=_ZDICT_V1)
+    compressed = base64.b64decode(encoded_value[len(COMPACT_ENCODING_PREFIX) :])
+    return (decompressor.decompress(compressed) + decompressor.flush()).decode("utf-8")
@@ -45,6 +45,7 @@
 from dagster._utils.cached_method import cached_method
 from dagster._utils.warnings import disable_dagster_warnings
 
+from .compact import compact_decode, is_compact_encoded
 from .errors import DeserializationError, SerdesUsageError, SerializationError
 
 ###################################################################################################
@@ -418,6 +419,9 @@ def get_storage_name(self) -> str:
 
 EMPTY_VALUES_TO_SKIP: Tuple[None, List[Any], Dict[Any, Any], Set[Any]] = (None, [], {}, set())
 
+# values of these exact types are packed as-is
+_SCALAR_TYPES = (int, float, str, bool)
+
 
 class NamedTupleSerializer(Serializer, Generic[T_NamedTuple]):
     # NOTE: See `whitelist_for_serdes` docstring for explanations of parameters.
@@ -439,6 +443,11 @@ def __init__(
         self.skip_when_empty_fields = skip_when_empty_fields or set()
         self.field_serializers = field_serializers or {}
 
+        # Per-field pack / unpack instructions are resolved once per class rather than once per
+        # serialized object (see `_get_compiled_pack_fields` and `_compile_unpack_field`).
+        self._compiled_pack_fields: Optional[Sequence[_CompiledPackField]] = None
+        self._compiled_unpack_fields: Dict[str, Optional[_CompiledUnpackField]] = {}
+
     def unpack(
         self,
         unpacked_dict: Dict[str, UnpackedValue],
@@ -448,14 +457,19 @@ def unpack(
         try:
             unpacked_dict = self.before_unpack(context, unpacked_dict)
             unpacked: Dict[str, PackableValue] = {}
+            compiled_unpack_fields = self._compiled_unpack_fields
             for key, value in unpacked_dict.items():
-                loaded_name = self.loaded_field_names.get(key, key)
+                if key in compiled_unpack_fields:
+                    compiled_field = compiled_unpack_fields[key]
+                else:
+                    compiled_field = self._compile_unpack_field(key)
+
                 # Naively implements backwards compatibility by filtering arguments that aren't present in
                 # the constructor. If a property is present in the serialized object, but doesn't exist in
                 # the version of the class loaded into memory, that property will be completely ignored.
-                if loaded_name in self.constructor_param_names:
+                if compiled_field is not None:
+                    loaded_name, custom = compiled_field
                     # custom unpack regardless of hook vs recursive descent
-                    custom = self.field_serializers.get(loaded_name)
                     if custom:
                         unpacked[loaded_name] = custom.unpack(
                             value,
@@ -509,17 +523,21 @@ def pack(
     ) -> Dict[str, JsonSerializableValue]:
         packed: Dict[str, JsonSerializableValue] = {}
         packed["__class__"] = self.get_storage_name()
-        for key, inner_value in value._asdict().items():
-            if key in self.skip_when_empty_fields and inner_value in EMPTY_VALUES_TO_SKIP:
+        # iterating the tuple directly yields values in field order, like `_asdict`, without
+        # building an intermediate dict
+        for (key, storage_key, custom, skip_when_empty), inner_value in zip(
+            self._get_compiled_pack_fields(), value
+        ):
+            if skip_when_empty and inner_value in EMPTY_VALUES_TO_SKIP:
                 continue
-            storage_key = self.storage_field_names.get(key, key)
-            custom = self.field_serializers.get(key)
             if custom:
                 packed[storage_key] = custom.pack(
                     inner_value,
                     whitelist_map=whitelist_map,
                     descent_path=f"{descent_path}.{key}",
                 )
+            elif inner_value is None or type(inner_value) in _SCALAR_TYPES:
+                packed[storage_key] = inner_value
             else:
                 packed[storage_key] = _pack_value(
                     inner_value,
@@ -541,10 +559,50 @@ def after_pack(self, **packed_dict: JsonSerializableValue) -> Dict[str, JsonSeri
     def constructor_param_names(self) -> Sequence[str]:
         return list(signature(self.klass.__new__).parameters.keys())
 
+    def _get_compiled_pack_fields(self) -> Sequence["_CompiledPackField"]:
+        if self._compiled_pack_fields is None:
+            self._compiled_pack_fields = [
+                _CompiledPackField(
+                    field_name=field_name,
+                    storage_name=self.storage_field_names.get(field_name, field_name),
+                    field_serializer=self.field_serializers.get(field_name),
+                    skip_when_empty=field_name in self.skip_when_empty_fields,
+                )
+                for field_name in self.klass._fields
+            ]
+        return self._compiled_pack_fields
+
+    def _compile_unpack_field(self, storage_key: str) -> Optional["_CompiledUnpackField"]:
+        # Resolves how a key of a serialized object is loaded, returning None if it should be
+        # ignored. Results are memoized since serialized objects of a class share the same keys.
+        loaded_name = self.loaded_field_names.get(storage_key, storage_key)
+        compiled_field = (
+            _CompiledUnpackField(
+                loaded_name=loaded_name,
+                field_serializer=self.field_serializers.get(loaded_name),
+            )
+            if loaded_name in self.constructor_param_names
+            else None
+        )
+        self._compiled_unpack_fields[storage_key] = compiled_field
+        return compiled_field
+
     def get_storage_name(self) -> str:
         return self.storage_name or self.klass.__name__
 
 
+class _CompiledPackField(NamedTuple):
+    field_name: str
+    storage_name: str
+    field_serializer: Optional["FieldSerializer"]
+    skip_when_empty: bool
+
+
+class _CompiledUnpackField(NamedTuple):
+    loaded_name: str
+    field_serializer: Optional["FieldSerializer"]
+
+
 class FieldSerializer(Serializer):
     _instance = None
 
@@ -663,11 +721,13 @@ def _pack_value(
 ) -> JsonSerializableValue:
     # this is a hot code path so we handle the common base cases without isinstance
     tval = type(val)
-    if tval in (int, float, str, bool) or val is None:
+    if tval in _SCALAR_TYPES or val is None:
         return cast(JsonSerializableValue, val)
     if tval is list:
         return [
-            _pack_value(item, whitelist_map, f"{descent_path}[{idx}]")
+            item
+            if item is None or type(item) in _SCALAR_TYPES
+            else _pack_value(item, whitelist_map, f"{descent_path}[{idx}]")
             for idx, item in enumerate(cast(list, val))
         ]
     if tval is dict:
@@ -678,13 +738,12 @@ def _pack_value(
 
     # inlined is_named_tuple_instance
     if isinstance(val, tuple) and hasattr(val, "_fields"):
-        klass_name = val.__class__.__name__
-        if not whitelist_map.has_tuple_serializer(klass_name):
+        serializer = whitelist_map.tuple_serializers.get(val.__class__.__name__)
+        if serializer is None:
             raise SerializationError(
                 "Can only serialize whitelisted namedtuples, received"
                 f" {val}.\nDescent path: {descent_path}",
             )
-        serializer = whitelist_map.get_tuple_serializer(klass_name)
         return serializer.pack(cast(NamedTuple, val), whitelist_map, descent_path)
     if isinstance(val, Enum):
         klass_name = val.__class__.__name__
@@ -776,13 +835,17 @@ def deserialize_value(
 
     Three steps:
 
-    - Parse the input string as JSON.
+    - Parse the input string as JSON. Values written in the compact encoding (see
+      `dagster._serdes.compact`) are decoded to JSON first.
     - Unpack the complex of lists, dicts, and scalars resulting from JSON parsing into a complex of richer
       Python objects (e.g. dagster-specific `NamedTuple` objects).
     - Optionally, check that the resulting object is of the expected type.
     """
     check.str_param(val, "val")
 
+    if is_compact_encoded(val):
+        val = compact_decode(val)
+
     # Never issue warnings when deserializing deprecated objects.
     with disable_dagster_warnings():
         context = UnpackContext()
@@ -811,7 +874,8 @@ def __init__(self, message: str, value: Mapping[str, UnpackedValue]):
 def _unpack_object(val: dict, whitelist_map: WhitelistMap, context: UnpackContext):
     if "__class__" in val:
         klass_name = cast(str, val["__class__"])
-        if not whitelist_map.has_tuple_deserializer(klass_name):
+        deserializer = whitelist_map.tuple_deserializers.get(klass_name)
+        if deserializer is None:
             return context.observe_unknown_value(
                 UnknownSerdesValue(
                     f'Attempted to deserialize class "{klass_name}" which is not in the whitelist.',
@@ -820,7 +884,6 @@ def _unpack_object(val: dict, whitelist_map: WhitelistMap, context: UnpackContex
             )
 
         val.pop("__class__")
-        deserializer = whitelist_map.get_tuple_deserializer(klass_name)
         return deserializer.unpack(val, whitelist_map, context)
 
     if "__enum__" in val:
@@ -1,4 +1,5 @@
 import logging
+import time
 from collections import defaultdict
 from datetime import datetime
 from typing import (
@@ -49,6 +50,106 @@
     from dagster._core.storage.event_log.base import AssetRecord
 
 
+# how long asset data can be kept by a SharedQueryerCache before it is cleared entirely
+DEFAULT_SHARED_QUERYER_CACHE_MAX_AGE_SECONDS = 300
+
+# event types whose events change the asset data kept by a SharedQueryerCache
+SHARED_QUERYER_CACHE_EVENT_TYPES = [
+    DagsterEventType.ASSET_MATERIALIZATION,
+    DagsterEventType.ASSET_OBSERVATION,
+    DagsterEventType.ASSET_MATERIALIZATION_PLANNED,
+]
+
+
+class SharedQueryerCache:
+    """Asset data that is shared by successive CachingInstanceQueryers, e.g. across the ticks of
+    the asset daemon, so that it doesn't need to be fetched again for every asset on every tick.
+
+    Only data that changes through new asset events is kept: asset records, materialized
+    partitions and the latest storage ids by asset partition. Each time the cache is used (see
+    `refresh`), the asset events stored since it was last used are fetched, and the data of the
+    assets they belong to is updated or evicted. Keeping the cache current therefore costs time
+    proportional to the number of new events rather than to the number of assets.
+
+    Wiping an asset doesn't store an event, so the cache is cleared entirely every
+    `max_age_seconds`, or whenever events have been deleted from the event log.
+    """
+
+    def __init__(self, max_age_seconds: float = DEFAULT_SHARED_QUERYER_CACHE_MAX_AGE_SECONDS):
+        self._max_age_seconds = check.numeric_param(max_age_seconds, "max_age_seconds")
+        self._cleared_at: Optional[float] = None
+        # storage id of the latest event reflected in the cached data
+        self._latest_storage_id: Optional[int] = None
+
+        self.asset_records: Dict[AssetKey, Optional["AssetRecord"]] = {}
+        self.materialized_partitions: Dict[AssetKey, Set[str]] = {}
+        self.latest_storage_ids_by_asset_partition: Dict[
+            Tuple[AssetKey, DagsterEventType, bool], Mapping[AssetKeyPartitionKey, Optional[int]]
+        ] = {}
+
+    @property
+    def latest_storage_id(self) -> Optional[int]:
+        return self._latest_storage_id
+
+    def _clear(self, latest_storage_id: Optional[int]) -> None:
+        self._cleared_at = time.time()
+        self._latest_storage_id = latest_storage_id
+        self.asset_records.clear()
+        self.materialized_partitions.clear()
+        self.latest_storage_ids_by_asset_partition.clear()
+
+    def _evict(self, asset_key: AssetKey) -> None:
+        self.asset_records.pop(asset_key, None)
+        for cache_key in [
+            cache_key
+            for cache_key in self.latest_storage_ids_by_asset_partition
+            if cache_key[0] == asset_key
+        ]:
+            del self.latest_storage_ids_by_asset_partition[cache_key]
+
+    def refresh(self, instance: DagsterInstance) -> None:
+        """Brings the cached data up to date with the events stored since the last refresh."""
+        from dagster._core.event_api import EventRecordsFilter
+
+        latest_storage_id = instance.event_log_storage.get_maximum_record_id()
+
+        if (
+            self._cleared_at is None
+            or time.time() - self._cleared_at > self._max_age_seconds
+            or latest_storage_id is None
+            or self._latest_storage_id is None
+            or latest_storage_id < self._latest_storage_id
+        ):
+            self._clear(latest_storage_id)
+            return
+
+        if latest_storage_id == self._latest_storage_id:
+            return
+
+        for event_type in SHARED_QUERYER_CACHE_EVENT_TYPES:
+            records = instance.get_event_records(
+                EventRecordsFilter(
+                    event_type=event_type,
+                    after_cursor=self._latest_storage_id,
+                    before_cursor=latest_storage_id + 1,
+                ),
+                ascending=True,
+            )
+            for record in records:
+                asset_key = record.asset_key
+                if asset_key is None:
+                    continue
+                self._evict(asset_key)
+                if (
+                    event_type == DagsterEventType.ASSET_MATERIALIZATION
+                    and record.partition_key is not None
+                    and asset_key in self.materialized_partitions
+                ):
+                    self.materialized_partitions[asset_key].add(record.partition_key)
+
+        self._latest_storage_id = latest_storage_id
+
+
 class CachingInstanceQueryer(DynamicPartitionsStore):
     """Provides utility functions for querying for asset-materialization related data from the
     instance which will attempt to limit redundant expensive calls. Intended for use within the
@@ -56,6 +157,8 @@ class CachingInstanceQueryer(DynamicPartitionsStore):
 
     Args:
         instance (DagsterInstance): The instance to query.
+        shared_cache (Optional[SharedQueryerCache]): Asset data cached by previous queryers, which
+            is brought up to date and then used and added to by this queryer.
     """
 
     def __init__(
@@ -64,15 +167,21 @@ def __init__(
         asset_graph: AssetGraph,
         evaluation_time: Optional[datetime] = None,
         logger: Optional[logging.Logger] = None,
+        shared_cache: Optional[SharedQueryerCache] = None,
     ):
         self._instance = instance
         self._asset_graph = asset_graph
         self._logger = logger or logging.getLogger("dagster")
+        self._shared_cache = check.opt_inst_param(shared_cache, "shared_cache", SharedQueryerCache)
 
         self._asset_record_cache: Dict[AssetKey, Optional[AssetRecord]] = {}
         self._asset_partitions_cache: Dict[Optional[int], Dict[AssetKey, Set[str]]] = defaultdict(
             dict
         )
+        if self._shared_cache is not None:
+            self._shared_cache.refresh(instance)
+            self._asset_record_cache = self._shared_cache.asset_records
+            self._asset_partitions_cache[None] = self._shared_cache.materialized_partitions
         self._asset_partition_versions_updated_after_cursor_cache: Dict[
             AssetKeyPartitionKey, int
         ] = {}
@@ -139,6 +248,13 @@ def get_failed_or_in_progress_subset(self, *, asset_key: AssetKey) -> Partitions
         if cache_value is None:
             return partitions_def.empty_subset()
 
+        if asset_record is not None and asset_record.asset_entry.cached_status != cache_value:
+            # keep the cached record in sync with the updated status cache, so that it can be
+            # updated incrementally the next time it is read from the record
+            self._asset_record_cache[asset_key] = asset_record._replace(
+                asset_entry=asset_record.asset_entry._replace(cached_status=cache_value)
+            )
+
         return cache_value.deserialize_failed_partition_subsets(
             partitions_def
         ) | cache_value.deserialize_in_progress_partition_subsets(partitions_def)
@@ -232,6 +348,17 @@ def _get_latest_materialization_or_observation_storage_ids_by_asset_partition(
         Note that for partitioned assets, an asset partition with a None partition key will be
         present in the mapping, representing the latest storage id for the asset as a whole.
         """
+        shared_cache_key = (
+            asset_key,
+            self._event_type_for_key(asset_key),
+            self.asset_graph.is_partitioned(asset_key),
+        )
+        if (
+            self._shared_cache is not None
+            and shared_cache_key in self._shared_cache.latest_storage_ids_by_asset_partition
+        ):
+            return self._shared_cache.latest_storage_ids_by_asset_partition[shared_cache_key]
+
         asset_partition = AssetKeyPartitionKey(asset_key)
         latest_record = self._get_latest_materialization_or_observation_record(
             asset_partition=asset_partition
@@ -248,6 +375,10 @@ def _get_latest_materialization_or_observation_storage_ids_by_asset_partition(
                     ).items()
                 }
             )
+        if self._shared_cache is not None:
+            self._shared_cache.latest_storage_ids_by_asset_partition[
+                shared_cache_key
+            ] = latest_storage_ids
         return latest_storage_ids
 
     def get_latest_materialization_or_observation_storage_id(
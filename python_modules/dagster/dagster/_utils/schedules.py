@@ -1,7 +1,8 @@
 import calendar
 import datetime
 import functools
-from typing import Iterator, Optional, Sequence, Union
+import math
+from typing import Iterator, NamedTuple, Optional, Sequence, Union
 
 import pendulum
 import pytz
@@ -61,6 +62,152 @@ def is_valid_cron_schedule(cron_schedule: Union[str, Sequence[str]]) -> bool:
     )
 
 
+_EPOCH = datetime.datetime(1970, 1, 1)
+
+# the day of the week (as a cron day of the week, where 0 is Sunday) of the epoch
+_EPOCH_DAY_OF_WEEK = 4
+
+_SECONDS_PER_DAY = 24 * 60 * 60
+
+
+class RegularCronSchedule(NamedTuple):
+    """A cron schedule whose ticks can be computed in closed form, instead of by iterating over
+    the schedule with croniter.
+
+    This covers schedules whose ticks are a fixed number of seconds apart (e.g. every 15 minutes,
+    hourly, daily or weekly schedules) and monthly schedules on a day that exists in every month,
+    in timezones with a fixed UTC offset. Ticks are numbered consecutively: the tick with index
+    i + 1 is the tick after the tick with index i.
+    """
+
+    utc_offset_seconds: int
+    # the number of seconds between consecutive ticks, or None for monthly schedules
+    period_seconds: Optional[int]
+    # for schedules with a fixed period, the timestamp of the tick with index 0. For monthly
+    # schedules, the number of seconds from the start of each (local) month to its tick
+    offset_seconds: int
+
+    def get_timestamp(self, tick_index: int) -> int:
+        """Returns the timestamp of the tick with the given index."""
+        if self.period_seconds is not None:
+            return self.offset_seconds + tick_index * self.period_seconds
+
+        # monthly ticks are indexed by the number of months since the epoch
+        years, month = divmod(tick_index, 12)
+        return (
+            calendar.timegm((1970 + years, month + 1, 1, 0, 0, 0))
+            + self.offset_seconds
+            - self.utc_offset_seconds
+        )
+
+    def get_local_datetime(self, tick_index: int) -> datetime.datetime:
+        """Returns the naive local datetime of the tick with the given index."""
+        return _EPOCH + datetime.timedelta(
+            seconds=self.get_timestamp(tick_index) + self.utc_offset_seconds
+        )
+
+    def get_index_at_or_before(self, timestamp: float) -> int:
+        """Returns the index of the latest tick at or before the given timestamp."""
+        if self.period_seconds is not None:
+            return math.floor((timestamp - self.offset_seconds) / self.period_seconds)
+
+        local_datetime = _EPOCH + datetime.timedelta(seconds=timestamp + self.utc_offset_seconds)
+        tick_index = (local_datetime.year - 1970) * 12 + local_datetime.month - 1
+        return tick_index if self.get_timestamp(tick_index) <= timestamp else tick_index - 1
+
+    def get_index_at_or_after(self, timestamp: float) -> int:
+        """Returns the index of the earliest tick at or after the given timestamp."""
+        tick_index = self.get_index_at_or_before(timestamp)
+        return tick_index if self.get_timestamp(tick_index) >= timestamp else tick_index + 1
+
+
+def _parse_cron_field(field: str, max_value: int) -> Optional[int]:
+    return int(field) if field.isdigit() and int(field) <= max_value else None
+
+
+def _parse_cron_step(field: str) -> Optional[int]:
+    """Returns the step of a field like '*' or '*/15'."""
+    if field == "*":
+        return 1
+    if field.startswith("*/") and field[2:].isdigit() and int(field[2:]) > 0:
+        return int(field[2:])
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def get_regular_cron_schedule(
+    cron_string: str, execution_timezone: Optional[str]
+) -> Optional[RegularCronSchedule]:
+    """Returns a RegularCronSchedule for the given cron string and timezone, or None if the ticks
+    of the schedule can't be computed in closed form.
+    """
+    try:
+        timezone = pytz.timezone(execution_timezone or "UTC")
+    except pytz.UnknownTimeZoneError:
+        return None
+    # ticks in timezones with daylight savings time transitions aren't evenly spaced
+    if timezone is not pytz.utc and not isinstance(timezone, pytz.tzinfo.StaticTzInfo):
+        return None
+    utc_offset_timedelta = timezone.utcoffset(_EPOCH)
+    if utc_offset_timedelta is None:
+        return None
+    utc_offset_seconds = int(utc_offset_timedelta.total_seconds())
+
+    fields = cron_string.split()
+    if len(fields) != 5 or fields[3] != "*":
+        return None
+    minute_field, hour_field, day_of_month_field, _, day_of_week_field = fields
+
+    minute = _parse_cron_field(minute_field, 59)
+    hour = _parse_cron_field(hour_field, 23)
+    minute_step = _parse_cron_step(minute_field)
+    hour_step = _parse_cron_step(hour_field)
+
+    if day_of_month_field == "*" and day_of_week_field == "*":
+        if minute_step is not None and hour_field == "*" and 60 % minute_step == 0:
+            # e.g. "*/15 * * * *"
+            period_seconds, local_offset_seconds = minute_step * 60, 0
+        elif minute is not None and hour_step is not None and 24 % hour_step == 0:
+            # e.g. "30 * * * *" or "0 */6 * * *"
+            period_seconds, local_offset_seconds = hour_step * 3600, minute * 60
+        elif minute is not None and hour is not None:
+            # e.g. "0 0 * * *"
+            period_seconds, local_offset_seconds = _SECONDS_PER_DAY, hour * 3600 + minute * 60
+        else:
+            return None
+    elif minute is None or hour is None:
+        return None
+    elif day_of_month_field == "*":
+        # e.g. "0 0 * * 1"
+        day_of_week = _parse_cron_field(day_of_week_field, 7)
+        if day_of_week is None:
+            return None
+        period_seconds = 7 * _SECONDS_PER_DAY
+        local_offset_seconds = (
+            ((day_of_week - _EPOCH_DAY_OF_WEEK) % 7) * _SECONDS_PER_DAY
+            + hour * 3600
+            + minute * 60
+        )
+    elif day_of_week_field == "*":
+        # e.g. "0 0 1 * *". Days after the 28th don't exist in every month
+        day_of_month = _parse_cron_field(day_of_month_field, 28)
+        if not day_of_month:
+            return None
+        return RegularCronSchedule(
+            utc_offset_seconds=utc_offset_seconds,
+            period_seconds=None,
+            offset_seconds=(day_of_month - 1) * _SECONDS_PER_DAY + hour * 3600 + minute * 60,
+        )
+    else:
+        return None
+
+    return RegularCronSchedule(
+        utc_offset_seconds=utc_offset_seconds,
+        period_seconds=period_seconds,
+        offset_seconds=(local_offset_seconds - utc_offset_seconds) % period_seconds,
+    )
+
+
 def cron_string_iterator(
     start_timestamp: float,
     cron_string: str,
@@ -1,9 +1,11 @@
+import os
 import sys
 from contextlib import contextmanager
 
 import pytest
 from dagster import IntMetadataValue, TextMetadataValue, job, op, repository
 from dagster._api.snapshot_repository import (
+    _deserialize_external_repository_chunks,
     sync_get_streaming_external_repositories_data_grpc,
 )
 from dagster._core.errors import DagsterUserCodeProcessError
@@ -18,6 +20,14 @@
 from dagster._core.instance import DagsterInstance
 from dagster._core.test_utils import instance_for_test
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
+from dagster._grpc.snapshot_cache import RepositorySnapshotCache
+from dagster._grpc.snapshot_streaming import (
+    GZIP_COMPRESSION_CODEC,
+    build_repository_data_from_parts,
+    decode_repository_data_parts,
+    encode_repository_data_parts,
+    iter_serialized_repository_data_parts,
+)
 from dagster._serdes.serdes import deserialize_value
 
 from .utils import get_bar_repo_code_location
@@ -41,6 +51,171 @@ def test_streaming_external_repositories_api_grpc(instance):
         }
 
 
+def test_streaming_external_repositories_snapshot_parts(instance):
+    with get_bar_repo_code_location(instance) as code_location:
+        repo_origin = ExternalRepositoryOrigin(code_location.origin, "bar_repo")
+        serialized_repo_data = "".join(
+            chunk["serialized_external_repository_chunk"]
+            for chunk in code_location.client.streaming_external_repository(repo_origin)
+        )
+
+        chunks = list(
+            code_location.client.streaming_external_repository(
+                repo_origin,
+                stream_snapshot_parts=True,
+                accepted_compression_codecs=[GZIP_COMPRESSION_CODEC],
+            )
+        )
+        assert all(chunk["compression_codec"] == GZIP_COMPRESSION_CODEC for chunk in chunks)
+        assert all(not chunk["serialized_external_repository_chunk"] for chunk in chunks)
+
+        external_repository_data = build_repository_data_from_parts(
+            decode_repository_data_parts(
+                [chunk["snapshot_parts_chunk"] for chunk in chunks], GZIP_COMPRESSION_CODEC
+            )
+        )
+        assert external_repository_data == deserialize_value(
+            serialized_repo_data, ExternalRepositoryData
+        )
+
+
+def test_deserialize_chunks_from_server_without_snapshot_parts(instance):
+    with get_bar_repo_code_location(instance) as code_location:
+        # servers that predate snapshot parts ignore the request flag and send string chunks
+        chunks = [
+            {"serialized_external_repository_chunk": chunk["serialized_external_repository_chunk"]}
+            for chunk in code_location.client.streaming_external_repository(
+                ExternalRepositoryOrigin(code_location.origin, "bar_repo")
+            )
+        ]
+
+    external_repository_data, snapshot_hash = _deserialize_external_repository_chunks(iter(chunks))
+    assert snapshot_hash is None
+    assert isinstance(external_repository_data, ExternalRepositoryData)
+    assert external_repository_data.name == "bar_repo"
+
+
+@pytest.mark.parametrize("compression_codec", [None, GZIP_COMPRESSION_CODEC])
+def test_snapshot_parts_round_trip(instance, compression_codec):
+    with get_bar_repo_code_location(instance) as code_location:
+        external_repository_data = deserialize_value(
+            code_location.client.external_repository(
+                ExternalRepositoryOrigin(code_location.origin, "bar_repo")
+            ),
+            ExternalRepositoryData,
+        )
+
+    # a tiny chunk size splits parts (and multi-byte characters) across chunks
+    chunks = list(
+        encode_repository_data_parts(
+            iter_serialized_repository_data_parts(external_repository_data),
+            chunk_size=7,
+            compression_codec=compression_codec,
+        )
+    )
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 7 for chunk in chunks)
+    assert (
+        build_repository_data_from_parts(decode_repository_data_parts(chunks, compression_codec))
+        == external_repository_data
+    )
+
+
+def test_repository_snapshot_hash(instance):
+    with get_bar_repo_code_location(instance) as code_location:
+        repo_origin = ExternalRepositoryOrigin(code_location.origin, "bar_repo")
+
+        snapshot_hash = code_location.client.get_repository_snapshot_hash(repo_origin).snapshot_hash
+        assert snapshot_hash
+        assert code_location.client.get_repository_snapshot_hash(repo_origin).snapshot_hash == (
+            snapshot_hash
+        )
+        assert (
+            code_location.client.get_repository_snapshot_hash(
+                repo_origin, defer_snapshots=True
+            ).snapshot_hash
+            != snapshot_hash
+        )
+
+        # the hash is reported alongside the snapshot itself
+        chunks = list(
+            code_location.client.streaming_external_repository(
+                repo_origin, stream_snapshot_parts=True
+            )
+        )
+        assert all(chunk["snapshot_hash"] == snapshot_hash for chunk in chunks)
+
+        error_reply = code_location.client.get_repository_snapshot_hash(
+            ExternalRepositoryOrigin(code_location.origin, "does_not_exist")
+        )
+        assert not error_reply.snapshot_hash
+        assert "does_not_exist" in error_reply.serialized_error
+
+
+def test_streaming_external_repositories_uses_snapshot_cache(instance, tmpdir, monkeypatch):
+    monkeypatch.setenv("DAGSTER_REPOSITORY_SNAPSHOT_CACHE_DIR", str(tmpdir))
+
+    with get_bar_repo_code_location(instance) as code_location:
+        external_repository_data = sync_get_streaming_external_repositories_data_grpc(
+            code_location.client, code_location
+        )["bar_repo"]
+        snapshot_hash = code_location.client.get_repository_snapshot_hash(
+            ExternalRepositoryOrigin(code_location.origin, "bar_repo")
+        ).snapshot_hash
+
+        assert os.listdir(str(tmpdir)) == [snapshot_hash]
+
+        # unchanged snapshots are not fetched again
+        fetched_chunks = []
+        original_streaming_external_repository = code_location.client.streaming_external_repository
+
+        def _streaming_external_repository(*args, **kwargs):
+            for chunk in original_streaming_external_repository(*args, **kwargs):
+                fetched_chunks.append(chunk)
+                yield chunk
+
+        monkeypatch.setattr(
+            code_location.client, "streaming_external_repository", _streaming_external_repository
+        )
+        assert (
+            sync_get_streaming_external_repositories_data_grpc(
+                code_location.client, code_location
+            )["bar_repo"]
+            is external_repository_data
+        )
+        assert not fetched_chunks
+
+    # a new process reads the snapshot back from disk
+    assert RepositorySnapshotCache(str(tmpdir)).get(snapshot_hash) == external_repository_data
+
+
+def test_repository_snapshot_cache(tmpdir, instance):
+    with get_bar_repo_code_location(instance) as code_location:
+        external_repository_data = deserialize_value(
+            code_location.client.external_repository(
+                ExternalRepositoryOrigin(code_location.origin, "bar_repo")
+            ),
+            ExternalRepositoryData,
+        )
+
+    in_memory_cache = RepositorySnapshotCache(max_entries=1)
+    in_memory_cache.set("abc", external_repository_data)
+    assert in_memory_cache.get("abc") is external_repository_data
+    in_memory_cache.set("def", external_repository_data)
+    assert in_memory_cache.get("abc") is None
+    assert in_memory_cache.get("def") is external_repository_data
+
+    on_disk_cache = RepositorySnapshotCache(str(tmpdir))
+    assert on_disk_cache.get("abc") is None
+    on_disk_cache.set("abc", external_repository_data)
+    assert RepositorySnapshotCache(str(tmpdir)).get("abc") == external_repository_data
+
+    # unreadable entries are treated as misses
+    with open(os.path.join(str(tmpdir), "corrupt"), "w") as f:
+        f.write("not a snapshot")
+    assert RepositorySnapshotCache(str(tmpdir)).get("corrupt") is None
+
+
 def test_streaming_external_repositories_error(instance):
     with get_bar_repo_code_location(instance) as code_location:
         code_location.repository_names = {"does_not_exist"}
@@ -802,3 +802,79 @@ def asset_fn():
 
     for key in [AssetKey(["asset0"]), foo_check, bar_check]:
         assert asset_graph.get_required_asset_and_check_keys(key) == set()
+
+
+def test_asset_graph_index(asset_graph_from_assets):
+    @asset
+    def a():
+        ...
+
+    @asset
+    def b(a):
+        ...
+
+    @asset
+    def c(a):
+        ...
+
+    @asset
+    def d(b, c):
+        ...
+
+    @asset(
+        partitions_def=DailyPartitionsDefinition(start_date="2022-01-01"),
+        ins={
+            "e": AssetIn(
+                partition_mapping=TimeWindowPartitionMapping(start_offset=-1, end_offset=-1)
+            )
+        },
+    )
+    def e(d, e):
+        ...
+
+    @asset
+    def f():
+        ...
+
+    asset_graph = asset_graph_from_assets([a, b, c, d, e, f])
+    index = asset_graph.get_index()
+    a_key, b_key, c_key, d_key, e_key, f_key = (
+        AssetKey(name) for name in ["a", "b", "c", "d", "e", "f"]
+    )
+
+    assert [index.get_level(key) for key in [a_key, b_key, c_key, d_key, e_key, f_key]] == [
+        0,
+        1,
+        1,
+        2,
+        3,
+        0,
+    ]
+    assert list(index.get_keys_by_level()) == [
+        set(level) for level in asset_graph.toposort_asset_keys()
+    ]
+    assert index.to_keys(index.to_bits([a_key, d_key, AssetKey("missing")])) == {a_key, d_key}
+
+    assert asset_graph.get_ancestors(e_key) == {a_key, b_key, c_key, d_key}
+    assert asset_graph.get_ancestors(e_key, include_self=True) == {
+        a_key,
+        b_key,
+        c_key,
+        d_key,
+        e_key,
+    }
+    assert asset_graph.get_ancestors(f_key) == set()
+
+    assert index.get_connected_keys([a_key], "downstream") == {b_key, c_key, d_key, e_key}
+    assert index.get_connected_keys([a_key], "downstream", depth=1) == {b_key, c_key}
+    assert index.get_connected_keys([b_key, c_key], "upstream") == {a_key}
+    # keys are only included if they're reachable from one of the given keys
+    assert index.get_connected_keys([a_key, b_key], "downstream", depth=1) == {b_key, c_key, d_key}
+    assert index.get_connected_keys([e_key], "upstream", depth=1) == {d_key, e_key}
+
+    all_keys = {a_key, b_key, c_key, d_key, e_key, f_key}
+    assert index.get_sinks(all_keys) == {e_key, f_key}
+    assert index.get_sinks({a_key, b_key, c_key}) == {b_key, c_key}
+    assert index.get_sources(all_keys) == {a_key, f_key}
+    assert index.get_sources({b_key, e_key}) == {b_key}
+    assert index.get_sources({AssetKey("missing"), e_key}) == {AssetKey("missing"), e_key}
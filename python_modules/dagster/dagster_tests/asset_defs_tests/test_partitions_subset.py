@@ -1,7 +1,12 @@
 import pytest
 from dagster import DailyPartitionsDefinition, MultiPartitionsDefinition, StaticPartitionsDefinition
 from dagster._core.definitions.multi_dimensional_partitions import MultiPartitionsSubset
-from dagster._core.definitions.partition import DefaultPartitionsSubset
+from dagster._core.definitions.partition import (
+    BITMAP_PARTITIONS_SUBSET_MIN_PARTITIONS,
+    BitmapPartitionsSubset,
+    DefaultPartitionsSubset,
+)
+from dagster._core.definitions.partition_key_range import PartitionKeyRange
 from dagster._core.definitions.time_window_partitions import (
     TimeWindowPartitionsSubset,
 )
@@ -78,3 +83,89 @@ def test_empty_subsets():
     assert type(composite.empty_subset()) is MultiPartitionsSubset
     assert type(static_partitions.empty_subset()) is DefaultPartitionsSubset
     assert type(time_window_partitions.empty_subset()) is TimeWindowPartitionsSubset
+
+
+def test_large_static_partitions_use_bitmap_subsets():
+    assert type(StaticPartitionsDefinition(["a"]).empty_subset()) is DefaultPartitionsSubset
+    partitions_def = StaticPartitionsDefinition(
+        [str(i) for i in range(BITMAP_PARTITIONS_SUBSET_MIN_PARTITIONS)]
+    )
+    assert type(partitions_def.empty_subset()) is BitmapPartitionsSubset
+
+
+def test_bitmap_subset():
+    partitions_def = StaticPartitionsDefinition(
+        [str(i) for i in range(BITMAP_PARTITIONS_SUBSET_MIN_PARTITIONS)]
+    )
+    subset = partitions_def.empty_subset()
+    assert len(subset) == 0
+
+    subset = subset.with_partition_keys(["1", "2", "3", "7"])
+    assert len(subset) == 4
+    assert "2" in subset
+    assert "4" not in subset
+    assert "not_a_partition" not in subset
+    assert subset.get_partition_keys() == ["1", "2", "3", "7"]
+    assert subset.get_partition_key_ranges() == [
+        PartitionKeyRange("1", "3"),
+        PartitionKeyRange("7", "7"),
+    ]
+    assert len(list(subset.get_partition_keys_not_in_subset())) == (
+        BITMAP_PARTITIONS_SUBSET_MIN_PARTITIONS - 4
+    )
+
+    other = partitions_def.empty_subset().with_partition_key_range(PartitionKeyRange("3", "5"))
+    assert (subset | other).get_partition_keys() == ["1", "2", "3", "4", "5", "7"]
+    assert (subset - other).get_partition_keys() == ["1", "2", "7"]
+    assert (subset & other).get_partition_keys() == ["3"]
+    assert subset.with_partition_key_range(PartitionKeyRange("5", "3")) == subset
+
+    # mixing with other subset types falls back to key-based set operations
+    default_subset = DefaultPartitionsSubset(partitions_def, {"7", "8"})
+    assert set((subset | default_subset).get_partition_keys()) == {"1", "2", "3", "7", "8"}
+    assert set((subset & default_subset).get_partition_keys()) == {"7"}
+
+    # keys outside of the partitions definition can't be represented in the bitmap, and are kept
+    # by falling back to a set of keys
+    with_unknown_key = subset.with_partition_keys(["not_a_partition"])
+    assert type(with_unknown_key) is DefaultPartitionsSubset
+    assert set(with_unknown_key.get_partition_keys()) == {"1", "2", "3", "7", "not_a_partition"}
+
+
+def test_bitmap_subset_serialization():
+    partitions_def = StaticPartitionsDefinition([str(i) for i in range(100_000)])
+    subset = partitions_def.subset_with_partition_keys(
+        [str(i) for i in range(100_000) if i % 1000 != 0]
+    )
+
+    serialized = subset.serialize()
+    assert len(serialized) < 2000
+    assert partitions_def.deserialize_subset(serialized) == subset
+    assert partitions_def.deserialize_subset(partitions_def.empty_subset().serialize()) == (
+        partitions_def.empty_subset()
+    )
+
+    unique_id = partitions_def.get_serializable_unique_identifier()
+    class_name = partitions_def.__class__.__name__
+    assert partitions_def.can_deserialize_subset(serialized, unique_id, class_name)
+    assert not partitions_def.can_deserialize_subset(serialized, None, class_name)
+    assert not partitions_def.can_deserialize_subset(serialized, "other_id", class_name)
+    assert not partitions_def.can_deserialize_subset(serialized, unique_id, "OtherClass")
+
+    # bitmaps can't be read back once the definition has shrunk below the threshold
+    small_partitions_def = StaticPartitionsDefinition(["0", "1"])
+    assert not small_partitions_def.can_deserialize_subset(serialized, unique_id, class_name)
+
+    # subsets serialized by DefaultPartitionsSubset remain readable
+    for serialized_default in ['["5", "2"]', '{"version": 1, "subset": ["5", "2"]}']:
+        assert partitions_def.can_deserialize_subset(serialized_default, unique_id, class_name)
+        assert partitions_def.deserialize_subset(serialized_default).get_partition_keys() == [
+            "2",
+            "5",
+        ]
+
+    class NewSerializationVersionSubset(BitmapPartitionsSubset):
+        SERIALIZATION_VERSION = -3
+
+    with pytest.raises(DagsterInvalidDeserializationVersionError, match="version -3"):
+        NewSerializationVersionSubset.from_serialized(partitions_def, serialized)
@@ -12,7 +12,7 @@
 from dagster._core.events import DagsterEvent, DagsterEventType
 from dagster._core.execution.api import create_execution_plan
 from dagster._core.execution.plan.instance_concurrency_context import InstanceConcurrencyContext
-from dagster._core.execution.plan.objects import StepRetryData, StepSuccessData
+from dagster._core.execution.plan.objects import StepFailureData, StepRetryData, StepSuccessData
 from dagster._core.execution.plan.outputs import StepOutputData, StepOutputHandle
 from dagster._core.execution.retries import RetryMode
 from dagster._core.storage.tags import GLOBAL_CONCURRENCY_TAG
@@ -354,3 +354,88 @@ def test_active_concurrency_sleep():
             )
             assert math.isclose(active_execution.sleep_interval(), 2.0, abs_tol=0.1)
             active_execution.mark_interrupted()
+
+
+def define_diamond_job():
+    @op
+    def start():
+        return 1
+
+    @op
+    def left(x):
+        return x
+
+    @op
+    def right(x):
+        return x
+
+    @op
+    def join(a, b):
+        return a + b
+
+    @op
+    def after_join(x):
+        return x
+
+    @job
+    def diamond_job():
+        x = start()
+        after_join(join(left(x), right(x)))
+
+    return diamond_job
+
+
+def _step_success_event(job_name: str, step_key: str) -> DagsterEvent:
+    return DagsterEvent(
+        DagsterEventType.STEP_SUCCESS.value,
+        job_name=job_name,
+        event_specific_data=StepSuccessData(duration_ms=10.0),
+        step_key=step_key,
+    )
+
+
+def _step_output_event(job_name: str, step_key: str) -> DagsterEvent:
+    return DagsterEvent(
+        DagsterEventType.STEP_OUTPUT.value,
+        job_name=job_name,
+        event_specific_data=StepOutputData(StepOutputHandle(step_key, "result")),
+        step_key=step_key,
+    )
+
+
+def test_active_readiness_tracking():
+    diamond_job = define_diamond_job()
+
+    with create_execution_plan(diamond_job).start(RetryMode.DISABLED) as active_execution:
+        assert [step.key for step in active_execution.get_steps_to_execute()] == ["start"]
+        assert not active_execution.get_steps_to_execute()
+
+        active_execution.handle_event(_step_output_event(diamond_job.name, "start"))
+        active_execution.handle_event(_step_success_event(diamond_job.name, "start"))
+        assert [step.key for step in active_execution.get_steps_to_execute()] == [
+            "left",
+            "right",
+        ]
+
+        # join is only ready once both of its upstream steps have completed
+        active_execution.handle_event(_step_output_event(diamond_job.name, "left"))
+        active_execution.handle_event(_step_success_event(diamond_job.name, "left"))
+        assert not active_execution.get_steps_to_execute()
+
+        active_execution.handle_event(
+            DagsterEvent(
+                DagsterEventType.STEP_FAILURE.value,
+                job_name=diamond_job.name,
+                event_specific_data=StepFailureData(error=None, user_failure_data=None),
+                step_key="right",
+            )
+        )
+        assert not active_execution.get_steps_to_execute()
+
+        # failures propagate to all transitive downstream steps as they are abandoned
+        assert [step.key for step in active_execution.get_steps_to_abandon()] == ["join"]
+        active_execution.mark_abandoned("join")
+        assert [step.key for step in active_execution.get_steps_to_abandon()] == ["after_join"]
+        active_execution.mark_abandoned("after_join")
+
+        assert active_execution.is_complete
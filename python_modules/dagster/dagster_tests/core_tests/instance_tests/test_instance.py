@@ -1,7 +1,9 @@
 import os
 import re
 import tempfile
-from typing import Any, Mapping, Optional
+import threading
+import time
+from typing import Any, Mapping, Optional, Sequence
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -31,6 +33,7 @@
 )
 from dagster._core.event_api import EventRecordsFilter
 from dagster._core.events import DagsterEventType
+from dagster._core.events.log import EventLogEntry
 from dagster._core.execution.api import create_execution_plan
 from dagster._core.instance import DagsterInstance, InstanceRef
 from dagster._core.instance.config import DEFAULT_LOCAL_CODE_SERVER_STARTUP_TIMEOUT
@@ -45,6 +48,9 @@
     AssetPartitionStatus,
     AssetStatusCacheValue,
 )
+from dagster._core.storage.event_log.schema import SqlEventLogStorageTable
+from dagster._core.storage.runs.schema import RunsTable
+from dagster._core.storage.sqlalchemy_compat import db_select
 from dagster._core.storage.sqlite_storage import (
     _event_logs_directory,
     _runs_directory,
@@ -63,6 +69,7 @@
 )
 from dagster._daemon.asset_daemon import AssetDaemon
 from dagster._serdes import ConfigurableClass
+from dagster._serdes.compact import is_compact_encoded
 from dagster._serdes.config_class import ConfigurableClassData
 from typing_extensions import Self
 
@@ -517,6 +524,144 @@ def test_cancellation_thread():
         assert instance.cancellation_thread_poll_interval_seconds == 10
 
 
+def test_buffered_event_writes():
+    @op
+    def noisy_op(context):
+        for i in range(10):
+            context.log.info(f"message {i}")
+
+    @job
+    def noisy_job():
+        noisy_op()
+
+    with instance_for_test(
+        overrides={"event_log_buffer": {"enabled": True, "flush_size": 4}}
+    ) as instance:
+        assert instance.event_log_buffer_enabled
+        assert instance.event_log_buffer_flush_size == 4
+
+        with patch.object(
+            instance.event_log_storage,
+            "store_events",
+            wraps=instance.event_log_storage.store_events,
+        ) as store_events_mock:
+            result = noisy_job.execute_in_process(instance=instance)
+            assert result.success
+            assert store_events_mock.call_count > 0
+
+        run = instance.get_run_by_id(result.run_id)
+        assert run and run.is_success
+        messages = [
+            event.user_message
+            for event in instance.all_logs(result.run_id)
+            if not event.is_dagster_event
+        ]
+        assert [message for message in messages if message.startswith("message")] == [
+            f"message {i}" for i in range(10)
+        ]
+
+    with instance_for_test() as instance:
+        assert not instance.event_log_buffer_enabled
+        with patch.object(instance.event_log_storage, "store_events") as store_events_mock:
+            assert noisy_job.execute_in_process(instance=instance).success
+            assert store_events_mock.call_count == 0
+
+
+def _log_entry(run_id: str, message: str) -> EventLogEntry:
+    return EventLogEntry(
+        error_info=None,
+        level="INFO",
+        user_message=message,
+        run_id=run_id,
+        timestamp=time.time(),
+    )
+
+
+def test_buffered_event_writes_scope():
+    with instance_for_test() as instance:
+        with instance.buffered_event_writes("run_a", flush_size=100, flush_interval=60):
+            instance.handle_new_event(_log_entry("run_a", "buffered"))
+            assert instance.all_logs("run_a") == []
+
+            # events for other runs are written immediately
+            instance.handle_new_event(_log_entry("run_b", "other run"))
+            assert len(instance.all_logs("run_b")) == 1
+
+            # as are events for the same run handled on another thread
+            thread = threading.Thread(
+                target=instance.handle_new_event, args=(_log_entry("run_a", "other thread"),)
+            )
+            thread.start()
+            thread.join()
+            assert [event.user_message for event in instance.all_logs("run_a")] == [
+                "other thread"
+            ]
+
+        assert [event.user_message for event in instance.all_logs("run_a")] == [
+            "other thread",
+            "buffered",
+        ]
+
+
+def test_buffered_event_writes_flush_interval():
+    with instance_for_test() as instance:
+        with instance.buffered_event_writes("run_a", flush_size=100, flush_interval=0.1):
+            instance.handle_new_event(_log_entry("run_a", "buffered"))
+
+            # flushed by the background thread without any further events being written
+            start = time.time()
+            while not instance.all_logs("run_a"):
+                assert time.time() - start < 10, "Timed out waiting for buffered event to flush"
+                time.sleep(0.05)
+
+
+def _raw_run_and_event_bodies(instance: DagsterInstance, run_id: str) -> Sequence[str]:
+    run_bodies = instance.run_storage.fetchall(  # type: ignore
+        db_select([RunsTable.c.run_body]).where(RunsTable.c.run_id == run_id)
+    )
+    with instance.event_log_storage.run_connection(run_id) as conn:  # type: ignore
+        event_bodies = conn.execute(
+            db_select([SqlEventLogStorageTable.c.event]).where(
+                SqlEventLogStorageTable.c.run_id == run_id
+            )
+        ).fetchall()
+    return [row["run_body"] for row in run_bodies] + [row[0] for row in event_bodies]
+
+
+def test_compact_encoding():
+    @op
+    def noisy_op(context):
+        context.log.info("hello")
+
+    @job
+    def noisy_job():
+        noisy_op()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with instance_for_test(temp_dir=temp_dir) as instance:
+            assert not instance.event_log_compact_encoding_enabled
+            assert not instance.run_storage_compact_encoding_enabled
+            json_run_id = noisy_job.execute_in_process(instance=instance).run_id
+            json_bodies = _raw_run_and_event_bodies(instance, json_run_id)
+            assert json_bodies and not any(is_compact_encoded(body) for body in json_bodies)
+
+        with instance_for_test(
+            temp_dir=temp_dir,
+            overrides={"compact_encoding": {"event_log_storage": True, "run_storage": True}},
+        ) as instance:
+            assert instance.event_log_compact_encoding_enabled
+            assert instance.run_storage_compact_encoding_enabled
+            compact_run_id = noisy_job.execute_in_process(instance=instance).run_id
+            compact_bodies = _raw_run_and_event_bodies(instance, compact_run_id)
+            assert compact_bodies and all(is_compact_encoded(body) for body in compact_bodies)
+
+            # rows written with either encoding are readable
+            for run_id in [json_run_id, compact_run_id]:
+                run = instance.get_run_by_id(run_id)
+                assert run and run.is_success
+                assert "hello" in [event.user_message for event in instance.all_logs(run_id)]
+
+
 def test_dagster_home_not_set():
     with environ({"DAGSTER_HOME": ""}):
         with pytest.raises(
@@ -0,0 +1,84 @@
+from unittest import mock
+
+from dagster import (
+    AssetKey,
+    DagsterInstance,
+    StaticPartitionsDefinition,
+    asset,
+    materialize,
+)
+from dagster._core.definitions.asset_graph import AssetGraph
+from dagster._core.definitions.events import AssetKeyPartitionKey
+from dagster._utils.caching_instance_queryer import CachingInstanceQueryer, SharedQueryerCache
+
+partitions_def = StaticPartitionsDefinition(["a", "b", "c"])
+
+
+@asset(partitions_def=partitions_def)
+def partitioned_asset() -> None:
+    ...
+
+
+@asset
+def unpartitioned_asset() -> None:
+    ...
+
+
+def test_shared_queryer_cache():
+    asset_graph = AssetGraph.from_assets([partitioned_asset, unpartitioned_asset])
+    partitioned_key = AssetKey("partitioned_asset")
+    unpartitioned_key = AssetKey("unpartitioned_asset")
+
+    with DagsterInstance.ephemeral() as instance:
+        materialize([partitioned_asset], instance=instance, partition_key="a")
+        materialize([unpartitioned_asset], instance=instance)
+
+        shared_cache = SharedQueryerCache()
+        queryer = CachingInstanceQueryer(instance, asset_graph, shared_cache=shared_cache)
+        queryer.prefetch_asset_records([partitioned_key, unpartitioned_key])
+        assert queryer.get_materialized_partitions(partitioned_key) == {"a"}
+        first_storage_id = queryer.get_latest_materialization_or_observation_storage_id(
+            AssetKeyPartitionKey(partitioned_key, "a")
+        )
+        assert first_storage_id is not None
+        assert shared_cache.latest_storage_id == instance.event_log_storage.get_maximum_record_id()
+
+        materialize([partitioned_asset], instance=instance, partition_key="b")
+
+        with mock.patch.object(
+            instance, "get_asset_records", wraps=instance.get_asset_records
+        ) as get_asset_records, mock.patch.object(
+            instance, "get_materialized_partitions", wraps=instance.get_materialized_partitions
+        ) as get_materialized_partitions:
+            queryer = CachingInstanceQueryer(instance, asset_graph, shared_cache=shared_cache)
+
+            # the new materialization is applied to the cached partitions
+            assert queryer.get_materialized_partitions(partitioned_key) == {"a", "b"}
+            assert get_materialized_partitions.call_count == 0
+
+            # records of assets without new events are served from the cache
+            assert queryer.get_asset_record(unpartitioned_key) is not None
+            assert get_asset_records.call_count == 0
+
+            # while those with new events are fetched again
+            record = queryer.get_asset_record(partitioned_key)
+            assert record is not None
+            assert get_asset_records.call_count == 1
+            assert record.asset_entry.last_materialization_record.partition_key == "b"
+
+            assert queryer.get_latest_materialization_or_observation_storage_id(
+                AssetKeyPartitionKey(partitioned_key, "a")
+            ) == first_storage_id
+            assert queryer.get_latest_materialization_or_observation_storage_id(
+                AssetKeyPartitionKey(partitioned_key, "b")
+            ) > first_storage_id  # type: ignore
+
+        # wipes don't store events, so they are only reflected once the cache expires
+        instance.wipe_assets([partitioned_key])
+        queryer = CachingInstanceQueryer(instance, asset_graph, shared_cache=shared_cache)
+        assert queryer.get_materialized_partitions(partitioned_key) == {"a", "b"}
+
+        queryer = CachingInstanceQueryer(
+            instance, asset_graph, shared_cache=SharedQueryerCache(max_age_seconds=0)
+        )
+        assert queryer.get_materialized_partitions(partitioned_key) == set()
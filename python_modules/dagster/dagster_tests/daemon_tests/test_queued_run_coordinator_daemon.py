@@ -1,6 +1,7 @@
 import time
 from contextlib import contextmanager
 from typing import Iterator
+from unittest import mock
 
 import pytest
 from dagster._core.events import DagsterEvent, DagsterEventType
@@ -834,3 +835,36 @@ def test_key_limit_with_extra_tags(use_threads, workspace_context, daemon, job_h
 
         list(daemon.run_iteration(bounded_ctx))
         assert get_run_ids(instance.run_launcher.queue()) == ["run-1"]
+
+
+def test_tag_limits_across_iterations(workspace_context, daemon, job_handle):
+    with instance_for_queued_run_coordinator(
+        max_concurrent_runs=10,
+        tag_concurrency_limits=[{"key": "database", "value": "tiny", "limit": 1}],
+    ) as instance:
+        bounded_ctx = workspace_context.copy_for_test_instance(instance)
+
+        create_queued_run(instance, job_handle, run_id="tiny-1", tags={"database": "tiny"})
+        create_queued_run(instance, job_handle, run_id="tiny-2", tags={"database": "tiny"})
+
+        list(daemon.run_iteration(bounded_ctx))
+        assert get_run_ids(instance.run_launcher.queue()) == ["tiny-1"]
+
+        # tiny-1 is now in progress, so its entry is fetched and blocks tiny-2
+        list(daemon.run_iteration(bounded_ctx))
+        assert get_run_ids(instance.run_launcher.queue()) == ["tiny-1"]
+
+        with mock.patch.object(
+            instance, "get_run_queue_entries", wraps=instance.get_run_queue_entries
+        ) as get_run_queue_entries:
+            list(daemon.run_iteration(bounded_ctx))
+            assert get_run_ids(instance.run_launcher.queue()) == ["tiny-1"]
+
+            # the entry for the in-progress run is reused, only the queued runs are fetched
+            assert get_run_queue_entries.call_count == 1
+            assert get_run_queue_entries.call_args[0][0].statuses == [DagsterRunStatus.QUEUED]
+
+        instance.report_run_failed(instance.get_run_by_id("tiny-1"))
+
+        list(daemon.run_iteration(bounded_ctx))
+        assert get_run_ids(instance.run_launcher.queue()) == ["tiny-1", "tiny-2"]
@@ -263,6 +263,7 @@ def do_sensor_scenario(
         scenario_name=None,
         with_external_asset_graph=False,
         respect_materialization_data_versions=False,
+        evaluation_executor=None,
     ):
         if (
             self.requires_respect_materialization_data_versions
@@ -422,6 +423,7 @@ def test_time_fn():
                 auto_observe=True,
                 respect_materialization_data_versions=respect_materialization_data_versions,
                 logger=logging.getLogger("dagster.amp"),
+                evaluation_executor=evaluation_executor,
             ).evaluate()
 
         for run_request in run_requests:
@@ -1,13 +1,21 @@
+import itertools
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Sequence
 
 import pytest
 from dagster import (
+    AssetKey,
     AssetMaterialization,
     AssetSelection,
+    AutoMaterializePolicy,
     DagsterInstance,
+    RunRequest,
     job,
     op,
 )
+from dagster._core.definitions.asset_daemon_context import AssetDaemonContext
+from dagster._core.definitions.asset_daemon_cursor import AssetDaemonCursor
 from dagster._core.definitions.asset_graph import AssetGraph
 from dagster._core.definitions.auto_materialize_rule import (
     AutoMaterializeAssetEvaluation,
@@ -43,7 +51,29 @@ def test_reconciliation(scenario, respect_materialization_data_versions):
     run_requests, _, evaluations = scenario.do_sensor_scenario(
         instance, respect_materialization_data_versions=respect_materialization_data_versions
     )
+    _assert_scenario_results(scenario, instance, run_requests, evaluations)
 
+
+@pytest.mark.parametrize(
+    "scenario",
+    list(ASSET_RECONCILIATION_SCENARIOS.values()),
+    ids=list(ASSET_RECONCILIATION_SCENARIOS.keys()),
+)
+def test_reconciliation_in_parallel(scenario):
+    instance = DagsterInstance.ephemeral()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        run_requests, _, evaluations = scenario.do_sensor_scenario(
+            instance, evaluation_executor=executor
+        )
+    _assert_scenario_results(scenario, instance, run_requests, evaluations)
+
+
+def _assert_scenario_results(
+    scenario: AssetReconciliationScenario,
+    instance: DagsterInstance,
+    run_requests: Sequence[RunRequest],
+    evaluations: Sequence[AutoMaterializeAssetEvaluation],
+) -> None:
     def _sorted_evaluations(
         evaluations: Sequence[AutoMaterializeAssetEvaluation],
     ) -> Sequence[AutoMaterializeAssetEvaluation]:
@@ -59,7 +89,9 @@ def _sorted_evaluations(
                         sorted(evaluation.rule_snapshots, key=repr)
                         if evaluation.rule_snapshots
                         else None
-                    )
+                    ),
+                    # timings vary from run to run
+                    timing=None,
                 )
                 for evaluation in evaluations
             ],
@@ -139,3 +171,59 @@ def materialization_job():
     )
     run_requests, _, _ = scenario.do_sensor_scenario(instance)
     assert len(run_requests) == 0
+
+
+def test_evaluation_shards_and_timing():
+    assets = [
+        asset_def("a", auto_materialize_policy=AutoMaterializePolicy.eager()),
+        asset_def("b", ["a"], auto_materialize_policy=AutoMaterializePolicy.eager()),
+        asset_def("c", ["b", "d"], auto_materialize_policy=AutoMaterializePolicy.eager()),
+        asset_def("d", auto_materialize_policy=AutoMaterializePolicy.eager()),
+        asset_def("e", auto_materialize_policy=AutoMaterializePolicy.eager()),
+        asset_def("f", ["e"], auto_materialize_policy=AutoMaterializePolicy.eager()),
+    ]
+    asset_graph = AssetGraph.from_assets(assets)
+    instance = DagsterInstance.ephemeral()
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        context = AssetDaemonContext(
+            asset_graph=asset_graph,
+            target_asset_keys=None,
+            instance=instance,
+            materialize_run_tags={},
+            observe_run_tags={},
+            cursor=AssetDaemonCursor.empty(),
+            auto_observe=False,
+            respect_materialization_data_versions=False,
+            logger=logging.getLogger("dagster.amp"),
+            evaluation_executor=executor,
+        )
+        shards = context._get_evaluation_shards()  # noqa: SLF001
+        assert sorted([sorted(key.path[0] for key in shard) for shard in shards]) == [
+            ["a", "b", "c", "d"],
+            ["e", "f"],
+        ]
+        for shard in shards:
+            assert list(shard) == [
+                key for key in itertools.chain(*asset_graph.toposort_asset_keys()) if key in shard
+            ]
+
+        run_requests, cursor, evaluations = context.evaluate()
+
+    assert {key for run_request in run_requests for key in run_request.asset_selection} == {
+        AssetKey(key) for key in "abcdef"
+    }
+    for evaluation in evaluations:
+        assert evaluation.timing is not None
+        assert evaluation.timing.duration_seconds >= 0
+        # every rule on the policy is timed, as well as the max materializations per minute limit
+        timed_rule_snapshots = [
+            rule_snapshot for rule_snapshot, _ in evaluation.timing.rule_duration_seconds
+        ]
+        assert len(timed_rule_snapshots) == len(AutoMaterializePolicy.eager().rules) + 1
+        assert set(timed_rule_snapshots) >= set(AutoMaterializePolicy.eager().rule_snapshots)
+
+    # timings are not stored on the cursor
+    assert all(
+        evaluation.timing is None for evaluation in cursor.latest_evaluation_by_asset_key.values()
+    )
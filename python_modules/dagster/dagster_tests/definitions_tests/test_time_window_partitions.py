@@ -1,6 +1,7 @@
 import random
 from datetime import datetime
 from typing import Optional, Sequence, cast
+from unittest import mock
 
 import pendulum.parser
 import pytest
@@ -17,6 +18,7 @@
     monthly_partitioned_config,
     weekly_partitioned_config,
 )
+import dagster._core.definitions.time_window_partitions as time_window_partitions_module
 from dagster._check import CheckError
 from dagster._core.definitions.time_window_partitions import (
     ScheduleType,
@@ -920,6 +922,87 @@ def test_partition_subset_with_partition_keys(initial: str, added: str):
     assert len(updated_subset) == updated_subset_str.count("+")
 
 
+@pytest.mark.parametrize(
+    "first, second",
+    [
+        ("-", "+"),
+        ("+", "+"),
+        ("+-", "-+"),
+        ("++", "-+"),
+        ("-+-", "+++"),
+        ("+-+-+", "-+-+-"),
+        ("++--++", "-++++-"),
+        ("--+++---+++--", "++---+++---++"),
+        ("+++++++++++++", "-+--+++-+---+"),
+    ],
+)
+@pytest.mark.parametrize("first_as_keys", [True, False])
+@pytest.mark.parametrize("second_as_keys", [True, False])
+def test_partition_subset_set_operations(
+    first: str, second: str, first_as_keys: bool, second_as_keys: bool
+):
+    partitions_def = DailyPartitionsDefinition(start_date="2015-01-01")
+    full_set_keys = partitions_def.get_partition_keys(
+        current_time=datetime(year=2015, month=1, day=30)
+    )[: len(first)]
+
+    def _subset(case_str: str, as_keys: bool) -> TimeWindowPartitionsSubset:
+        subset = partitions_def.empty_subset().with_partition_keys(
+            [key for key, c in zip(full_set_keys, case_str) if c == "+"]
+        )
+        if not as_keys:
+            # round trip through serialization to represent the subset as time windows
+            subset = partitions_def.deserialize_subset(subset.serialize())
+        return cast(TimeWindowPartitionsSubset, subset)
+
+    first_subset = _subset(first, first_as_keys)
+    second_subset = _subset(second, second_as_keys)
+    first_keys = set(first_subset.get_partition_keys())
+    second_keys = set(second_subset.get_partition_keys())
+
+    for result, expected_keys in [
+        (first_subset | second_subset, first_keys | second_keys),
+        (first_subset & second_subset, first_keys & second_keys),
+        (first_subset - second_subset, first_keys - second_keys),
+    ]:
+        result = cast(TimeWindowPartitionsSubset, result)
+        assert set(result.get_partition_keys()) == expected_keys
+        assert len(result) == len(expected_keys)
+        for key in full_set_keys:
+            assert (key in result) == (key in expected_keys)
+
+        expected_str = "".join("+" if key in expected_keys else "-" for key in full_set_keys)
+        expected_range_count = expected_str.count("-+") + (1 if expected_str[0] == "+" else 0)
+        assert len(result.included_time_windows) == expected_range_count
+
+
+def test_partition_subset_with_partition_key_range():
+    partitions_def = HourlyPartitionsDefinition(start_date="2015-01-01-00:00")
+    subset = partitions_def.empty_subset().with_partition_keys(["2015-01-01-05:00"])
+    subset = subset.with_partition_key_range(
+        PartitionKeyRange("2015-01-01-03:00", "2015-01-01-04:00")
+    ).with_partition_key_range(PartitionKeyRange("2015-01-01-10:00", "2015-01-02-09:00"))
+
+    assert subset.get_partition_keys() == [
+        "2015-01-01-03:00",
+        "2015-01-01-04:00",
+        "2015-01-01-05:00",
+        *partitions_def.get_partition_keys_in_range(
+            PartitionKeyRange("2015-01-01-10:00", "2015-01-02-09:00")
+        ),
+    ]
+    assert len(subset) == 27
+    assert len(cast(TimeWindowPartitionsSubset, subset).included_time_windows) == 2
+
+    all_partitions = partitions_def.subset_with_all_partitions(
+        current_time=datetime(year=2015, month=1, day=3)
+    )
+    assert len(all_partitions) == 48
+    assert all_partitions.get_partition_keys() == partitions_def.get_partition_keys(
+        current_time=datetime(year=2015, month=1, day=3)
+    )
+
+
 def test_weekly_time_window_partitions_subset():
     weekly_partitions_def = WeeklyPartitionsDefinition(start_date="2022-01-01")
 
@@ -1268,3 +1351,59 @@ def test_partition_with_end_date(
     assert partitions_def.has_partition_key(first_partition_window[0])
     assert partitions_def.has_partition_key(last_partition_window[0])
     assert not partitions_def.has_partition_key(last_partition_window[1])
+
+
+def _partitions_def_results(partitions_def: TimeWindowPartitionsDefinition, current_time: datetime):
+    partition_keys = partitions_def.get_partition_keys(current_time=current_time)
+    timestamp = current_time.timestamp()
+    return [
+        partition_keys,
+        partitions_def.get_num_partitions(current_time=current_time),
+        partitions_def.get_last_partition_window(current_time=current_time),
+        [
+            partitions_def.get_partition_key_for_timestamp(timestamp + delta, end_closed)
+            for delta in (-1, 0, 1)
+            for end_closed in (False, True)
+        ],
+        [partitions_def.time_window_for_partition_key(key) for key in partition_keys[:5]],
+        partitions_def.get_partition_keys_in_range(
+            PartitionKeyRange(partition_keys[1], partition_keys[-2])
+        ),
+    ]
+
+
+@pytest.mark.parametrize(
+    "partitions_def",
+    [
+        HourlyPartitionsDefinition(start_date="2021-05-05-01:00", minute_offset=15, end_offset=2),
+        DailyPartitionsDefinition(start_date="2021-05-05", hour_offset=5, end_offset=-1),
+        WeeklyPartitionsDefinition(start_date="2021-05-05", day_offset=2, timezone="Etc/GMT+5"),
+        MonthlyPartitionsDefinition(start_date="2021-05-05", day_offset=3, end_date="2023-01-01"),
+        TimeWindowPartitionsDefinition(
+            start="2021-05-05-00:07+0900",
+            end="2021-05-09-00:00+0900",
+            cron_schedule="*/15 * * * *",
+            fmt="%Y-%m-%d-%H:%M%z",
+            timezone="Etc/GMT-9",
+        ),
+    ],
+)
+def test_regular_schedule_matches_cron_iteration(partitions_def):
+    current_time = create_pendulum_time(2023, 2, 27, 13, 17, 0, tz="UTC")
+    closed_form_results = _partitions_def_results(partitions_def, current_time)
+
+    # clear cached results, so that they're recomputed by iterating over the schedule
+    for cached_method in [
+        TimeWindowPartitionsDefinition._time_window_for_partition_key,  # noqa: SLF001
+        TimeWindowPartitionsDefinition._get_first_partition_window,  # noqa: SLF001
+        TimeWindowPartitionsDefinition._get_last_partition_window,  # noqa: SLF001
+        TimeWindowPartitionsDefinition.get_partition_keys_in_time_window,
+    ]:
+        cached_method.cache_clear()
+
+    with mock.patch.object(
+        time_window_partitions_module, "get_regular_cron_schedule", return_value=None
+    ):
+        iteration_results = _partitions_def_results(partitions_def, current_time)
+
+    assert closed_form_results == iteration_results
@@ -6,6 +6,7 @@
 
 import pytest
 from dagster._check import ParameterCheckError, inst_param, set_param
+from dagster._serdes.compact import compact_decode, compact_encode, is_compact_encoded
 from dagster._serdes.errors import DeserializationError, SerdesUsageError, SerializationError
 from dagster._serdes.serdes import (
     EnumSerializer,
@@ -485,6 +486,64 @@ class Foo(NamedTuple):
     assert deserialized == val
 
 
+def test_named_tuple_compiled_fields() -> None:
+    test_env = WhitelistMap.create()
+
+    @_whitelist_for_serdes(
+        test_env,
+        storage_field_names={"color": "colour"},
+        skip_when_empty_fields={"tags"},
+        field_serializers={"tags": SetToSequenceFieldSerializer},
+    )
+    class Foo(NamedTuple):
+        color: str
+        size: Optional[int]
+        tags: Optional[AbstractSet[str]]
+
+    # per-field instructions are resolved once per class, so repeated calls must agree
+    for _ in range(2):
+        assert (
+            serialize_value(Foo("red", 1, {"b", "a"}), whitelist_map=test_env)
+            == '{"__class__": "Foo", "colour": "red", "size": 1, "tags": ["a", "b"]}'
+        )
+        assert (
+            serialize_value(Foo("red", None, None), whitelist_map=test_env)
+            == '{"__class__": "Foo", "colour": "red", "size": null}'
+        )
+
+        # keys are accepted under either their storage or loaded name, and unknown keys ignored
+        assert deserialize_value(
+            '{"__class__": "Foo", "colour": "red", "size": 1, "tags": ["a"], "shape": "x"}',
+            whitelist_map=test_env,
+        ) == Foo("red", 1, {"a"})
+        assert deserialize_value(
+            '{"__class__": "Foo", "color": "blue", "size": 2, "tags": null}',
+            whitelist_map=test_env,
+        ) == Foo("blue", 2, None)
+
+
+def test_compact_encoding() -> None:
+    test_env = WhitelistMap.create()
+
+    @_whitelist_for_serdes(test_env)
+    class Foo(NamedTuple):
+        color: str
+        tags: Mapping[str, str]
+
+    foo = Foo("red", {"unicode": "\u2603", "quote": '"'})
+    serialized = serialize_value(foo, whitelist_map=test_env)
+    encoded = compact_encode(serialized)
+
+    assert is_compact_encoded(encoded)
+    assert not is_compact_encoded(serialized)
+    assert encoded.isascii()
+    assert compact_decode(encoded) == serialized
+
+    # compact and plain JSON values are both readable
+    assert deserialize_value(encoded, Foo, whitelist_map=test_env) == foo
+    assert deserialize_value(serialized, Foo, whitelist_map=test_env) == foo
+
+
 def test_named_tuple_old_fields() -> None:
     test_env = WhitelistMap.create()
 
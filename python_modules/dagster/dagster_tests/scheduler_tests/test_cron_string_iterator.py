@@ -2,7 +2,7 @@
 
 import pytest
 from dagster._seven.compat.pendulum import create_pendulum_time, to_timezone
-from dagster._utils.schedules import cron_string_iterator
+from dagster._utils.schedules import cron_string_iterator, get_regular_cron_schedule
 
 
 def test_cron_iterator_always_advances():
@@ -123,3 +123,51 @@ def test_dst_spring_forward_transition_advances(execution_timezone, cron_string,
                 ), f"Expected {times[i]} to advance to {times[j]}, got {next_time}"
 
             start_timestamp = start_timestamp + 75
+
+
+@pytest.mark.parametrize(
+    "cron_string,execution_timezone",
+    [
+        ("* * * * *", "UTC"),
+        ("*/15 * * * *", "UTC"),
+        ("7 * * * *", "Etc/GMT+5"),
+        ("0 */6 * * *", "UTC"),
+        ("30 5 * * *", "Etc/GMT-9"),
+        ("15 3 * * 0", "UTC"),
+        ("0 0 * * 7", "Etc/GMT+3"),
+        ("0 0 1 * *", "UTC"),
+        ("30 2 28 * *", "Etc/GMT-2"),
+    ],
+)
+def test_regular_cron_schedule(cron_string, execution_timezone):
+    regular_schedule = get_regular_cron_schedule(cron_string, execution_timezone)
+    assert regular_schedule is not None
+
+    start_timestamp = create_pendulum_time(2023, 2, 27, 13, 17, 0, tz="UTC").timestamp()
+    first_index = regular_schedule.get_index_at_or_after(start_timestamp)
+
+    cron_iter = cron_string_iterator(start_timestamp, cron_string, execution_timezone)
+    for tick_index in range(first_index, first_index + 50):
+        next_timestamp = next(cron_iter).timestamp()
+        assert regular_schedule.get_timestamp(tick_index) == next_timestamp
+        assert regular_schedule.get_index_at_or_after(next_timestamp) == tick_index
+        assert regular_schedule.get_index_at_or_before(next_timestamp) == tick_index
+        assert regular_schedule.get_index_at_or_after(next_timestamp - 1) == tick_index
+        assert regular_schedule.get_index_at_or_before(next_timestamp + 1) == tick_index
+
+
+@pytest.mark.parametrize(
+    "cron_string,execution_timezone",
+    [
+        # daylight savings time transitions
+        ("0 0 * * *", "America/Los_Angeles"),
+        # not evenly spaced
+        ("*/7 * * * *", "UTC"),
+        ("0 9-17 * * *", "UTC"),
+        ("0 0 * * 1-5", "UTC"),
+        ("0 0 31 * *", "UTC"),
+        ("0 0 1 1 *", "UTC"),
+    ],
+)
+def test_irregular_cron_schedule(cron_string, execution_timezone):
+    assert get_regular_cron_schedule(cron_string, execution_timezone) is None
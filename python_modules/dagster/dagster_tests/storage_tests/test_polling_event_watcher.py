@@ -6,7 +6,12 @@
 import dagster._check as check
 from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
 from dagster._core.events.log import EventLogEntry
-from dagster._core.storage.event_log import SqliteEventLogStorage, SqlPollingEventWatcher
+from dagster._core.storage.event_log import (
+    ConsolidatedSqliteEventLogStorage,
+    SqliteEventLogStorage,
+    SqlMultiplexedPollingEventWatcher,
+    SqlPollingEventWatcher,
+)
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._serdes.config_class import ConfigurableClassData
 from typing_extensions import Self
@@ -138,3 +143,70 @@ def watch_two(event, _cursor):
 
     # calling end_watch after dispose does not error
     storage.end_watch(RUN_ID, watch_two)
+
+
+def test_multiplexed_watcher():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = ConsolidatedSqliteEventLogStorage(tmpdir_path)
+        watcher = SqlMultiplexedPollingEventWatcher(storage)
+
+        watched_foo = []
+        watched_bar = []
+        watched_late = []
+
+        def watch_foo(event, _cursor):
+            watched_foo.append(event)
+
+        def watch_bar(event, _cursor):
+            watched_bar.append(event)
+
+        def watch_late(event, _cursor):
+            watched_late.append(event)
+
+        def wait_for(condition):
+            attempts = 20
+            while not condition() and attempts > 0:
+                time.sleep(0.1)
+                attempts -= 1
+
+        storage.store_event(create_event(1, run_id="foo"))
+        foo_cursor = str(
+            EventLogCursor.from_storage_id(storage.get_records_for_run("foo").records[-1].storage_id)
+        )
+
+        watcher.watch_run("foo", foo_cursor, watch_foo)
+        watcher.watch_run("bar", None, watch_bar)
+        assert watcher.has_run_id("foo")
+        assert watcher.has_run_id("bar")
+
+        storage.store_event(create_event(2, run_id="foo"))
+        storage.store_event(create_event(3, run_id="bar"))
+        storage.store_event(create_event(4, run_id="foo"))
+
+        wait_for(lambda: len(watched_foo) >= 2 and len(watched_bar) >= 1)
+        assert [int(evt.message) for evt in watched_foo] == [2, 4]
+        assert [int(evt.message) for evt in watched_bar] == [3]
+
+        # a callback registered later is called with all events after its own cursor
+        watcher.watch_run("foo", foo_cursor, watch_late)
+        wait_for(lambda: len(watched_late) >= 2)
+        assert [int(evt.message) for evt in watched_late] == [2, 4]
+
+        watcher.unwatch_run("foo", watch_foo)
+        watcher.unwatch_run("bar", watch_bar)
+        assert not watcher.has_run_id("bar")
+
+        storage.store_event(create_event(5, run_id="foo"))
+        storage.store_event(create_event(6, run_id="bar"))
+        wait_for(lambda: len(watched_late) >= 3)
+        time.sleep(0.3)
+
+        assert [int(evt.message) for evt in watched_foo] == [2, 4]
+        assert [int(evt.message) for evt in watched_bar] == [3]
+        assert [int(evt.message) for evt in watched_late] == [2, 4, 5]
+
+        watcher.close()
+        storage.dispose()
+
+        # calling unwatch_run after close does not error
+        watcher.unwatch_run("foo", watch_late)
@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 import logging  # noqa: F401; used by mock in string form
 import re
@@ -1035,6 +1036,190 @@ def _ops():
             assert record.event_log_entry.dagster_event.asset_key == asset_key
             assert result.cursor == EventLogCursor.from_storage_id(record.storage_id).to_string()
 
+    def test_async_reads(self, storage, test_run_id):
+        asset_key = AssetKey(["path", "to", "async_asset"])
+
+        @op
+        def materialize_one(_):
+            yield AssetMaterialization(asset_key=asset_key)
+            yield Output(1)
+
+        def _ops():
+            materialize_one()
+
+        with instance_for_test() as created_instance:
+            if not storage.has_instance:
+                storage.register_instance(created_instance)
+
+            events, _ = _synthesize_events(_ops, instance=created_instance, run_id=test_run_id)
+            for event in events:
+                storage.store_event(event)
+
+            async def _read():
+                # the async variants can be awaited concurrently
+                return await asyncio.gather(
+                    storage.get_records_for_run_async(test_run_id),
+                    storage.fetch_materializations_async(asset_key, limit=100),
+                    storage.get_asset_records_async([asset_key]),
+                )
+
+            connection, result, asset_records = asyncio.run(_read())
+
+            assert connection == storage.get_records_for_run(test_run_id)
+            assert result == storage.fetch_materializations(asset_key, limit=100)
+            assert len(result.records) == 1
+            assert [record.asset_entry.asset_key for record in asset_records] == [asset_key]
+
+    def test_store_events_batch(self, storage, test_run_id):
+        asset_key = AssetKey(["path", "to", "batched_asset"])
+
+        @op
+        def materialize_twice(_):
+            yield AssetMaterialization(asset_key=asset_key, tags={"dagster/attempt": "one"})
+            yield AssetObservation(asset_key=asset_key)
+            yield AssetMaterialization(asset_key=asset_key, tags={"dagster/attempt": "two"})
+            yield Output(1)
+
+        def _ops():
+            materialize_twice()
+
+        with instance_for_test() as created_instance:
+            if not storage.has_instance:
+                storage.register_instance(created_instance)
+
+            events, _ = _synthesize_events(_ops, instance=created_instance, run_id=test_run_id)
+            storage.store_events(events)
+
+            logs = storage.get_logs_for_run(test_run_id)
+            assert len(logs) == len(events)
+            assert [log.dagster_event_type for log in logs] == [
+                event.dagster_event_type for event in events
+            ]
+
+            result = storage.fetch_materializations(asset_key, limit=100, ascending=True)
+            assert len(result.records) == 2
+            assert result.records[0].storage_id < result.records[1].storage_id
+
+            asset_records = list(storage.get_asset_records([asset_key]))
+            assert len(asset_records) == 1
+            asset_entry = asset_records[0].asset_entry
+            assert asset_entry.last_materialization_record.storage_id == (
+                result.records[1].storage_id
+            )
+            assert asset_entry.last_run_id == test_run_id
+
+            if storage.supports_add_asset_event_tags():
+                tags_by_event = storage.get_event_tags_for_asset(asset_key)
+                assert sorted(tags["dagster/attempt"] for tags in tags_by_event) == ["one", "two"]
+
+    def test_store_events_batch_interleaved_runs(self, storage):
+        run_id_1, run_id_2 = make_new_run_id(), make_new_run_id()
+        asset_key = AssetKey(["interleaved_asset"])
+
+        def _materialization(run_id: str) -> EventLogEntry:
+            return EventLogEntry(
+                error_info=None,
+                user_message="",
+                level="debug",
+                run_id=run_id,
+                timestamp=time.time(),
+                dagster_event=DagsterEvent(
+                    DagsterEventType.ASSET_MATERIALIZATION.value,
+                    "nonce",
+                    event_specific_data=StepMaterializationData(
+                        AssetMaterialization(asset_key=asset_key)
+                    ),
+                ),
+            )
+
+        def _log(run_id: str, message: str) -> EventLogEntry:
+            return EventLogEntry(
+                error_info=None,
+                user_message=message,
+                level="debug",
+                run_id=run_id,
+                timestamp=time.time(),
+            )
+
+        storage.store_events(
+            [
+                _log(run_id_1, "a"),
+                _log(run_id_2, "b"),
+                _log(run_id_1, "c"),
+                _materialization(run_id_1),
+                _log(run_id_2, "d"),
+                _materialization(run_id_2),
+                _log(run_id_1, "e"),
+            ]
+        )
+
+        assert [log.user_message for log in storage.get_logs_for_run(run_id_1)] == [
+            "a",
+            "c",
+            "",
+            "e",
+        ]
+        assert [log.user_message for log in storage.get_logs_for_run(run_id_2)] == [
+            "b",
+            "d",
+            "",
+        ]
+
+        result = storage.fetch_materializations(asset_key, limit=100, ascending=True)
+        assert [record.run_id for record in result.records] == [run_id_1, run_id_2]
+        asset_records = list(storage.get_asset_records([asset_key]))
+        assert asset_records[0].asset_entry.last_run_id == run_id_2
+
+    def test_store_events_batch_asset_checks(self, storage):
+        if self.can_wipe():
+            storage.wipe()
+
+        run_id = make_new_run_id()
+        check_key = AssetCheckKey(AssetKey(["batched_check_asset"]), "batched_check")
+
+        storage.store_events(
+            [
+                EventLogEntry(
+                    error_info=None,
+                    user_message="",
+                    level="debug",
+                    run_id=run_id,
+                    timestamp=time.time(),
+                    dagster_event=DagsterEvent(
+                        DagsterEventType.ASSET_CHECK_EVALUATION_PLANNED.value,
+                        "nonce",
+                        event_specific_data=AssetCheckEvaluationPlanned(
+                            asset_key=check_key.asset_key, check_name=check_key.name
+                        ),
+                    ),
+                ),
+                EventLogEntry(
+                    error_info=None,
+                    user_message="",
+                    level="debug",
+                    run_id=run_id,
+                    timestamp=time.time(),
+                    dagster_event=DagsterEvent(
+                        DagsterEventType.ASSET_CHECK_EVALUATION.value,
+                        "nonce",
+                        event_specific_data=AssetCheckEvaluation(
+                            asset_key=check_key.asset_key,
+                            check_name=check_key.name,
+                            passed=False,
+                            metadata={},
+                            severity=AssetCheckSeverity.ERROR,
+                        ),
+                    ),
+                ),
+            ]
+        )
+
+        checks = storage.get_asset_check_execution_history(check_key, limit=10)
+        assert len(checks) == 1
+        assert checks[0].run_id == run_id
+        assert checks[0].status == AssetCheckExecutionRecordStatus.FAILED
+        assert checks[0].event.dagster_event_type == DagsterEventType.ASSET_CHECK_EVALUATION
+
     def test_asset_materialization_null_key_fails(self):
         with pytest.raises(check.CheckError):
             AssetMaterialization(asset_key=None)
@@ -1,3 +1,4 @@
+import asyncio
 import sys
 import tempfile
 import time
@@ -38,6 +39,7 @@
     PARENT_RUN_ID_TAG,
     PARTITION_NAME_TAG,
     PARTITION_SET_TAG,
+    PRIORITY_TAG,
     REPOSITORY_LABEL_TAG,
     ROOT_RUN_ID_TAG,
 )
@@ -58,6 +60,12 @@ def _get_run_by_id(storage, run_id):
     return records[0].dagster_run
 
 
+def _get_run_record(storage, run_id):
+    records = storage.get_run_records(RunsFilter(run_ids=[run_id]))
+    assert len(records) == 1
+    return records[0]
+
+
 class TestRunStorage:
     """You can extend this class to easily run these set of tests on any run storage. When extending,
     you simply need to override the `run_storage` fixture and return your implementation of
@@ -148,6 +156,22 @@ def test_basic_storage(self, storage):
         assert fetched_run.run_id == run_id
         assert fetched_run.job_name == "some_pipeline"
 
+    def test_get_run_records_async(self, storage):
+        assert storage
+        run_ids = [make_new_run_id() for _ in range(3)]
+        for run_id in run_ids:
+            storage.add_run(TestRunStorage.build_run(run_id=run_id, job_name="some_pipeline"))
+
+        async def _read():
+            return await asyncio.gather(
+                storage.get_run_records_async(),
+                storage.get_run_records_async(RunsFilter(run_ids=[run_ids[0]])),
+            )
+
+        all_records, filtered_records = asyncio.run(_read())
+        assert [record.dagster_run.run_id for record in all_records] == list(reversed(run_ids))
+        assert [record.dagster_run.run_id for record in filtered_records] == [run_ids[0]]
+
     def test_clear(self, storage):
         if not self.can_delete_runs():
             pytest.skip("storage cannot delete")
@@ -202,6 +226,47 @@ def test_fetch_by_repo(self, storage):
         )
         assert len(two_runs) == 1
 
+    def test_get_run_queue_entries(self, storage):
+        assert storage
+        job_name = "some_job"
+        origin = self.fake_job_origin(job_name)
+
+        low, default, high, also_default, invalid, started = [make_new_run_id() for _ in range(6)]
+        for run_id, tags, status in [
+            (low, {PRIORITY_TAG: "-1"}, DagsterRunStatus.QUEUED),
+            (default, {"foo": "bar"}, DagsterRunStatus.QUEUED),
+            (high, {PRIORITY_TAG: "5", "foo": "baz"}, DagsterRunStatus.QUEUED),
+            (also_default, None, DagsterRunStatus.QUEUED),
+            (invalid, {PRIORITY_TAG: "not_a_number"}, DagsterRunStatus.QUEUED),
+            (started, {PRIORITY_TAG: "10"}, DagsterRunStatus.STARTED),
+        ]:
+            storage.add_run(
+                TestRunStorage.build_run(
+                    run_id=run_id,
+                    job_name=job_name,
+                    tags=tags,
+                    status=status,
+                    external_job_origin=origin,
+                )
+            )
+
+        entries = storage.get_run_queue_entries(RunsFilter(statuses=[DagsterRunStatus.QUEUED]))
+        # by descending priority, then in submission order
+        assert [entry.run_id for entry in entries] == [high, default, also_default, invalid, low]
+        assert [entry.priority for entry in entries] == [5, 0, 0, 0, -1]
+
+        high_entry = entries[0]
+        assert high_entry.tags == {PRIORITY_TAG: "5", "foo": "baz"}
+        assert high_entry.location_name == origin.location_name
+        assert high_entry.create_timestamp == _get_run_record(storage, high).create_timestamp
+
+        entries = storage.get_run_queue_entries(
+            RunsFilter(run_ids=[started, low], statuses=[DagsterRunStatus.STARTED])
+        )
+        assert [entry.run_id for entry in entries] == [started]
+
+        assert storage.get_run_queue_entries(RunsFilter(statuses=[DagsterRunStatus.FAILURE])) == []
+
     def test_fetch_by_snapshot_id(self, storage):
         assert storage
         job_def_a = GraphDefinition(name="some_pipeline", node_defs=[]).to_job()
@@ -1,4 +1,5 @@
-from typing import ContextManager, Optional, cast
+from collections import defaultdict
+from typing import Any, ContextManager, Mapping, Optional, cast
 
 import dagster._check as check
 import sqlalchemy as db
@@ -175,6 +176,26 @@ def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
                 except db_exc.IntegrityError:
                     pass
 
+    def _store_asset_entries(self, values_by_asset_key: Mapping[str, Mapping[str, Any]]) -> None:
+        # group by the set of columns being written, so that each group can be upserted with a
+        # single multi-row INSERT ... ON DUPLICATE KEY UPDATE statement
+        rows_by_columns = defaultdict(list)
+        for asset_key_str, values in values_by_asset_key.items():
+            rows_by_columns[tuple(sorted(values.keys()))].append(
+                dict(asset_key=asset_key_str, **values)
+            )
+
+        with self.index_connection() as conn:
+            for columns, rows in rows_by_columns.items():
+                query = db_dialects.mysql.insert(AssetKeyTable).values(rows)
+                if columns:
+                    query = query.on_duplicate_key_update(
+                        {column: query.inserted[column] for column in columns}
+                    )
+                else:
+                    query = query.prefix_with("IGNORE")
+                conn.execute(query)
+
     def _connect(self) -> ContextManager[Connection]:
         return create_mysql_connection(self._engine, __file__, "event log")
 
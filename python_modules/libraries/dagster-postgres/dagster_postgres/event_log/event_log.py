@@ -1,9 +1,11 @@
-from typing import Any, ContextManager, Mapping, Optional, Sequence
+from collections import defaultdict
+from typing import Any, ContextManager, Mapping, Optional, Sequence, Union
 
 import dagster._check as check
 import sqlalchemy as db
 import sqlalchemy.dialects as db_dialects
 import sqlalchemy.pool as db_pool
+from dagster import Field
 from dagster._config.config_schema import UserConfigSchema
 from dagster._core.errors import DagsterInvariantViolationError
 from dagster._core.event_api import EventHandlerFn
@@ -19,7 +21,10 @@
 )
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.storage.event_log.migration import ASSET_KEY_INDEX_COLS
-from dagster._core.storage.event_log.polling_event_watcher import SqlPollingEventWatcher
+from dagster._core.storage.event_log.polling_event_watcher import (
+    SqlMultiplexedPollingEventWatcher,
+    SqlPollingEventWatcher,
+)
 from dagster._core.storage.sql import (
     AlembicVersion,
     check_alembic_revision,
@@ -70,6 +75,10 @@ class PostgresEventLogStorage(SqlEventLogStorage, ConfigurableClass):
     Note that the fields in this config are :py:class:`~dagster.StringSource` and
     :py:class:`~dagster.IntSource` and can be configured from environment variables.
 
+    Runs are watched for new events (e.g. by open run pages in the Dagster UI) by a single thread
+    that polls for the new events of all watched runs at once. Set ``multiplex_event_watchers`` to
+    ``false`` to instead poll each watched run from its own thread.
+
     """
 
     def __init__(
@@ -77,6 +86,7 @@ def __init__(
         postgres_url: str,
         should_autocreate_tables: bool = True,
         inst_data: Optional[ConfigurableClassData] = None,
+        multiplex_event_watchers: bool = True,
     ):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.postgres_url = check.str_param(postgres_url, "postgres_url")
@@ -91,7 +101,14 @@ def __init__(
             self.postgres_url, isolation_level="AUTOCOMMIT", poolclass=db_pool.NullPool
         )
 
-        self._event_watcher = SqlPollingEventWatcher(self)
+        self.multiplex_event_watchers = check.bool_param(
+            multiplex_event_watchers, "multiplex_event_watchers"
+        )
+        self._event_watcher: Union[SqlMultiplexedPollingEventWatcher, SqlPollingEventWatcher] = (
+            SqlMultiplexedPollingEventWatcher(self)
+            if self.multiplex_event_watchers
+            else SqlPollingEventWatcher(self)
+        )
 
         self._secondary_index_cache = {}
 
@@ -139,7 +156,10 @@ def inst_data(self) -> Optional[ConfigurableClassData]:
 
     @classmethod
     def config_type(cls) -> UserConfigSchema:
-        return pg_config()
+        return {
+            **pg_config(),
+            "multiplex_event_watchers": Field(bool, is_required=False, default_value=True),
+        }
 
     @classmethod
     def from_config_value(
@@ -149,6 +169,7 @@ def from_config_value(
             inst_data=inst_data,
             postgres_url=pg_url_from_config(config_value),
             should_autocreate_tables=config_value.get("should_autocreate_tables", True),
+            multiplex_event_watchers=config_value.get("multiplex_event_watchers", True),
         )
 
     @staticmethod
@@ -206,6 +227,58 @@ def store_event(self, event: EventLogEntry) -> None:
         if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
             self.store_asset_check_event(event, event_id)
 
+    def store_events(self, events: Sequence[EventLogEntry]) -> None:
+        """Store a batch of events.
+
+        The event rows are inserted in a single transaction, which also sends one NOTIFY per run in
+        the batch carrying the storage id of that run's last inserted event. The asset index tables
+        are then bulk-upserted in separate statements, so a failure at that point can leave event
+        rows without their index rows, as with `store_event`.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store, in the order they occurred.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+        with self._connect() as conn:
+            with conn.execution_options(isolation_level="READ COMMITTED").begin():
+                event_ids = self._insert_event_rows(conn, events)
+
+                # LISTEN/NOTIFY no longer used for pg event watch - preserved here to support
+                # version skew
+                for run_id in dict.fromkeys(event.run_id for event in events):
+                    last_event_id = conn.execute(
+                        db_select([db.func.max(SqlEventLogStorageTable.c.id)]).where(
+                            SqlEventLogStorageTable.c.run_id == run_id
+                        )
+                    ).scalar()
+                    conn.execute(
+                        db.text(f"""NOTIFY {CHANNEL_NAME}, :notify_id; """),
+                        {"notify_id": run_id + "_" + str(last_event_id)},
+                    )
+
+        self._store_event_index_data(list(zip(events, event_ids)))
+
+    def _store_asset_entries(self, values_by_asset_key: Mapping[str, Mapping[str, Any]]) -> None:
+        # group by the set of columns being written, so that each group can be upserted with a
+        # single multi-row INSERT ... ON CONFLICT statement
+        rows_by_columns = defaultdict(list)
+        for asset_key_str, values in values_by_asset_key.items():
+            rows_by_columns[tuple(sorted(values.keys()))].append(
+                dict(asset_key=asset_key_str, **values)
+            )
+
+        with self.index_connection() as conn:
+            for columns, rows in rows_by_columns.items():
+                query = db_dialects.postgresql.insert(AssetKeyTable).values(rows)
+                if columns:
+                    query = query.on_conflict_do_update(
+                        index_elements=[AssetKeyTable.c.asset_key],
+                        set_={column: query.excluded[column] for column in columns},
+                    )
+                else:
+                    query = query.on_conflict_do_nothing()
+                conn.execute(query)
+
     def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
         check.inst_param(event, "event", EventLogEntry)
         if not (event.dagster_event and event.dagster_event.asset_key):
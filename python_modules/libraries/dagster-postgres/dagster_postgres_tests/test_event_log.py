@@ -2,6 +2,10 @@
 
 import pytest
 import yaml
+from dagster._core.storage.event_log import (
+    SqlMultiplexedPollingEventWatcher,
+    SqlPollingEventWatcher,
+)
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.test_utils import instance_for_test
 from dagster_postgres.event_log import PostgresEventLogStorage
@@ -109,3 +113,26 @@ def test_load_from_config(self, hostname):
                 from_explicit = explicit_instance._event_storage  # noqa: SLF001
 
                 assert from_url.postgres_url == from_explicit.postgres_url
+
+    def test_load_multiplex_event_watchers_from_config(self, hostname):
+        cfg = f"""
+        event_log_storage:
+            module: dagster_postgres.event_log
+            class: PostgresEventLogStorage
+            config:
+                postgres_url: postgresql://test:test@{hostname}:5432/test
+                multiplex_event_watchers: false
+        """
+
+        with instance_for_test(overrides=yaml.safe_load(cfg)) as instance:
+            storage = instance._event_storage  # noqa: SLF001
+            assert not storage.multiplex_event_watchers
+            assert isinstance(storage._event_watcher, SqlPollingEventWatcher)  # noqa: SLF001
+
+        storage = PostgresEventLogStorage(f"postgresql://test:test@{hostname}:5432/test")
+        try:
+            assert isinstance(
+                storage._event_watcher, SqlMultiplexedPollingEventWatcher  # noqa: SLF001
+            )
+        finally:
+            storage.dispose()